@@ -0,0 +1,281 @@
+"""
+Benchmarks for project generation, settings rewriting and CLI cold start.
+
+PyPI is replaced by a local stand-in and the user cache by a temporary directory, so runs are repeatable offline.
+
+Usage:
+    python benchmarks/bench.py run [--output results.json] [--filter render] [--repeat 20]
+    python benchmarks/bench.py compare benchmarks/baseline.json results.json [--threshold 0.25]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from pypi_stub import PyPIStub
+
+from dj_beat_drop import cache, main_cli, new, render, utils
+
+BENCHMARKS_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCHMARKS_DIR / "baseline.json"
+TEMPLATES_DIR = Path(new.__file__).parent / "templates"
+SYNTHETIC_TREE_SIZES = (100, 1000)
+SYNTHETIC_FILE = (
+    '"""\n{{ project_name }} module generated by Django {{ django_version }}.\n\n'
+    "See https://docs.djangoproject.com/en/{{ docs_version }}/ for more information.\n" + '"""\n\n'
+    "VALUE = '{{ project_name }}'\n" * 40
+)
+
+Benchmark = Callable[[], None]
+BENCHMARKS: dict[str, Callable[[Path], Benchmark]] = {}
+
+
+def benchmark(name: str):
+    """Register a setup function that receives a scratch directory and returns the callable to time."""
+
+    def register(setup: Callable[[Path], Benchmark]):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def get_context(django_version: str) -> dict[str, str]:
+    return {
+        "project_name": "config",
+        "django_version": django_version,
+        "docs_version": ".".join(django_version.split(".")[:2]),
+        "secret_key": utils.get_secret_key(),
+    }
+
+
+def get_rendered_settings(django_version: str) -> str:
+    template_dir = TEMPLATES_DIR / ".".join(django_version.split(".")[:2])
+    settings_template = template_dir / "project_name" / "settings.py-tpl"
+    return render.render_string(settings_template.read_text(), get_context(django_version))
+
+
+@benchmark("get_template_context[pypi]")
+def bench_template_context_fetch(scratch_dir: Path) -> Benchmark:
+    def run():
+        utils.get_django_releases.cache_clear()
+        utils.get_template_context(use_lts=False, refresh=True)
+
+    return run
+
+
+@benchmark("get_template_context[cached]")
+def bench_template_context_cached(scratch_dir: Path) -> Benchmark:
+    utils.get_template_context(use_lts=False, refresh=True)
+
+    def run():
+        utils.get_django_releases.cache_clear()
+        utils.get_template_context(use_lts=False)
+
+    return run
+
+
+def bench_create_new_project(use_lts: bool, initialize_env: bool) -> Callable[[Path], Benchmark]:
+    def setup(scratch_dir: Path) -> Benchmark:
+        counter = iter(range(sys.maxsize))
+
+        def run():
+            with contextlib.redirect_stdout(io.StringIO()):
+                new.create_new_project(
+                    name="bench",
+                    use_lts=use_lts,
+                    project_dir=scratch_dir / f"project_{next(counter)}",
+                    initialize_uv=False,
+                    initialize_env=initialize_env,
+                )
+
+        return run
+
+    return setup
+
+
+for _use_lts, _minor_version in ((True, "4.2"), (False, "5.1")):
+    for _initialize_env in (True, False):
+        benchmark(f"create_new_project[{_minor_version},{'env' if _initialize_env else 'no-env'}]")(
+            bench_create_new_project(_use_lts, _initialize_env)
+        )
+
+
+@benchmark("create_new_project[5.1,10-apps]")
+def bench_create_new_project_with_apps(scratch_dir: Path) -> Benchmark:
+    counter = iter(range(sys.maxsize))
+    app_names = [f"app_{index}" for index in range(10)]
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            new.create_new_project(
+                name="bench",
+                use_lts=False,
+                project_dir=scratch_dir / f"project_{next(counter)}",
+                initialize_uv=False,
+                initialize_env=True,
+                app_names=app_names,
+            )
+
+    return run
+
+
+def bench_settings_engine(django_version: str, all_options: bool) -> Callable[[Path], Benchmark]:
+    """Time every ``settings.py`` transform of a project, which the settings engine applies after a single parse."""
+
+    def setup(scratch_dir: Path) -> Benchmark:
+        content = get_rendered_settings(django_version)
+        template_context = get_context(django_version)
+        if all_options:
+            options = new.get_project_options(
+                initialize_env=True, sqlite_profile="read-heavy", use_perf_preset=True, log_format="json"
+            )
+        else:
+            options = new.get_project_options(initialize_env=False)
+        transform = new.get_project_transforms(template_context, options)["config/settings.py"]
+        return lambda: transform(content)
+
+    return setup
+
+
+for _all_options in (False, True):
+    benchmark(f"settings_engine[5.1,{'all-options' if _all_options else 'defaults'}]")(
+        bench_settings_engine("5.1.3", _all_options)
+    )
+
+
+def create_synthetic_template(template_dir: Path, file_count: int):
+    for index in range(file_count):
+        package_dir = template_dir / "project_name" / f"package_{index // 50}"
+        package_dir.mkdir(parents=True, exist_ok=True)
+        (package_dir / f"module_{index}.py-tpl").write_text(SYNTHETIC_FILE)
+
+
+def bench_synthetic_render(file_count: int, bundled: bool) -> Callable[[Path], Benchmark]:
+    def setup(scratch_dir: Path) -> Benchmark:
+        template_dir = scratch_dir / "template"
+        create_synthetic_template(template_dir, file_count)
+        if bundled is True:
+            render.write_bundle(template_dir)
+        context = get_context("5.1.3")
+        counter = iter(range(sys.maxsize))
+
+        def run():
+            with render.staging_directory(scratch_dir / f"project_{next(counter)}") as staging_dir:
+                render.render_template(template_dir, staging_dir, context)
+
+        return run
+
+    return setup
+
+
+for _file_count in SYNTHETIC_TREE_SIZES:
+    benchmark(f"render_template[synthetic-{_file_count},loose]")(bench_synthetic_render(_file_count, False))
+    benchmark(f"render_template[synthetic-{_file_count},bundled]")(bench_synthetic_render(_file_count, True))
+
+
+def bench_cli(args: list[str]) -> Callable[[Path], Benchmark]:
+    def setup(scratch_dir: Path) -> Benchmark:
+        # A fresh update check result keeps the CLI from calling PyPI.
+        cache.write_entry(main_cli.VERSION_CHECK_CACHE_KEY, {"latest_version": main_cli.get_current_version()})
+        env = {**os.environ, "XDG_CACHE_HOME": str(cache.get_cache_dir().parent)}
+        return lambda: subprocess.run([sys.executable, *args], env=env, check=True, capture_output=True)  # noqa: S603
+
+    return setup
+
+
+benchmark("cli_cold_start[import]")(bench_cli(["-c", "import dj_beat_drop.main_cli"]))
+benchmark("cli_cold_start[--version]")(bench_cli(["-m", "dj_beat_drop.main_cli", "--version"]))
+
+
+def measure(run: Benchmark, repeat: int) -> dict[str, float]:
+    run()  # Warm up imports and caches that aren't part of what's being measured.
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"median_ms": statistics.median(samples), "min_ms": min(samples)}
+
+
+def run_benchmarks(name_filter: str | None, repeat: int) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir, PyPIStub() as pypi_stub:
+        os.environ["XDG_CACHE_HOME"] = str(Path(tmp_dir) / "cache")
+        utils.DJANGO_SIMPLE_INDEX_URL = pypi_stub.simple_index_url
+        for name, setup in BENCHMARKS.items():
+            if name_filter is not None and name_filter not in name:
+                continue
+            scratch_dir = Path(tmp_dir) / "scratch"
+            scratch_dir.mkdir()
+            try:
+                results[name] = measure(setup(scratch_dir), repeat)
+            finally:
+                shutil.rmtree(scratch_dir)
+            print(f"{name:<50} {results[name]['median_ms']:>9.3f}ms  (min {results[name]['min_ms']:.3f}ms)")
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> bool:
+    """Print the change of every benchmark's median and return whether none regressed by more than ``threshold``."""
+    ok = True
+    print(f"{'Benchmark':<50} {'Baseline':>11} {'Current':>11} {'Change':>8}")
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            print(f"{name:<50} {'':>11} {result['median_ms']:>9.3f}ms {'new':>8}")
+            continue
+        before = baseline["results"][name]["median_ms"]
+        change = (result["median_ms"] - before) / before
+        marker = ""
+        if change > threshold:
+            marker = "  <- slower"
+            ok = False
+        print(f"{name:<50} {before:>9.3f}ms {result['median_ms']:>9.3f}ms {change:>+7.1%}{marker}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks.")
+    run_parser.add_argument("--output", type=Path, help="Write the results to this JSON file.")
+    run_parser.add_argument("--filter", help="Only run benchmarks whose name contains this string.")
+    run_parser.add_argument("--repeat", type=int, default=20, help="Timed runs per benchmark.")
+    compare_parser = subparsers.add_parser("compare", help="Compare two result files.")
+    compare_parser.add_argument("baseline", type=Path, nargs="?", default=DEFAULT_BASELINE)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.25, help="Fail when a median is slower by more than this fraction."
+    )
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = run_benchmarks(args.filter, args.repeat)
+        if args.output is not None:
+            args.output.write_text(json.dumps(results, indent=2) + "\n")
+        return
+
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    if compare(baseline, current, args.threshold) is False:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""A local stand-in for the PyPI simple index, so benchmarks and tests never depend on the network."""
+
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SIMPLE_JSON_CONTENT_TYPE = "application/vnd.pypi.simple.v1+json"
+RELEASES = [
+    *[f"4.2.{patch}" for patch in range(0, 17)],
+    *[f"5.0.{patch}" for patch in range(0, 10)],
+    "5.1a1",
+    "5.1b1",
+    "5.1rc1",
+    *[f"5.1.{patch}" for patch in range(0, 4)],
+]
+
+
+def get_simple_index(releases: list[str], wheels: dict[str, bytes], hashes: dict[str, str]) -> dict:
+    files = []
+    for release in releases:
+        files.append({"filename": f"django-{release}.tar.gz", "yanked": False})
+        files.append({"filename": f"django-{release}-py3-none-any.whl", "yanked": False})
+    for filename, content in wheels.items():
+        files.append(
+            {
+                "filename": filename,
+                "url": f"../../packages/{filename}",
+                "hashes": {"sha256": hashes.get(filename, hashlib.sha256(content).hexdigest())},
+                "yanked": False,
+            }
+        )
+    return {"meta": {"api-version": "1.1"}, "name": "django", "versions": releases, "files": files}
+
+
+class PyPIStub:
+    """Serve the Django simple index, and the wheels it lists, from a background thread. Use it as a context manager."""
+
+    def __init__(
+        self,
+        releases: list[str] | None = None,
+        wheels: dict[str, bytes] | None = None,
+        hashes: dict[str, str] | None = None,
+    ):
+        """
+        Prepare the simple index for ``releases`` (a Django 4.2 to 5.1 history by default) and ``wheels``.
+
+        ``wheels`` maps filenames to the content that is served for them, listed with its SHA-256 or, to test a
+        mismatch, the digest in ``hashes``. Every path requested is recorded in ``requests``.
+        """
+        wheels = wheels or {}
+        index = get_simple_index(RELEASES if releases is None else releases, wheels, hashes or {})
+        paths = {"/simple/django/": (SIMPLE_JSON_CONTENT_TYPE, json.dumps(index).encode())}
+        paths.update({f"/packages/{filename}": ("application/zip", content) for filename, content in wheels.items()})
+        self.requests: list[str] = []
+        requests = self.requests
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                requests.append(self.path)
+                if self.path not in paths:
+                    self.send_error(404)
+                    return
+                content_type, body = paths[self.path]
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def simple_index_url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}/simple/django/"
+
+    def __enter__(self) -> "PyPIStub":
+        """Start serving."""
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        """Stop serving."""
+        self.server.shutdown()
+        self.server.server_close()
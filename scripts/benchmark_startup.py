@@ -0,0 +1,72 @@
+"""
+Measure the cold start import cost of the `beatdrop` entry point with `python -X importtime`.
+
+Usage:
+    python scripts/benchmark_startup.py [--repeat 5] [--top 10] [--budget-ms 250]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+ENTRY_POINT_MODULE = "dj_beat_drop.main_cli"
+# Modules that must only be imported on the code paths that use them.
+LAZY_MODULES = ("requests", "InquirerPy", "packaging")
+
+
+def run_importtime() -> dict[str, int]:
+    """Return the cumulative import time in microseconds of every module imported by the entry point."""
+    check_lazy = f"import sys; print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {ENTRY_POINT_MODULE}; {check_lazy}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        entries.append((module.strip(), len(module) - len(module.lstrip()), int(cumulative)))
+
+    # The output is in post-order, so the entry point's own imports are the deeper lines right before it. Anything
+    # earlier (site, sitecustomize, .pth hooks) depends on the environment and is left out.
+    index = next(i for i, (module, _, _) in enumerate(entries) if module == ENTRY_POINT_MODULE)
+    timings = {ENTRY_POINT_MODULE: entries[index][2]}
+    entry_depth = entries[index][1]
+    for module, depth, cumulative in reversed(entries[:index]):
+        if depth <= entry_depth:
+            break
+        timings[module] = cumulative
+    eagerly_imported = [module for module in result.stdout.strip().split(",") if module]
+    if eagerly_imported:
+        raise SystemExit(f"Modules that should be lazy were imported at startup: {', '.join(eagerly_imported)}")
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of fresh interpreters to measure.")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to list.")
+    parser.add_argument("--budget-ms", type=float, help="Fail if the median import time exceeds this budget.")
+    args = parser.parse_args()
+
+    runs = [run_importtime() for _ in range(args.repeat)]
+    totals = [run[ENTRY_POINT_MODULE] / 1000 for run in runs]
+    median = statistics.median(totals)
+
+    print(f"{ENTRY_POINT_MODULE} import time over {args.repeat} runs:")
+    print(f"  median {median:.1f} ms, min {min(totals):.1f} ms, max {max(totals):.1f} ms\n")
+    print("Slowest imports (cumulative, last run):")
+    slowest = sorted(runs[-1].items(), key=lambda item: item[1], reverse=True)
+    for module, cumulative in slowest[1 : args.top + 1]:
+        print(f"  {cumulative / 1000:8.1f} ms  {module}")
+
+    if args.budget_ms is not None and median > args.budget_ms:
+        raise SystemExit(f"\nMedian import time {median:.1f} ms exceeds the {args.budget_ms:.1f} ms budget.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from dj_beat_drop.render import write_bundle
+from dj_beat_drop.utils import color
+
+PACKAGE_DIR = Path(__file__).parent.parent / "src" / "dj_beat_drop"
+TEMPLATES_DIRS = (PACKAGE_DIR / "templates", PACKAGE_DIR / "app_templates")
+
+
+def main():
+    for templates_dir in TEMPLATES_DIRS:
+        for template_dir in sorted(templates_dir.iterdir()):
+            if template_dir.is_dir() is False:
+                continue
+            bundle_path = write_bundle(template_dir)
+            color.green(f"Built {bundle_path.relative_to(PACKAGE_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,46 @@
-import os
+import json
 import shutil
-import zipfile
-from io import BytesIO
-
-import requests
-
-from dj_beat_drop.utils import color, get_latest_django_version, get_lts_django_version
-
-
-def download_django(version):
-    template_url = f"https://github.com/django/django/archive/refs/tags/{version}.zip"
-    target_dir = f"/tmp/django_template/{version}"  # noqa: S108
-    response = requests.get(template_url, timeout=10)
-    if response.status_code != 200:
-        color.red("Failed to download the Django template.")
-    else:
-        with zipfile.ZipFile(BytesIO(response.content)) as zip_ref:
-            zip_ref.extractall(target_dir)
-
-    return target_dir
-
-
-def copy_template_dir(download_dir, latest_version, minor_version):
-    template_dir_src = os.path.join(download_dir, f"django-{latest_version}/django/conf/project_template")
-    template_dir_dst = os.path.join(os.getcwd(), "src/dj_beat_drop/templates", minor_version)
-    if os.path.exists(template_dir_dst):
+from pathlib import Path
+
+from dj_beat_drop.django_apps import APP_TEMPLATES_DIR
+from dj_beat_drop.render import write_bundle
+from dj_beat_drop.template_fetch import APP_TEMPLATE, fetch_template, fetch_templates
+from dj_beat_drop.utils import (
+    RELEASE_MANIFEST_PATH,
+    color,
+    get_latest_django_version,
+    get_lts_django_version,
+    get_release_manifest,
+    get_version_index,
+)
+
+
+def copy_template_dir(template_dir_src: Path, minor_version: str, templates_dir: Path = RELEASE_MANIFEST_PATH.parent):
+    template_dir_dst = templates_dir / minor_version
+    if template_dir_dst.exists():
         shutil.rmtree(template_dir_dst)
     shutil.copytree(template_dir_src, template_dir_dst)
+    write_bundle(template_dir_dst)
+
+
+def write_release_manifest():
+    """Record the releases of every bundled template series, so versions can be resolved with `--offline`."""
+    templates_dir = RELEASE_MANIFEST_PATH.parent
+    minor_versions = {path.name for path in templates_dir.iterdir() if path.is_dir()}
+    manifest = get_release_manifest(get_version_index(), minor_versions)
+    RELEASE_MANIFEST_PATH.write_text(json.dumps(manifest, indent=2) + "\n")
 
 
 def main():
-    latest_version, minor_version = get_latest_django_version()
-    download_dir = download_django(latest_version)
-    copy_template_dir(download_dir, latest_version, minor_version)
-    lts_version, lts_minor_version = get_lts_django_version()
-    download_dir = download_django(lts_version)
-    copy_template_dir(download_dir, lts_version, lts_minor_version)
-    shutil.rmtree("/tmp/django_template")  # noqa: S108
+    versions = dict([get_latest_django_version(), get_lts_django_version()])
+    # The latest and LTS templates are downloaded in parallel, straight into the user cache.
+    template_dirs = fetch_templates(list(versions))
+    for django_version, minor_version in versions.items():
+        copy_template_dir(template_dirs[django_version], minor_version)
+        # The app template was extracted from the same download, so this doesn't fetch anything.
+        copy_template_dir(fetch_template(django_version, APP_TEMPLATE), minor_version, APP_TEMPLATES_DIR)
+        color.green(f"Updated the Django {minor_version} template from {django_version}.")
+    write_release_manifest()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,197 @@
+import contextlib
+import functools
+import io
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from dj_beat_drop import databases, django_apps, log_config, servers, sqlite_profiles, template_fetch, utils
+from dj_beat_drop.new import PROJECT_NAME_PATTERN, TEMPLATES_DIR, create_new_project
+from dj_beat_drop.utils import color
+
+# Every option of `beatdrop new` has a key, named after its command line option.
+MANIFEST_DEFAULTS = {
+    "lts": False,
+    "uv": True,
+    "env": True,
+    "db": databases.SQLITE_DATABASE,
+    "sqlite_profile": sqlite_profiles.DEFAULT_PROFILE,
+    "perf_preset": False,
+    "log_format": log_config.PLAIN_FORMAT,
+    "apps": [],
+}
+# Keys without a default, since TOML has no null.
+MANIFEST_OPTIONAL_KEYS = ("server", "python")
+MANIFEST_CHOICES = {
+    "db": databases.DATABASE_CHOICES,
+    "sqlite_profile": sqlite_profiles.PROFILE_NAMES,
+    "log_format": log_config.LOG_FORMATS,
+    "server": servers.SERVERS,
+}
+
+
+class ManifestError(Exception):
+    pass
+
+
+def load_manifest(manifest_path: Path) -> list[dict]:
+    """
+    Return the projects listed in a manifest, with the manifest's ``[defaults]`` applied to each one.
+
+    Example manifest::
+
+        [defaults]
+        lts = true
+
+        [[projects]]
+        name = "billing"
+
+        [[projects]]
+        name = "search"
+        lts = false
+        env = false
+        db = "postgres"
+        server = "granian"
+        apps = ["documents", "indexing"]
+    """
+    try:
+        data = utils.load_toml(manifest_path.read_text())
+    except (OSError, ValueError) as e:
+        raise ManifestError(f"Unable to read {manifest_path}: {e}") from e
+
+    defaults = {**MANIFEST_DEFAULTS, **data.get("defaults", {})}
+    projects = []
+    names = set()
+    for entry in data.get("projects", []):
+        project = {**defaults, **entry}
+        unknown_keys = set(project) - set(MANIFEST_DEFAULTS) - set(MANIFEST_OPTIONAL_KEYS) - {"name"}
+        if unknown_keys:
+            raise ManifestError(f"Unknown option(s) {', '.join(sorted(unknown_keys))} in {manifest_path}.")
+        name = project.get("name")
+        if not isinstance(name, str) or PROJECT_NAME_PATTERN.match(name) is None:
+            raise ManifestError(
+                f"Invalid project name {name!r}. Please use only lowercase letters, hyphens, and underscores."
+            )
+        if name in names:
+            raise ManifestError(f"The project {name!r} is listed more than once in {manifest_path}.")
+        check_project_options(project)
+        names.add(name)
+        projects.append(project)
+    if not projects:
+        raise ManifestError(f"No [[projects]] found in {manifest_path}.")
+    return projects
+
+
+def check_project_options(project: dict):
+    """Raise ``ManifestError`` for an option value `beatdrop new` would reject on the command line."""
+    for key, choices in MANIFEST_CHOICES.items():
+        if key in project and project[key] not in choices:
+            raise ManifestError(
+                f"Invalid {key} {project[key]!r} for {project['name']!r}. Choose one of {', '.join(choices)}."
+            )
+    if project["db"] != databases.SQLITE_DATABASE and project["sqlite_profile"] != sqlite_profiles.DEFAULT_PROFILE:
+        raise ManifestError(f'sqlite_profile only applies to db = "sqlite", in {project["name"]!r}.')
+    apps = project["apps"]
+    if not isinstance(apps, list) or not all(isinstance(app_name, str) for app_name in apps):
+        raise ManifestError(f"apps must be a list of app names, in {project['name']!r}.")
+    try:
+        django_apps.check_app_names(apps)
+    except ValueError as e:
+        raise ManifestError(f"{e} ({project['name']!r})") from None
+
+
+def get_resolved_context(template_context: dict[str, str], **kwargs) -> dict[str, str]:
+    return template_context
+
+
+def create_project(project: dict, project_dir: Path, template_context: dict[str, str], overwrite: bool) -> float:
+    """Create one manifest project and return how long it took. Runs in a worker process."""
+    start = time.perf_counter()
+    if project_dir.exists():
+        if overwrite is False:
+            raise FileExistsError(f"The directory '{project_dir.name}' already exists.")
+        shutil.rmtree(project_dir)
+    # Keep the per project messages from interleaving in the batch output.
+    with contextlib.redirect_stdout(io.StringIO()):
+        create_new_project(
+            name=project["name"],
+            use_lts=project["lts"],
+            project_dir=project_dir,
+            initialize_uv=project["uv"],
+            initialize_env=project["env"],
+            sqlite_profile=project["sqlite_profile"],
+            database=project["db"],
+            use_perf_preset=project["perf_preset"],
+            log_format=project["log_format"],
+            server=project.get("server"),
+            python=project.get("python"),
+            app_names=project["apps"],
+            resolver=functools.partial(get_resolved_context, template_context),
+        )
+    return time.perf_counter() - start
+
+
+def print_results(results: list[dict]) -> None:
+    name_width = max(len("Project"), *(len(result["name"]) for result in results))
+    print(f"\n{'Project':<{name_width}}  {'Django':<8}  {'Time':>7}  Result")
+    for result in results:
+        line = f"{result['name']:<{name_width}}  {result['django_version']:<8}  {result['duration']:>6.2f}s  "
+        if result["error"] is None:
+            color.green(f"{line}created")
+        else:
+            color.red(f"{line}failed: {result['error']}")
+
+
+def handle_manifest(manifest_path: Path, overwrite: bool, refresh: bool = False, jobs: int | None = None) -> bool:
+    """Create every project in the manifest in parallel and return whether all of them succeeded."""
+    try:
+        projects = load_manifest(manifest_path)
+    except ManifestError as e:
+        color.red(str(e))
+        return False
+
+    # Resolve the Django releases once for the whole batch, only the secret key differs between projects.
+    try:
+        contexts = {
+            use_lts: utils.get_template_context(use_lts=use_lts, refresh=refresh)
+            for use_lts in {project["lts"] for project in projects}
+        }
+    except Exception as e:
+        # Without a release no project can be created, e.g. PyPI is unreachable or returned no releases.
+        color.red(f"Failed to resolve the Django release: {str(e) or type(e).__name__}")
+        return False
+    # Download any template that isn't bundled up front, so the workers don't all fetch the same one. A failed
+    # download is retried, and reported, by each project that needs it.
+    with contextlib.suppress(Exception):
+        template_fetch.fetch_templates(
+            [
+                context["django_version"]
+                for context in contexts.values()
+                if (TEMPLATES_DIR / context["docs_version"]).is_dir() is False
+            ]
+        )
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {}
+        for project in projects:
+            template_context = {**contexts[project["lts"]], "secret_key": utils.get_secret_key()}
+            project_dir = Path.cwd() / project["name"]
+            future = executor.submit(create_project, project, project_dir, template_context, overwrite)
+            futures[future] = project
+            results[project["name"]] = {
+                "name": project["name"],
+                "django_version": template_context["django_version"],
+                "duration": 0.0,
+                "error": None,
+            }
+        for future in as_completed(futures):
+            result = results[futures[future]["name"]]
+            try:
+                result["duration"] = future.result()
+            except Exception as e:
+                result["error"] = str(e) or type(e).__name__
+
+    print_results(list(results.values()))
+    return all(result["error"] is None for result in results.values())
@@ -0,0 +1,110 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+RELEASES_CACHE_TTL = 60 * 60
+STATS_DIR_NAME = "stats"
+STATS_EVENTS = ("hit", "revalidated", "miss")
+# Each process counts its events in its own file, so only its threads can race on it.
+_stats_lock = threading.Lock()
+
+
+def get_cache_dir() -> Path:
+    """Return the user level cache directory, honoring ``XDG_CACHE_HOME``."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "dj-beat-drop"
+
+
+def _write_json(path: Path, data: dict) -> None:
+    # The cache is best effort, so an unwritable cache directory must never break the command. Write to a
+    # temporary file first so concurrent runs never see a half written file.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        with os.fdopen(fd, "w") as tmp_file:
+            json.dump(data, tmp_file)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _read_json(path: Path) -> dict | None:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def read_entry(key: str) -> dict | None:
+    return _read_json(get_cache_dir() / f"{key}.json")
+
+
+def write_entry(key: str, data: dict, *, etag: str | None = None, last_modified: str | None = None) -> dict:
+    entry = {
+        "fetched_at": time.time(),
+        "etag": etag,
+        "last_modified": last_modified,
+        "data": data,
+    }
+    _write_json(get_cache_dir() / f"{key}.json", entry)
+    return entry
+
+
+def touch_entry(key: str, entry: dict) -> None:
+    entry["fetched_at"] = time.time()
+    _write_json(get_cache_dir() / f"{key}.json", entry)
+
+
+def is_fresh(entry: dict, ttl: int | None = None) -> bool:
+    if ttl is None:
+        ttl = RELEASES_CACHE_TTL
+    return time.time() - entry.get("fetched_at", 0) < ttl
+
+
+def get_conditional_headers(entry: dict | None) -> dict[str, str]:
+    headers = {}
+    if entry is None:
+        return headers
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def get_stats_dir() -> Path:
+    return get_cache_dir() / STATS_DIR_NAME
+
+
+def record_event(event: str) -> None:
+    """Count a release cache ``event`` in this process's stats file, which no other process writes to."""
+    stats_path = get_stats_dir() / f"{os.getpid()}.json"
+    with _stats_lock:
+        stats = _read_json(stats_path) or {}
+        stats[event] = stats.get(event, 0) + 1
+        _write_json(stats_path, stats)
+
+
+def get_stats() -> dict[str, int]:
+    """Return the events counted by every process."""
+    stats = {event: 0 for event in STATS_EVENTS}
+    for stats_path in sorted(get_stats_dir().glob("*.json")):
+        for event, count in (_read_json(stats_path) or {}).items():
+            stats[event] = stats.get(event, 0) + count
+    return stats
+
+
+def get_hit_rate(stats: dict[str, int]) -> float:
+    total = sum(stats.get(event, 0) for event in STATS_EVENTS)
+    if total == 0:
+        return 0.0
+    return (stats.get("hit", 0) + stats.get("revalidated", 0)) / total
+
+
+def clear() -> None:
+    """Remove everything dj-beat-drop caches: Django releases, templates, lockfiles, database snapshots and stats."""
+    shutil.rmtree(get_cache_dir(), ignore_errors=True)
@@ -0,0 +1,80 @@
+import json
+
+from dj_beat_drop import settings_engine
+
+SQLITE_DATABASE = "sqlite"
+POSTGRES_DATABASE = "postgres"
+DATABASE_CHOICES = (SQLITE_DATABASE, POSTGRES_DATABASE)
+ENVIRONS_DATABASES = 'DATABASES = {"default": env.dj_db_url("DATABASE_URL")}'
+# Django's built-in pool (5.1+) is psycopg_pool's ConnectionPool, with these arguments.
+POSTGRES_POOL_OPTIONS = {"min_size": 2, "max_size": 4, "timeout": 10}
+# Without a pool (before 5.1), keep connections open between requests and check them before reuse instead.
+POSTGRES_CONN_MAX_AGE = 600
+POSTGRES_USER = "postgres"
+POSTGRES_HOST = "localhost"
+POSTGRES_PORT = 5432
+
+
+def supports_connection_pool(django_version: str) -> bool:
+    from packaging.version import Version
+
+    return Version(django_version) >= Version("5.1")
+
+
+def get_database_name(project_name: str) -> str:
+    return project_name.replace("-", "_")
+
+
+def get_postgres_url(database_name: str) -> str:
+    return f"postgres://{POSTGRES_USER}@{POSTGRES_HOST}:{POSTGRES_PORT}/{database_name}"
+
+
+def get_driver_dependency(database: str, django_version: str) -> str | None:
+    if database != POSTGRES_DATABASE:
+        return None
+    if supports_connection_pool(django_version):
+        return "psycopg[binary,pool]"
+    return "psycopg[binary]"
+
+
+def configure_postgres(settings: settings_engine.Settings, django_version: str, database_name: str):
+    """Replace the SQLite ``DATABASES`` setting with PostgreSQL, pooled on Django 5.1+ and persistent before that."""
+    if supports_connection_pool(django_version):
+        pool_lines = "".join(f"                '{name}': {value},\n" for name, value in POSTGRES_POOL_OPTIONS.items())
+        connection_lines = f"        'OPTIONS': {{\n            'pool': {{\n{pool_lines}            }},\n        }},\n"
+    else:
+        connection_lines = f"        'CONN_MAX_AGE': {POSTGRES_CONN_MAX_AGE},\n        'CONN_HEALTH_CHECKS': True,\n"
+    databases = (
+        "DATABASES = {\n"
+        "    'default': {\n"
+        "        'ENGINE': 'django.db.backends.postgresql',\n"
+        f"        'NAME': '{database_name}',\n"
+        f"        'USER': '{POSTGRES_USER}',\n"
+        "        'PASSWORD': '',\n"
+        f"        'HOST': '{POSTGRES_HOST}',\n"
+        f"        'PORT': '{POSTGRES_PORT}',\n"
+        f"{connection_lines}"
+        "    }\n"
+        "}"
+    )
+    settings.replace_setting("DATABASES", databases)
+
+
+def replace_postgres_config(content: str, django_version: str, database_name: str) -> str:
+    return settings_engine.rewrite(
+        content, [lambda settings: configure_postgres(settings, django_version, database_name)]
+    )
+
+
+def get_environs_databases(database: str, django_version: str) -> str:
+    """Return the ``DATABASES`` setting read from ``DATABASE_URL``, with the connection handling for ``database``."""
+    if database != POSTGRES_DATABASE:
+        return ENVIRONS_DATABASES
+    if supports_connection_pool(django_version):
+        # A URL can't carry the pool settings, so they're added to whatever OPTIONS the URL set.
+        pool_options = json.dumps(POSTGRES_POOL_OPTIONS)
+        return f'{ENVIRONS_DATABASES}\nDATABASES["default"].setdefault("OPTIONS", {{}})["pool"] = {pool_options}'
+    return (
+        'DATABASES = {"default": env.dj_db_url("DATABASE_URL", '
+        f"conn_max_age={POSTGRES_CONN_MAX_AGE}, conn_health_checks=True)}}"
+    )
@@ -0,0 +1,105 @@
+import ast
+import keyword
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from dj_beat_drop import render, settings_engine, template_fetch
+
+APP_TEMPLATES_DIR = Path(__file__).parent / "app_templates"
+APP_NAME_PATTERN = re.compile(r"^[a-z_][a-z0-9_]*$")
+MAX_RENDER_WORKERS = 8
+# The import names of every package a project can depend on (see ``uv_project.get_dependencies``), which an app of the
+# same name would shadow.
+DEPENDENCY_MODULES = frozenset(
+    {
+        "django",
+        "environs",
+        "psycopg",
+        "psycopg_binary",
+        "psycopg_pool",
+        "whitenoise",
+        "redis",
+        "gunicorn",
+        "uvicorn",
+        "uvicorn_worker",
+        "granian",
+    }
+)
+
+
+def parse_app_names(apps: str | None) -> list[str]:
+    """Split an ``--apps`` value (e.g. ``blog,shop``) into app names, ignoring blanks."""
+    if apps is None:
+        return []
+    return [name.strip() for name in apps.split(",") if name.strip()]
+
+
+def check_app_names(app_names: list[str]):
+    """Raise ``ValueError`` for a name ``manage.py startapp`` would reject, or that is given twice."""
+    seen = set()
+    for name in app_names:
+        if APP_NAME_PATTERN.match(name) is None or keyword.iskeyword(name):
+            raise ValueError(
+                f"{name!r} isn't a valid app name. Please use only lowercase letters, digits, and underscores."
+            )
+        if name == render.CONFIG_DIR:
+            raise ValueError(f"{name!r} is the project's configuration package, so it can't be an app name.")
+        # Like startapp, refuse names that would shadow a module (e.g. "test" or "django"). The project's own
+        # environment doesn't exist yet, so that's the standard library and the packages the project can depend on.
+        if name in sys.stdlib_module_names or name in DEPENDENCY_MODULES:
+            raise ValueError(f"{name!r} conflicts with the name of an existing Python module.")
+        if name in seen:
+            raise ValueError(f"The app {name!r} is listed more than once.")
+        seen.add(name)
+
+
+def get_app_template_dir(template_context: dict[str, str]) -> Path:
+    """Return the app template for the context's Django version, bundled with the package or fetched on demand."""
+    bundled_dir = APP_TEMPLATES_DIR / template_context["docs_version"]
+    if bundled_dir.is_dir():
+        return bundled_dir
+    return template_fetch.fetch_template(template_context["django_version"], template_fetch.APP_TEMPLATE)
+
+
+def get_app_context(template_context: dict[str, str], app_name: str) -> dict[str, str]:
+    # The variables startapp renders the app template with.
+    camel_case_app_name = "".join(char for char in app_name.title() if char != "_")
+    return {**template_context, "app_name": app_name, "camel_case_app_name": camel_case_app_name}
+
+
+def get_app_files(template_context: dict[str, str], app_names: list[str]) -> dict[str, str]:
+    """
+    Render the app template for each of ``app_names`` and return every file's path in the project with its content.
+
+    The template is loaded once and the apps are rendered in memory by a thread pool, so unlike ``manage.py startapp``
+    no Django process is started per app.
+    """
+    if not app_names:
+        return {}
+    template = render.load_template(get_app_template_dir(template_context))
+
+    def render_app(app_name: str) -> dict[str, str]:
+        context = get_app_context(template_context, app_name)
+        return {
+            f"{app_name}/{relative_path}": render.render_segments(segments, context)
+            for relative_path, segments in template["files"]
+        }
+
+    files = {}
+    with ThreadPoolExecutor(max_workers=min(len(app_names), MAX_RENDER_WORKERS)) as executor:
+        for app_files in executor.map(render_app, app_names):
+            files.update(app_files)
+    return files
+
+
+def configure_installed_apps(settings: settings_engine.Settings, app_names: list[str]):
+    """Add ``app_names`` to the end of ``INSTALLED_APPS``, one per line like the apps already there."""
+    installed_apps = settings.get_setting("INSTALLED_APPS").value
+    if not isinstance(installed_apps, ast.List) or not installed_apps.elts:
+        raise settings_engine.SettingsTransformError("settings.py's INSTALLED_APPS isn't a list of apps.")
+    last_app = installed_apps.elts[-1]
+    if last_app.end_lineno == installed_apps.end_lineno:
+        raise settings_engine.SettingsTransformError("settings.py's INSTALLED_APPS doesn't list one app per line.")
+    settings.insert(settings.get_line_end(last_app), "".join(f"    '{name}',\n" for name in app_names))
@@ -0,0 +1,127 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+
+from dj_beat_drop import cache
+
+LOCK_FILE_NAME = "uv.lock"
+PYTHON_VERSION_FILE_NAME = ".python-version"
+LOCK_FORMAT_VERSION = 3
+# Cached lockfiles name the project this, and the name is replaced by the project's own when a lock is restored.
+PLACEHOLDER_NAME = "dj-beat-drop-project"
+ROOT_PACKAGE = '[[package]]\nname = "{name}"\nversion = "0.1.0"\nsource = {{ virtual = "." }}\n'
+DJANGO_REQUIREMENT_PATTERN = re.compile(r'\{ name = "django", specifier = "[^"]*" \}')
+
+
+def get_lock_dir() -> Path:
+    return cache.get_cache_dir() / "locks"
+
+
+def get_package_name(name: str) -> str:
+    """Return the normalized name uv records a project under (e.g. ``example_project`` is ``example-project``)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def get_django_specifier(dependencies: list[str]) -> str:
+    """Return the version specifier of the Django requirement (e.g. ``~=5.1`` for ``django~=5.1``)."""
+    from packaging.requirements import Requirement
+
+    for dependency in dependencies:
+        requirement = Requirement(dependency)
+        if requirement.name == "django":
+            return str(requirement.specifier)
+    raise ValueError("The dependencies don't include Django.")
+
+
+def get_python_version(project_dir: Path) -> str | None:
+    """Return the Python version the project is pinned to, which its lockfile's ``requires-python`` follows."""
+    try:
+        return (project_dir / PYTHON_VERSION_FILE_NAME).read_text().strip()
+    except OSError:
+        return None
+
+
+def get_lock_path(template_context: dict[str, str], dependencies: list[str], python_version: str) -> Path:
+    """
+    Return where the lockfile for a set of dependencies is cached.
+
+    Locks are keyed by the Django release the project is rendered for, its Python version and the other dependencies,
+    so a new Django patch release is resolved again instead of installing the one from an older lock. How the Django
+    requirement is written (``~=5.1``, ``~=5.1.3`` or ``==5.1.3``) depends on how the release was chosen, not on the
+    release, so it's left out of the key and set when the lock is restored.
+    """
+    from packaging.requirements import Requirement
+
+    other_dependencies = sorted(dependency for dependency in dependencies if Requirement(dependency).name != "django")
+    key = json.dumps([LOCK_FORMAT_VERSION, python_version, template_context["django_version"], other_dependencies])
+    key_hash = hashlib.sha256(key.encode()).hexdigest()[:12]
+    return get_lock_dir() / f"django-{template_context['django_version']}-{key_hash}.lock"
+
+
+def rename_root_package(lock: str, old_name: str, new_name: str) -> str | None:
+    """Rename the project's own package in a lockfile, or return ``None`` if the lockfile isn't laid out as expected."""
+    old_root_package = ROOT_PACKAGE.format(name=old_name)
+    if lock.count(old_root_package) != 1:
+        return None
+    return lock.replace(old_root_package, ROOT_PACKAGE.format(name=new_name))
+
+
+def set_django_specifier(lock: str, specifier: str) -> str | None:
+    """Set the Django requirement the lockfile records for the project, or return ``None`` if there isn't one."""
+    requirement = f'{{ name = "django", specifier = "{specifier}" }}'
+    new_lock, count = DJANGO_REQUIREMENT_PATTERN.subn(lambda match: requirement, lock)
+    return new_lock if count == 1 else None
+
+
+def restore_lock(project_dir: Path, name: str, template_context: dict[str, str], dependencies: list[str]) -> bool:
+    """
+    Copy a cached lockfile into the project and return whether there was one to copy.
+
+    ``uv lock`` still runs afterwards, but with a lockfile that already satisfies the project it only checks it, so
+    nothing is resolved and no package metadata is downloaded. If the locked Django doesn't satisfy the project's
+    requirement, ``uv lock`` resolves again.
+    """
+    python_version = get_python_version(project_dir)
+    if python_version is None:
+        return False
+    try:
+        lock = get_lock_path(template_context, dependencies, python_version).read_text()
+    except OSError:
+        return False
+    lock = rename_root_package(lock, PLACEHOLDER_NAME, get_package_name(name))
+    if lock is not None:
+        lock = set_django_specifier(lock, get_django_specifier(dependencies))
+    if lock is None:
+        return False
+    (project_dir / LOCK_FILE_NAME).write_text(lock)
+    return True
+
+
+def save_lock(project_dir: Path, name: str, template_context: dict[str, str], dependencies: list[str]) -> Path | None:
+    """Cache the project's lockfile for the next project with the same dependencies, unless it's cached already."""
+    python_version = get_python_version(project_dir)
+    if python_version is None:
+        return None
+    lock_path = get_lock_path(template_context, dependencies, python_version)
+    try:
+        lock = (project_dir / LOCK_FILE_NAME).read_text()
+    except OSError:
+        return None
+    lock = rename_root_package(lock, get_package_name(name), PLACEHOLDER_NAME)
+    if lock is None:
+        return None
+    try:
+        if lock_path.exists() and lock_path.read_text() == lock:
+            return lock_path
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=lock_path.parent, prefix=f".{lock_path.name}.", suffix=".tmp")
+        with os.fdopen(fd, "w") as tmp_file:
+            tmp_file.write(lock)
+        os.replace(tmp_path, lock_path)
+    except OSError:
+        # The lock cache is best effort, like the rest of the cache.
+        return None
+    return lock_path
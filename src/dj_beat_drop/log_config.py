@@ -0,0 +1,90 @@
+from pathlib import Path
+
+from dj_beat_drop import settings_engine
+
+PLAIN_FORMAT = "plain"
+JSON_FORMAT = "json"
+LOG_FORMATS = (PLAIN_FORMAT, JSON_FORMAT)
+LOG_FORMAT_ENV_VAR = "LOG_FORMAT"
+LOG_HANDLERS_MODULE = "log_handlers"
+LOG_HANDLERS_PATH = Path(__file__).parent / "project_files" / f"{LOG_HANDLERS_MODULE}.py"
+LOGGING_SETTINGS = (
+    "\n\n# Logging\n"
+    "# https://docs.djangoproject.com/en/{docs_version}/topics/logging/\n"
+    "# Records are queued by the request thread and written to stderr by a background thread (see {module}.py).\n"
+    "# Errors are still emailed to ADMINS when DEBUG is off, as with Django's default logging.\n"
+    "\n"
+    "LOGGING = {{\n"
+    "    'version': 1,\n"
+    "    'disable_existing_loggers': False,\n"
+    "    'formatters': {{\n"
+    "        'plain': {{\n"
+    "            'format': '{{asctime}} {{levelname}} {{name}} {{message}}',\n"
+    "            'style': '{{',\n"
+    "        }},\n"
+    "        'json': {{\n"
+    "            '()': '{project_name}.{module}.JSONFormatter',\n"
+    "        }},\n"
+    "    }},\n"
+    "    'filters': {{\n"
+    "        'require_debug_false': {{\n"
+    "            '()': 'django.utils.log.RequireDebugFalse',\n"
+    "        }},\n"
+    "    }},\n"
+    "    'handlers': {{\n"
+    "        'queue': {{\n"
+    "            '()': '{project_name}.{module}.QueueStreamHandler',\n"
+    "            'formatter': {formatter},\n"
+    "        }},\n"
+    "        'mail_admins': {{\n"
+    "            'level': 'ERROR',\n"
+    "            'filters': ['require_debug_false'],\n"
+    "            'class': 'django.utils.log.AdminEmailHandler',\n"
+    "        }},\n"
+    "    }},\n"
+    "    'root': {{\n"
+    "        'handlers': ['queue'],\n"
+    "        'level': 'INFO',\n"
+    "    }},\n"
+    "    'loggers': {{\n"
+    "        'django': {{\n"
+    "            'handlers': ['queue', 'mail_admins'],\n"
+    "            'level': 'INFO',\n"
+    "            'propagate': False,\n"
+    "        }},\n"
+    "    }},\n"
+    "}}\n"
+)
+
+
+def get_log_handlers_module() -> str:
+    return LOG_HANDLERS_PATH.read_text()
+
+
+def configure_logging(
+    settings: settings_engine.Settings, template_context: dict[str, str], initialize_env: bool, log_format: str
+):
+    """
+    Append a ``LOGGING`` setting that routes every record through the generated queue handler.
+
+    Django's own ``mail_admins`` handler is kept on the ``django`` logger, so errors are still emailed to ``ADMINS``.
+    With environs the formatter is read from ``LOG_FORMAT``, defaulting to ``log_format``.
+    """
+    if log_format not in LOG_FORMATS:
+        raise ValueError(f"Unknown log format {log_format!r}. Choose one of {', '.join(LOG_FORMATS)}.")
+    formatter = f"'{log_format}'"
+    if initialize_env is True:
+        formatter = f'env.str("{LOG_FORMAT_ENV_VAR}", {formatter})'
+    logging_settings = LOGGING_SETTINGS.format(
+        docs_version=template_context["docs_version"],
+        project_name=template_context["project_name"],
+        module=LOG_HANDLERS_MODULE,
+        formatter=formatter,
+    )
+    settings.append(logging_settings)
+
+
+def add_logging(content: str, template_context: dict[str, str], initialize_env: bool, log_format: str) -> str:
+    return settings_engine.rewrite(
+        content, [lambda settings: configure_logging(settings, template_context, initialize_env, log_format)]
+    )
@@ -1,10 +1,11 @@
+import contextlib
 import importlib.metadata
+import threading
+from pathlib import Path
 
-import requests
 import typer
-from packaging.version import parse
 
-from dj_beat_drop.new import handle_new
+from dj_beat_drop import cache, timings, utils
 from dj_beat_drop.utils import color
 
 
@@ -23,6 +24,10 @@ def get_current_version():
 
 
 main_command = typer.Typer(no_args_is_help=True)
+cache_command = typer.Typer(
+    no_args_is_help=True, help="Inspect the Django release cache, or clear everything dj-beat-drop caches."
+)
+main_command.add_typer(cache_command, name="cache")
 
 
 def print_version(value: bool):
@@ -31,23 +36,68 @@ def print_version(value: bool):
         raise typer.Exit()
 
 
-def check_version():
-    package_name = "dj-beat-drop"
-    current_version = get_current_version()
+PACKAGE_NAME = "dj-beat-drop"
+VERSION_CHECK_CACHE_KEY = "version-check"
+VERSION_CHECK_INTERVAL = 60 * 60 * 24
+VERSION_CHECK_TIMEOUT = 3
+# How long to wait at exit for a check that is still running before giving up on the notice.
+VERSION_CHECK_DEADLINE = 0.5
+
+
+def check_version() -> str | None:
+    """
+    Return the latest released version, asking PyPI at most once every ``VERSION_CHECK_INTERVAL`` seconds.
 
-    response = requests.get(f"https://pypi.org/pypi/{package_name}/json", timeout=10)
+    The attempt is recorded before PyPI is asked, so a failing check isn't retried by every command. Until a check
+    succeeds, the latest version is unknown and ``None`` is returned.
+    """
+    entry = cache.read_entry(VERSION_CHECK_CACHE_KEY)
+    latest_version = entry["data"]["latest_version"] if entry is not None else None
+    if entry is not None and cache.is_fresh(entry, ttl=VERSION_CHECK_INTERVAL):
+        return latest_version
+    cache.write_entry(VERSION_CHECK_CACHE_KEY, {"latest_version": latest_version})
+
+    response = utils.get_session().get(f"https://pypi.org/pypi/{PACKAGE_NAME}/json", timeout=VERSION_CHECK_TIMEOUT)
+    response.raise_for_status()
     latest_version = response.json()["info"]["version"]
+    cache.write_entry(VERSION_CHECK_CACHE_KEY, {"latest_version": latest_version})
+    return latest_version
+
 
+def print_update_notice(latest_version: str):
+    from packaging.version import parse
+
+    current_version = get_current_version()
     if parse(current_version) < parse(latest_version):
         color.green(
-            f"\033[0;33m\nA new version of {package_name} is available ({latest_version}). You are using "
+            f"\033[0;33m\nA new version of {PACKAGE_NAME} is available ({latest_version}). You are using "
             f"{current_version}. To update, run:\n\033[0m"
         )
-        print(f"  pip install --upgrade {package_name}\n")
+        print(f"  pip install --upgrade {PACKAGE_NAME}\n")
+
+
+class VersionCheck(threading.Thread):
+    """Check for a new release in the background so a slow or unreachable PyPI never delays the command."""
+
+    latest_version: str | None = None
+
+    def run(self):
+        # The update notice is a nicety, so any failure (offline, timeout, bad response) is ignored.
+        with contextlib.suppress(Exception):
+            self.latest_version = check_version()
+
+    def report(self, timeout: float = VERSION_CHECK_DEADLINE):
+        if self.ident is None:
+            # The check never started, e.g. in offline mode.
+            return
+        self.join(timeout)
+        if self.is_alive() is False and self.latest_version is not None:
+            print_update_notice(self.latest_version)
 
 
 @main_command.callback()
 def main_callback(
+    ctx: typer.Context,
     version: bool = typer.Option(
         None,
         "--version",
@@ -56,23 +106,312 @@ def main_callback(
         is_eager=True,
         help="Show the application's version and exit.",
     ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        envvar=utils.OFFLINE_ENV_VAR,
+        help="Never use the network. Django versions are resolved from the releases bundled with the templates.",
+    ),
 ):
-    pass
+    if offline is True:
+        utils.enable_offline_mode()
+    elif isinstance(ctx.obj, VersionCheck):
+        ctx.obj.start()
 
 
 @main_command.command()
 def new(
     name: str | None = typer.Argument(None, help="Project name (e.g. 'example_project' or 'example-project')."),
     use_lts: bool = typer.Option(False, "--lts", help="Use the latest LTS version of Django."),
+    django_version: str | None = typer.Option(
+        None, "--django", help="Use the newest patch release of a Django series (e.g. 4.2) or an exact release (5.1.3)."
+    ),
+    sqlite_profile: str = typer.Option(
+        "default",
+        "--sqlite-profile",
+        help="SQLite PRAGMAs: default, read-heavy, write-heavy, low-memory or auto (sized from this machine's RAM).",
+    ),
+    database: str = typer.Option(
+        "sqlite", "--db", help="Database: sqlite or postgres (pooled connections on Django 5.1+)."
+    ),
+    use_perf_preset: bool = typer.Option(
+        False,
+        "--perf-preset",
+        help="Add a cache (Redis when REDIS_URL is set), cached sessions and templates, and compressed static files.",
+    ),
+    log_format: str = typer.Option(
+        "plain", "--log-format", help="Format of the queued log records: plain or json (one JSON object per line)."
+    ),
+    server: str | None = typer.Option(
+        None, "--server", help="Add a gunicorn, uvicorn or granian config sized from the CPU count at startup."
+    ),
+    apps: str | None = typer.Option(
+        None, "--apps", help="Comma-separated apps to create (e.g. blog,shop) and add to INSTALLED_APPS."
+    ),
+    python: str | None = typer.Option(
+        None, "--python", help="Pin the project to this Python (e.g. 3.12). By default uv picks it, as `uv init` does."
+    ),
     overwrite: bool = typer.Option(False, "--overwrite", help="Overwrite the project directory if it already exists."),
+    refresh: bool = typer.Option(False, "--refresh", help="Revalidate the cached Django releases with PyPI."),
+    from_manifest: str | None = typer.Option(
+        None, "--from-manifest", help="Create every project listed in a TOML manifest in parallel."
+    ),
+    jobs: int | None = typer.Option(None, "--jobs", "-j", help="Number of worker processes for --from-manifest."),
+    show_timings: bool = typer.Option(
+        False, "--timings", help="Print how long each phase took (only the main process with --from-manifest)."
+    ),
+    timings_json: str | None = typer.Option(
+        None, "--timings-json", help="Write how long each phase took to a JSON file."
+    ),
 ):
-    handle_new(name, use_lts, overwrite)
+    if django_version is not None and (use_lts is True or from_manifest is not None):
+        raise typer.BadParameter("--django can't be combined with --lts or --from-manifest.", param_hint="--django")
+    if from_manifest is not None:
+        check_manifest_options(
+            {
+                "--lts": use_lts is True,
+                "--sqlite-profile": sqlite_profile != "default",
+                "--db": database != "sqlite",
+                "--perf-preset": use_perf_preset is True,
+                "--log-format": log_format != "plain",
+                "--server": server is not None,
+                "--apps": apps is not None,
+                "--python": python is not None,
+            }
+        )
+    check_sqlite_profiles([sqlite_profile])
+    check_database(database, sqlite_profile)
+    check_sqlite_profile_version(sqlite_profile, django_version)
+    check_log_format(log_format)
+    check_server(server)
+    app_names = check_apps(apps)
+    command_timings = timings.Timings()
+    try:
+        with timings.record(command_timings):
+            handle_new_command(
+                name,
+                use_lts,
+                overwrite,
+                refresh,
+                from_manifest,
+                jobs,
+                django_version,
+                sqlite_profile,
+                database,
+                use_perf_preset,
+                log_format,
+                server,
+                app_names,
+                python,
+            )
+    finally:
+        if show_timings is True:
+            command_timings.print_table()
+        if timings_json is not None:
+            command_timings.write_json(Path(timings_json))
+
+
+def check_manifest_options(options_given: dict[str, bool]):
+    """Reject the options of a single project alongside --from-manifest, where the manifest sets them per project."""
+    for option, given in options_given.items():
+        if given is True:
+            manifest_key = option.removeprefix("--").replace("-", "_")
+            raise typer.BadParameter(
+                f"{option} can't be combined with --from-manifest. Set `{manifest_key}` in the manifest instead.",
+                param_hint=option,
+            )
+
+
+def check_sqlite_profiles(profiles: list[str]):
+    from dj_beat_drop.sqlite_profiles import PROFILE_NAMES
+
+    for profile in profiles:
+        if profile not in PROFILE_NAMES:
+            raise typer.BadParameter(
+                f"{profile!r} isn't one of {', '.join(PROFILE_NAMES)}.", param_hint="--sqlite-profile"
+            )
+
+
+def check_database(database: str, sqlite_profile: str):
+    from dj_beat_drop.databases import DATABASE_CHOICES, SQLITE_DATABASE
+
+    if database not in DATABASE_CHOICES:
+        raise typer.BadParameter(f"{database!r} isn't one of {', '.join(DATABASE_CHOICES)}.", param_hint="--db")
+    if database != SQLITE_DATABASE and sqlite_profile != "default":
+        raise typer.BadParameter("--sqlite-profile only applies to --db sqlite.", param_hint="--sqlite-profile")
+
+
+def check_sqlite_profile_version(sqlite_profile: str, django_version: str | None):
+    # A release picked by --lts or from PyPI is checked once it's resolved, --django can be checked straight away.
+    from packaging.version import InvalidVersion, Version
+
+    from dj_beat_drop.sqlite_profiles import DEFAULT_PROFILE, MIN_DJANGO_VERSION
+
+    if sqlite_profile == DEFAULT_PROFILE or django_version is None:
+        return
+    with contextlib.suppress(InvalidVersion):
+        if Version(django_version) < Version(MIN_DJANGO_VERSION):
+            raise typer.BadParameter(
+                f"Django {django_version} can't apply SQLite profiles. Use Django {MIN_DJANGO_VERSION} or later.",
+                param_hint="--sqlite-profile",
+            )
+
+
+def check_log_format(log_format: str):
+    from dj_beat_drop.log_config import LOG_FORMATS
+
+    if log_format not in LOG_FORMATS:
+        raise typer.BadParameter(f"{log_format!r} isn't one of {', '.join(LOG_FORMATS)}.", param_hint="--log-format")
+
+
+def check_server(server: str | None):
+    from dj_beat_drop.servers import SERVERS
+
+    if server is not None and server not in SERVERS:
+        raise typer.BadParameter(f"{server!r} isn't one of {', '.join(SERVERS)}.", param_hint="--server")
+
+
+def check_apps(apps: str | None) -> list[str]:
+    from dj_beat_drop.django_apps import check_app_names, parse_app_names
+
+    app_names = parse_app_names(apps)
+    try:
+        check_app_names(app_names)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--apps") from None
+    return app_names
+
+
+def handle_new_command(
+    name: str | None,
+    use_lts: bool,
+    overwrite: bool,
+    refresh: bool,
+    from_manifest: str | None,
+    jobs: int | None,
+    django_version: str | None = None,
+    sqlite_profile: str = "default",
+    database: str = "sqlite",
+    use_perf_preset: bool = False,
+    log_format: str = "plain",
+    server: str | None = None,
+    app_names: list[str] | None = None,
+    python: str | None = None,
+):
+    # Imported here so the prompt and templating dependencies only load when a project is being created.
+    if from_manifest is not None:
+        from dj_beat_drop.batch import handle_manifest
+
+        if handle_manifest(Path(from_manifest), overwrite, refresh, jobs) is False:
+            raise typer.Exit(1)
+        return
+
+    from dj_beat_drop.new import handle_new
+
+    handle_new(
+        name,
+        use_lts,
+        overwrite,
+        refresh,
+        django_version,
+        sqlite_profile,
+        database,
+        use_perf_preset,
+        log_format,
+        server,
+        app_names,
+        python,
+    )
+
+
+@main_command.command()
+def update(
+    project_dir: str = typer.Argument(".", help="The project to update."),
+    use_lts: bool = typer.Option(False, "--lts", help="Update to the latest LTS version of Django."),
+    django_version: str | None = typer.Option(
+        None, "--django", help="Update to the newest patch release of a Django series (e.g. 5.2) or an exact release."
+    ),
+    refresh: bool = typer.Option(False, "--refresh", help="Revalidate the cached Django releases with PyPI."),
+):
+    """Re-render a project against a newer Django template, touching only the files whose output changed."""
+    from dj_beat_drop.update import handle_update
+
+    if handle_update(Path(project_dir), use_lts, refresh, django_version) is False:
+        raise typer.Exit(1)
+
+
+@main_command.command()
+def warm(
+    use_lts: bool = typer.Option(False, "--lts", help="Warm the latest LTS version of Django."),
+    django_version: str | None = typer.Option(
+        None, "--django", help="Warm the newest patch release of a Django series (e.g. 5.1) or an exact release."
+    ),
+    database: str = typer.Option("sqlite", "--db", help="Database: sqlite or postgres."),
+    use_perf_preset: bool = typer.Option(False, "--perf-preset", help="Include the performance preset's packages."),
+    server: str | None = typer.Option(None, "--server", help="Include the packages of gunicorn, uvicorn or granian."),
+    python: str | None = typer.Option(
+        None, "--python", help="Lock for this Python (e.g. 3.12). By default uv picks it."
+    ),
+    refresh: bool = typer.Option(False, "--refresh", help="Revalidate the cached Django releases with PyPI."),
+):
+    """Cache the lockfile and packages of `beatdrop new` with the same options, so its uv steps are near no-ops."""
+    from dj_beat_drop.warm import handle_warm
+
+    if django_version is not None and use_lts is True:
+        raise typer.BadParameter("--django can't be combined with --lts.", param_hint="--django")
+    check_database(database, "default")
+    check_server(server)
+    if handle_warm(use_lts, refresh, django_version, database, use_perf_preset, server, python) is False:
+        raise typer.Exit(1)
+
+
+SQLITE_BENCH_PROFILES_OPTION = typer.Option(
+    None, "--sqlite-profile", help="A profile to benchmark (repeat for several). All of them by default."
+)
+
+
+@main_command.command("sqlite-bench")
+def sqlite_bench(
+    database: str = typer.Argument("db.sqlite3", help="The project's SQLite database. It's copied, never written to."),
+    profiles: list[str] | None = SQLITE_BENCH_PROFILES_OPTION,
+    readers: int = typer.Option(4, "--readers", help="Number of threads doing point lookups."),
+    writers: int = typer.Option(1, "--writers", help="Number of threads inserting rows."),
+    seconds: float = typer.Option(3.0, "--seconds", help="How long to run the workload for each profile."),
+):
+    """Run a concurrent read/write workload against a copy of the database with each SQLite profile."""
+    from dj_beat_drop.sqlite_bench import handle_sqlite_bench
+    from dj_beat_drop.sqlite_profiles import PROFILE_NAMES
+
+    check_sqlite_profiles(profiles or [])
+    if handle_sqlite_bench(Path(database), profiles or list(PROFILE_NAMES), readers, writers, seconds) is False:
+        raise typer.Exit(1)
+
+
+@cache_command.command("stats")
+def cache_stats():
+    stats = cache.get_stats()
+    print(f"Cache directory: {cache.get_cache_dir()}")
+    print(f"Hits:            {stats['hit']}")
+    print(f"Revalidated:     {stats['revalidated']}")
+    print(f"Misses:          {stats['miss']}")
+    print(f"Hit rate:        {cache.get_hit_rate(stats):.1%}")
+
+
+@cache_command.command("clear")
+def cache_clear():
+    """Remove the cached Django releases, templates, lockfiles, database snapshots and stats."""
+    cache.clear()
+    color.green("Cache cleared.")
 
 
 def main():
     color.orange(get_ascii_logo())
-    check_version()
-    main_command()
+    # The check is started by main_callback once it's known whether the command runs offline.
+    version_check = VersionCheck(daemon=True)
+    try:
+        main_command(obj=version_check)
+    finally:
+        version_check.report()
 
 
 if __name__ == "__main__":
@@ -1,53 +1,76 @@
-import os
+import asyncio
 import re
 import shutil
 import urllib.parse
+from collections.abc import Callable, Coroutine, Iterator
 from pathlib import Path
 
-from InquirerPy import inquirer
-from packaging.version import Version
-
-from dj_beat_drop import utils
+from dj_beat_drop import (
+    databases,
+    django_apps,
+    lock_cache,
+    log_config,
+    perf_preset,
+    project_manifest,
+    render,
+    servers,
+    settings_engine,
+    snapshots,
+    sqlite_profiles,
+    template_fetch,
+    timings,
+    utils,
+    uv_project,
+)
 from dj_beat_drop.utils import color
 
-EXTRA_SQLITE_PARAMS = {
-    "transaction_mode": "IMMEDIATE",
-    "init_command": (
-        "PRAGMA journal_mode = WAL;"
-        "PRAGMA synchronous = NORMAL;"
-        "PRAGMA mmap_size = 134217728;"
-        "PRAGMA journal_size_limit = 27103364;"
-        "PRAGMA cache_size = 2000"
-    ),
-}
-
-
-def rename_template_files(project_dir):
-    # Rename .py-tpl files to .py
-    for file in project_dir.rglob("*"):
-        if file.is_file() is False:
-            continue
-        if file.name.endswith(".py-tpl"):
-            os.rename(file, file.with_name(file.name[:-4]))
-
-
-def replace_sqlite_config(content: str, django_version: str) -> str:
-    if Version(django_version) < Version("5.1"):
-        return content
-
-    init_command_str = "".join(
-        [f'                 "{param};"\n' for param in EXTRA_SQLITE_PARAMS["init_command"].split(";")]
-    )
-    rtn_val = content
-    rtn_val = re.sub(
-        r"^DATABASES\s*=\s*\{.+?\}\n\}",
+PROJECT_NAME_PATTERN = re.compile(r"^[-a-z_]+$")
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+EXTRA_SQLITE_PARAMS = sqlite_profiles.get_profile_params(sqlite_profiles.DEFAULT_PROFILE)
+DOT_ENV_PATH = ".env"
+
+
+def get_sqlite_params(django_version: str, profile_params: dict[str, str] | None = None) -> dict[str, str] | None:
+    """
+    Return the SQLite ``OPTIONS`` for a Django version, or ``None`` if it doesn't support them (before 5.1).
+
+    ``profile_params`` are the options of the chosen SQLite profile, the default profile's when it's not given.
+    """
+    from packaging.version import Version
+
+    if Version(django_version) < Version(sqlite_profiles.MIN_DJANGO_VERSION):
+        return None
+    return profile_params or EXTRA_SQLITE_PARAMS
+
+
+def check_sqlite_profile(template_context: dict[str, str], sqlite_profile: str, database: str):
+    """Raise ``DjangoVersionError`` for a SQLite profile the project's Django release has no way to apply."""
+    if database != databases.SQLITE_DATABASE or sqlite_profile == sqlite_profiles.DEFAULT_PROFILE:
+        return
+    if get_sqlite_params(template_context["django_version"]) is None:
+        raise utils.DjangoVersionError(
+            f"The {sqlite_profile!r} SQLite profile needs Django {sqlite_profiles.MIN_DJANGO_VERSION} or later, "
+            f"but the project uses Django {template_context['django_version']}."
+        )
+
+
+def configure_sqlite(
+    settings: settings_engine.Settings, django_version: str, profile_params: dict[str, str] | None = None
+):
+    sqlite_params = get_sqlite_params(django_version, profile_params)
+    if sqlite_params is None:
+        return
+
+    init_command_str = "".join([f'                 "{param};"\n' for param in sqlite_params["init_command"].split(";")])
+    settings.replace_setting(
+        "DATABASES",
         (
             "DATABASES = {\n"
             "    'default': {\n"
             "        'ENGINE': 'django.db.backends.sqlite3',\n"
             "        'NAME': BASE_DIR / 'db.sqlite3',\n"
             "        'OPTIONS': {\n"
-            f"            'transaction_mode': '{EXTRA_SQLITE_PARAMS['transaction_mode']}',\n"
+            f"            'transaction_mode': '{sqlite_params['transaction_mode']}',\n"
             '             \'init_command\': (\n'
             f'{init_command_str}'
             '              )\n'
@@ -55,104 +78,452 @@ def replace_sqlite_config(content: str, django_version: str) -> str:
             "    }\n"
             "}\n"
         ),
-        rtn_val,
-        flags=re.MULTILINE | re.DOTALL,
-    )
-    return rtn_val
-
-
-def replace_settings_with_environs(content: str) -> str:
-    rtn_val = content
-    init_env = "# Initialize environs\n" "env = Env()\n" "env.read_env()"
-    rtn_val = f"from environs import Env\n\n{rtn_val}"
-    rtn_val = re.sub(r"(^BASE_DIR.+$)", rf"\1\n\n\n{init_env}", rtn_val, flags=re.MULTILINE)
-    rtn_val = re.sub(
-        r"^SECRET_KEY =.+$",
-        'SECRET_KEY = env.str("SECRET_KEY")',
-        rtn_val,
-        flags=re.MULTILINE,
-    )
-    rtn_val = re.sub(r"^DEBUG =.+$", 'DEBUG = env.bool("DEBUG")', rtn_val, flags=re.MULTILINE)
-    rtn_val = re.sub(
-        r"^ALLOWED_HOSTS = .+$",
-        'ALLOWED_HOSTS = env.list("ALLOWED_HOSTS")',
-        rtn_val,
-        flags=re.MULTILINE,
     )
-    rtn_val = re.sub(
-        r"^DATABASES\s*=\s*\{.+?\}\n\}",
-        r'DATABASES = {"default": env.dj_db_url("DATABASE_URL")}',
-        rtn_val,
-        flags=re.MULTILINE | re.DOTALL,
+
+
+def replace_sqlite_config(content: str, django_version: str, profile_params: dict[str, str] | None = None) -> str:
+    return settings_engine.rewrite(
+        content, [lambda settings: configure_sqlite(settings, django_version, profile_params)]
     )
-    return rtn_val
 
 
-def create_dot_envfile(project_dir, context: dict[str, str]):
-    env_file_path = project_dir / ".env"
+def configure_environs(settings: settings_engine.Settings, databases_setting: str = databases.ENVIRONS_DATABASES):
+    init_env = "\n\n# Initialize environs\nenv = Env()\nenv.read_env()\n"
+    settings.insert(0, "from environs import Env\n\n")
+    settings.insert(settings.get_line_end(settings.get_setting("BASE_DIR")), init_env)
+    settings.replace_setting("SECRET_KEY", 'SECRET_KEY = env.str("SECRET_KEY")')
+    settings.replace_setting("DEBUG", 'DEBUG = env.bool("DEBUG")')
+    settings.replace_setting("ALLOWED_HOSTS", 'ALLOWED_HOSTS = env.list("ALLOWED_HOSTS")')
+    settings.replace_setting("DATABASES", databases_setting)
+
+
+def replace_settings_with_environs(content: str, databases_setting: str = databases.ENVIRONS_DATABASES) -> str:
+    return settings_engine.rewrite(content, [lambda settings: configure_environs(settings, databases_setting)])
+
+
+def get_database_url(project_dir: Path, context: dict[str, str], options: dict) -> str:
+    if options.get("database") == databases.POSTGRES_DATABASE:
+        return databases.get_postgres_url(options["database_name"])
     sqlite_url = f"sqlite:///{project_dir / 'db.sqlite3'}"
-    if Version(context["django_version"]) >= Version("5.1"):
-        sqlite_url += "?" + urllib.parse.urlencode(EXTRA_SQLITE_PARAMS)
-    env_content = f"DEBUG=True\nSECRET_KEY=\"{context['secret_key']}\"\nALLOWED_HOSTS=\nDATABASE_URL={sqlite_url}\n"
+    sqlite_params = get_sqlite_params(context["django_version"], options.get("sqlite_params"))
+    if sqlite_params is not None:
+        sqlite_url += "?" + urllib.parse.urlencode(sqlite_params)
+    return sqlite_url
 
-    env_file_path.write_text(env_content)
 
+def get_dot_env(project_dir: Path, context: dict[str, str], options: dict) -> str:
+    """Return the content of ``.env``, with a SQLite ``DATABASE_URL`` pointing into ``project_dir``."""
+    database_url = get_database_url(project_dir, context, options)
+    env_content = f"DEBUG=True\nSECRET_KEY=\"{context['secret_key']}\"\nALLOWED_HOSTS=\nDATABASE_URL={database_url}\n"
+    if options.get("log_format") is not None:
+        env_content += f"{log_config.LOG_FORMAT_ENV_VAR}={options['log_format']}\n"
+    return env_content
 
-def replace_variables(project_dir, context: dict[str, str], initialize_env):
-    for file in project_dir.rglob("*"):
-        if file.is_file() is False:
-            continue
-        content = file.read_text()
-        for variable, value in context.items():
-            content = content.replace(f"{{{{ {variable} }}}}", value)
-        if str(file.relative_to(project_dir)) == "config/settings.py" and initialize_env is True:
-            content = replace_settings_with_environs(content)
-            create_dot_envfile(project_dir, context)
-        if str(file.relative_to(project_dir)) == "config/settings.py" and initialize_env is False:
-            content = replace_sqlite_config(content, context["django_version"])
-        file.write_text(content)
 
+def create_dot_envfile(target_dir: Path, project_dir: Path, context: dict[str, str], options: dict):
+    """Write ``.env`` into ``target_dir``, with a SQLite ``DATABASE_URL`` pointing into ``project_dir``."""
+    (target_dir / DOT_ENV_PATH).write_text(get_dot_env(project_dir, context, options))
 
-def create_new_project(
-    *, name: str, use_lts: bool, project_dir: Path, initialize_uv: bool, initialize_env: bool
+
+def get_settings_transform(context: dict[str, str], options: dict) -> settings_engine.SettingsTransform:
+    """Return the transform that configures the environment and database."""
+    django_version = context["django_version"]
+    # Projects created before the database option was added are all SQLite.
+    database = options.get("database", databases.SQLITE_DATABASE)
+    if options["initialize_env"] is True:
+        databases_setting = databases.get_environs_databases(database, django_version)
+        return lambda settings: configure_environs(settings, databases_setting)
+    if database == databases.POSTGRES_DATABASE:
+        return lambda settings: databases.configure_postgres(settings, django_version, options["database_name"])
+    return lambda settings: configure_sqlite(settings, django_version, options.get("sqlite_params"))
+
+
+ReleaseResolver = Callable[..., dict[str, str]]
+
+
+def resolve_template_context(
+    *,
+    use_lts: bool,
+    refresh: bool = False,
+    django_version: str | None = None,
+    resolver: ReleaseResolver | None = None,
 ) -> dict[str, str]:
-    template_context = utils.get_template_context(use_lts=use_lts)
-    minor_version = template_context["docs_version"]
-    template_dir_src = Path(__file__).parent / "templates" / minor_version
-    shutil.copytree(template_dir_src, project_dir)
-    os.rename(project_dir / "project_name", project_dir / "config")
-
-    rename_template_files(project_dir)
-    replace_variables(
-        project_dir,
+    resolver = resolver or utils.get_template_context
+    if django_version is not None:
+        return resolver(use_lts=use_lts, refresh=refresh, django_version=django_version)
+    return resolver(use_lts=use_lts, refresh=refresh)
+
+
+def get_template_dir(template_context: dict[str, str]) -> Path:
+    """Return the project template for the context's Django version, bundled with the package or fetched on demand."""
+    bundled_dir = TEMPLATES_DIR / template_context["docs_version"]
+    if bundled_dir.is_dir():
+        return bundled_dir
+    return template_fetch.fetch_template(template_context["django_version"])
+
+
+def get_project_options(
+    initialize_env: bool,
+    sqlite_profile: str = sqlite_profiles.DEFAULT_PROFILE,
+    database: str = databases.SQLITE_DATABASE,
+    project_name: str = "",
+    use_perf_preset: bool = False,
+    log_format: str = log_config.PLAIN_FORMAT,
+    server: str | None = None,
+    app_names: list[str] | None = None,
+) -> dict:
+    """
+    Return the choices that change the rendered project, as recorded in its manifest.
+
+    The SQLite profile is stored as the options it resolved to, so an ``auto`` profile renders the same on update.
+    A PostgreSQL ``database`` is named after the project directory ``project_name``. Invalid ``app_names`` raise
+    ``ValueError``.
+    """
+    django_apps.check_app_names(app_names or [])
+    options = {
+        "initialize_env": initialize_env,
+        "sqlite_params": sqlite_profiles.get_profile_params(sqlite_profile),
+        "database": database,
+        "perf_preset": use_perf_preset,
+        "log_format": log_format,
+        "server": server,
+        "apps": list(app_names or []),
+    }
+    if database == databases.POSTGRES_DATABASE:
+        options["database_name"] = databases.get_database_name(project_name)
+    return options
+
+
+def get_project_transforms(template_context: dict[str, str], options: dict) -> render.Transforms:
+    """
+    Return the transforms for the rendering ``options`` recorded in the project manifest.
+
+    Every option that changes ``settings.py`` registers a transform with the settings engine, so the file is parsed
+    once however many options are chosen.
+    """
+    initialize_env = options["initialize_env"]
+    settings_transforms = [get_settings_transform(template_context, options)]
+    if options.get("perf_preset") is True:
+        settings_transforms.append(
+            lambda settings: perf_preset.configure_perf_preset(
+                settings, template_context["docs_version"], initialize_env
+            )
+        )
+    # Projects created before logging was added have no log format and keep rendering without it.
+    if options.get("log_format") is not None:
+        settings_transforms.append(
+            lambda settings: log_config.configure_logging(
+                settings, template_context, initialize_env, options["log_format"]
+            )
+        )
+
+    if options.get("apps"):
+        settings_transforms.append(lambda settings: django_apps.configure_installed_apps(settings, options["apps"]))
+
+    transforms = {"config/settings.py": lambda content: settings_engine.rewrite(content, settings_transforms)}
+    if options.get("server") in servers.ASGI_SERVERS:
+        transforms["config/asgi.py"] = servers.replace_asgi_application
+    return transforms
+
+
+def get_project_extra_files(template_context: dict[str, str], options: dict) -> dict[str, str]:
+    """Return the generated files that aren't part of Django's project template."""
+    extra_files = {}
+    if options.get("log_format") is not None:
+        log_handlers_path = f"{render.CONFIG_DIR}/{log_config.LOG_HANDLERS_MODULE}.py"
+        extra_files[log_handlers_path] = log_config.get_log_handlers_module()
+    if options.get("server") is not None:
+        extra_files.update(servers.get_server_files(options["server"], template_context["project_name"]))
+    if options.get("apps"):
+        extra_files.update(django_apps.get_app_files(template_context, options["apps"]))
+    return extra_files
+
+
+def render_project(target_dir: Path, template_context: dict[str, str], options: dict) -> list[str]:
+    written = render.render_template(
+        get_template_dir(template_context),
+        target_dir,
         template_context,
-        initialize_env,
+        get_project_transforms(template_context, options),
+        get_project_extra_files(template_context, options),
     )
+    file_hashes = {path: project_manifest.get_file_hash(target_dir / path) for path in written}
+    project_manifest.write_project_manifest(target_dir, template_context, options, file_hashes)
+    return written
 
-    if initialize_uv is True:
-        os.chdir(project_dir)
-        os.system("uv init")  # noqa: S605, S607
-        os.system("rm hello.py")  # noqa: S605, S607
-        os.system(f"uv add django~='{minor_version}'")  # noqa: S605
-        if initialize_env is True:
-            os.system("uv add environs[django]")  # noqa: S605, S607
-        os.system("uv run manage.py migrate")  # noqa: S605, S607
 
+def print_next_steps(name: str, initialize_uv: bool, options: dict | None = None):
     color.green("New Django project created.\n")
 
+    database_name = (options or {}).get("database_name")
+    if database_name is not None:
+        color.green("To create the PostgreSQL database:\n")
+        print(f"createdb -h {databases.POSTGRES_HOST} -U {databases.POSTGRES_USER} {database_name}\n")
     if initialize_uv is True:
         color.green("To start Django's run server:\n")
         print(f"cd {name}")
+        if database_name is not None:
+            print("uv run manage.py migrate")
         print("uv run manage.py runserver")
+    server = (options or {}).get("server")
+    if initialize_uv is True and server is not None:
+        color.green(f"\nTo start {server.capitalize()} ({servers.SERVER_CONFIG_FILES[server]}):\n")
+        print(servers.SERVER_COMMANDS[server])
+
+
+def check_project_dir(project_dir: Path):
+    """Raise ``FileExistsError`` if ``project_dir`` is in the way, before any work is done. An empty directory isn't."""
+    if project_dir.exists() and (project_dir.is_dir() is False or any(project_dir.iterdir())):
+        raise FileExistsError(f"The directory '{project_dir.name}' already exists and isn't empty.")
+
+
+def prepare_staging_directory(
+    staging_dir: Path,
+    project_dir: Path,
+    template_context: dict[str, str],
+    options: dict,
+    django_version: str | None = None,
+    python: str | None = None,
+) -> list[str]:
+    """
+    Write the uv project files into ``staging_dir``, restore a cached lockfile, and return the dependencies.
+
+    The project is pinned to the Python that uv picks for ``python`` (or picks by itself) from ``project_dir``'s parent.
+    """
+    dependencies = uv_project.get_dependencies(
+        template_context,
+        options["initialize_env"],
+        django_version,
+        options["database"],
+        options["perf_preset"],
+        options["server"],
+    )
+    with timings.phase("find python"):
+        python_version = uv_project.find_python_version(python, project_dir.parent)
+    uv_project.write_project_files(staging_dir, project_dir.name, dependencies, python_version)
+    with timings.phase("restore lock"):
+        lock_cache.restore_lock(staging_dir, project_dir.name, template_context, dependencies)
+    return dependencies
+
 
+def finish_staging_directory(
+    staging_dir: Path,
+    project_dir: Path,
+    template_context: dict[str, str],
+    options: dict,
+    dependencies: list[str] | None,
+):
+    """Cache the lockfile, if the project was locked, and write ``.env`` before ``staging_dir`` is renamed."""
+    if dependencies is not None:
+        with timings.phase("save lock"):
+            lock_cache.save_lock(staging_dir, project_dir.name, template_context, dependencies)
+    if options["initialize_env"] is True:
+        create_dot_envfile(staging_dir, project_dir, template_context, options)
+
+
+def set_up_project(project_dir: Path, template_context: dict[str, str], options: dict) -> Iterator[list[str]]:
+    """
+    Install and migrate a project created with uv, yielding each command for the caller to run in ``project_dir``.
+
+    Like ``uv init``, a git repository is created unless the project is already inside one. The steps are shared by
+    ``create_new_project`` and ``create_new_project_async``, which only differ in how they run the commands.
+    """
+    if uv_project.needs_git_repository(project_dir):
+        with timings.phase("git init"):
+            yield uv_project.GIT_INIT_COMMAND
+    with timings.phase("uv sync"):
+        yield uv_project.SYNC_COMMAND
+    if options["database"] != databases.SQLITE_DATABASE:
+        return
+    sqlite_params = get_sqlite_params(template_context["django_version"], options["sqlite_params"])
+    with timings.phase("restore snapshot"):
+        restored = snapshots.restore_snapshot(project_dir, sqlite_params, options)
+    if restored is False:
+        with timings.phase("migrate"):
+            yield uv_project.MIGRATE_COMMAND
+        with timings.phase("save snapshot"):
+            snapshots.save_snapshot(project_dir, sqlite_params, options)
+
+
+def create_new_project(
+    *,
+    name: str,
+    use_lts: bool,
+    project_dir: Path,
+    initialize_uv: bool,
+    initialize_env: bool,
+    refresh: bool = False,
+    django_version: str | None = None,
+    sqlite_profile: str = sqlite_profiles.DEFAULT_PROFILE,
+    database: str = databases.SQLITE_DATABASE,
+    use_perf_preset: bool = False,
+    log_format: str = log_config.PLAIN_FORMAT,
+    server: str | None = None,
+    app_names: list[str] | None = None,
+    python: str | None = None,
+    resolver: ReleaseResolver | None = None,
+) -> dict[str, str]:
+    """
+    Create a new Django project in ``project_dir`` and return the template context it was rendered with.
+
+    No process wide state (such as the working directory) is touched, so projects can be created from several threads
+    at once. ``django_version`` pins the project to the newest ``X.Y`` patch release or an exact ``X.Y.Z`` release.
+    ``sqlite_profile`` picks the SQLite PRAGMAs (see ``sqlite_profiles.PROFILE_NAMES``), and any but the default raises
+    ``utils.DjangoVersionError`` for a release before Django 5.1, which can't apply them. A ``postgres`` ``database``
+    is configured but not created, so it isn't migrated either. ``use_perf_preset`` adds caching and compressed static
+    files (see ``perf_preset.apply_perf_preset``). Logging goes through a queue, formatted as ``log_format`` (``plain``
+    or ``json``). ``server`` (``gunicorn``, ``uvicorn`` or ``granian``) adds a config file sized from the CPU count.
+    ``app_names`` are rendered from Django's app template in-process and added to ``INSTALLED_APPS``. ``python`` is a
+    uv Python request (e.g. ``3.12``) for the version the project is pinned to; by default uv picks it as ``uv init``
+    would.
+    ``resolver`` is called with ``use_lts`` and ``refresh`` (and ``django_version`` when it's pinned) and defaults to
+    ``utils.get_template_context``. A failing uv command raises ``uv_project.CommandError`` with the command's output.
+    A ``project_dir`` that exists and isn't empty raises ``FileExistsError``.
+    """
+    check_project_dir(project_dir)
+    options = get_project_options(
+        initialize_env, sqlite_profile, database, project_dir.name, use_perf_preset, log_format, server, app_names
+    )
+    with timings.phase("resolve release"):
+        template_context = resolve_template_context(
+            use_lts=use_lts, refresh=refresh, django_version=django_version, resolver=resolver
+        )
+    check_sqlite_profile(template_context, sqlite_profile, database)
+    with render.staging_directory(project_dir) as staging_dir:
+        dependencies = None
+        lock_process = None
+        if initialize_uv is True:
+            # Resolve the dependencies while the templates are rendered.
+            dependencies = prepare_staging_directory(
+                staging_dir, project_dir, template_context, options, django_version, python
+            )
+            lock_phase = timings.phase("uv lock").start()
+            lock_process = uv_project.start_command(uv_project.LOCK_COMMAND, cwd=staging_dir)
+        try:
+            with timings.phase("render"):
+                render_project(staging_dir, template_context, options)
+        except BaseException:
+            # Stop uv before the staging directory is removed, and report the render error rather than uv's.
+            if lock_process is not None:
+                uv_project.stop_command(lock_process)
+            raise
+        if lock_process is not None:
+            uv_project.wait_command(lock_process)
+            lock_phase.stop()
+        finish_staging_directory(staging_dir, project_dir, template_context, options, dependencies)
+
+    if initialize_uv is True:
+        for command in set_up_project(project_dir, template_context, options):
+            uv_project.run_command(command, cwd=project_dir)
+
+    print_next_steps(name, initialize_uv, options)
     return template_context
 
 
-def handle_new(name: str, use_lts: bool, overwrite_target_dir: bool) -> None:
+async def run_alongside_render(lock: Coroutine, render_files: Coroutine):
+    """
+    Run ``lock`` and ``render_files`` concurrently and return once both have stopped.
+
+    The render thread can't be interrupted, so if locking fails it's waited for rather than left writing to a staging
+    directory that is being removed. If rendering fails, the lock is cancelled, which kills uv, and the render error is
+    raised rather than uv's, as ``create_new_project`` does.
+    """
+    lock_task = asyncio.create_task(lock)
+    render_task = asyncio.create_task(render_files)
+    try:
+        done, _ = await asyncio.wait([lock_task, render_task], return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        # A no-op when the lock has finished. Both are still waited for when this task itself is cancelled.
+        lock_task.cancel()
+        await asyncio.wait([lock_task, render_task])
+    if render_task.exception() is not None:
+        raise render_task.exception()
+    if lock_task in done and lock_task.exception() is not None:
+        raise lock_task.exception()
+
+
+async def create_new_project_async(
+    *,
+    name: str,
+    use_lts: bool,
+    project_dir: Path,
+    initialize_uv: bool,
+    initialize_env: bool,
+    refresh: bool = False,
+    django_version: str | None = None,
+    sqlite_profile: str = sqlite_profiles.DEFAULT_PROFILE,
+    database: str = databases.SQLITE_DATABASE,
+    use_perf_preset: bool = False,
+    log_format: str = log_config.PLAIN_FORMAT,
+    server: str | None = None,
+    app_names: list[str] | None = None,
+    python: str | None = None,
+    resolver: ReleaseResolver | None = None,
+) -> dict[str, str]:
+    """Asyncio version of ``create_new_project`` that doesn't block the event loop."""
+    check_project_dir(project_dir)
+    options = get_project_options(
+        initialize_env, sqlite_profile, database, project_dir.name, use_perf_preset, log_format, server, app_names
+    )
+    with timings.phase("resolve release"):
+        template_context = await asyncio.to_thread(
+            resolve_template_context,
+            use_lts=use_lts,
+            refresh=refresh,
+            django_version=django_version,
+            resolver=resolver,
+        )
+    check_sqlite_profile(template_context, sqlite_profile, database)
+
+    async def lock_dependencies(staging_dir: Path):
+        with timings.phase("uv lock"):
+            await uv_project.run_command_async(uv_project.LOCK_COMMAND, cwd=staging_dir)
+
+    async def render_files(staging_dir: Path):
+        with timings.phase("render"):
+            await asyncio.to_thread(render_project, staging_dir, template_context, options)
+
+    with render.staging_directory(project_dir) as staging_dir:
+        dependencies = None
+        if initialize_uv is True:
+            dependencies = await asyncio.to_thread(
+                prepare_staging_directory, staging_dir, project_dir, template_context, options, django_version, python
+            )
+            await run_alongside_render(lock_dependencies(staging_dir), render_files(staging_dir))
+        else:
+            await render_files(staging_dir)
+        finish_staging_directory(staging_dir, project_dir, template_context, options, dependencies)
+
+    if initialize_uv is True:
+        # Advance the steps in a thread so copying the database snapshot doesn't block the event loop either.
+        steps = set_up_project(project_dir, template_context, options)
+        while (command := await asyncio.to_thread(next, steps, None)) is not None:
+            await uv_project.run_command_async(command, cwd=project_dir)
+
+    print_next_steps(name, initialize_uv, options)
+    return template_context
+
+
+def handle_new(
+    name: str,
+    use_lts: bool,
+    overwrite_target_dir: bool,
+    refresh: bool = False,
+    django_version: str | None = None,
+    sqlite_profile: str = sqlite_profiles.DEFAULT_PROFILE,
+    database: str = databases.SQLITE_DATABASE,
+    use_perf_preset: bool = False,
+    log_format: str = log_config.PLAIN_FORMAT,
+    server: str | None = None,
+    app_names: list[str] | None = None,
+    python: str | None = None,
+) -> None:
+    from InquirerPy import inquirer
+
     if name is None:
         name = inquirer.text("Project name:").execute()
 
-    if re.match(r"^[-a-z_]+$", name) is None:
+    if PROJECT_NAME_PATTERN.match(name) is None:
         color.red("Invalid project name. Please use only lowercase letters, hyphens, and underscores.")
         return
     project_dir = Path.cwd() / name
@@ -173,12 +544,24 @@ def handle_new(name: str, use_lts: bool, overwrite_target_dir: bool) -> None:
         message="Initialize your project with an .env file and environs?", default=True
     ).execute()
 
-    create_new_project(
-        **{
-            "name": name,
-            "use_lts": use_lts,
-            "project_dir": project_dir,
-            "initialize_uv": initialize_uv,
-            "initialize_env": initialize_env,
-        }
-    )
+    try:
+        create_new_project(
+            **{
+                "name": name,
+                "use_lts": use_lts,
+                "project_dir": project_dir,
+                "initialize_uv": initialize_uv,
+                "initialize_env": initialize_env,
+                "refresh": refresh,
+                "django_version": django_version,
+                "sqlite_profile": sqlite_profile,
+                "database": database,
+                "use_perf_preset": use_perf_preset,
+                "log_format": log_format,
+                "server": server,
+                "app_names": app_names,
+                "python": python,
+            }
+        )
+    except (uv_project.CommandError, utils.DjangoVersionError) as e:
+        color.red(str(e))
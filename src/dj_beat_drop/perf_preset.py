@@ -0,0 +1,100 @@
+import ast
+
+from dj_beat_drop import settings_engine
+
+# WhiteNoise serves the static files and provides CompressedManifestStaticFilesStorage, which writes gzip and Brotli
+# copies of each hashed file at collectstatic time. Django's RedisCache, used when REDIS_URL is set, needs redis.
+DEPENDENCIES = ["whitenoise", "redis"]
+REDIS_URL_ENV_VAR = "REDIS_URL"
+SECURITY_MIDDLEWARE = "django.middleware.security.SecurityMiddleware"
+WHITENOISE_MIDDLEWARE = "whitenoise.middleware.WhiteNoiseMiddleware"
+
+CACHES_SETTING = (
+    "CACHES = {{\n"
+    "    'default': {{\n"
+    "        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',\n"
+    "    }}\n"
+    "}}\n"
+    "if {redis_url}:\n"
+    "    CACHES['default'] = {{\n"
+    "        'BACKEND': 'django.core.cache.backends.redis.RedisCache',\n"
+    "        'LOCATION': {redis_url},\n"
+    "    }}\n"
+)
+ENVIRONS_REDIS_URL = f'env.str("{REDIS_URL_ENV_VAR}", "")'
+OS_REDIS_URL = f"os.environ.get('{REDIS_URL_ENV_VAR}')"
+CACHE_SETTINGS = (
+    "# Cache\n"
+    "# https://docs.djangoproject.com/en/{docs_version}/topics/cache/\n"
+    "# Local memory by default, Redis when REDIS_URL is set.\n"
+    "\n"
+    "{caches}"
+    "\n"
+    "# Sessions are read from the cache and written through to the database.\n"
+    "SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'\n"
+    "\n\n"
+)
+TEMPLATE_LOADERS = (
+    "            'loaders': [\n"
+    "                (\n"
+    "                    'django.template.loaders.cached.Loader',\n"
+    "                    [\n"
+    "                        'django.template.loaders.filesystem.Loader',\n"
+    "                        'django.template.loaders.app_directories.Loader',\n"
+    "                    ],\n"
+    "                ),\n"
+    "            ],\n"
+)
+STATIC_FILES_SETTINGS = (
+    "STATIC_ROOT = BASE_DIR / 'staticfiles'\n"
+    "\n"
+    "STORAGES = {\n"
+    "    'default': {\n"
+    "        'BACKEND': 'django.core.files.storage.FileSystemStorage',\n"
+    "    },\n"
+    "    'staticfiles': {\n"
+    "        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',\n"
+    "    },\n"
+    "}\n"
+)
+
+
+def get_cache_settings(docs_version: str, initialize_env: bool) -> str:
+    redis_url = ENVIRONS_REDIS_URL if initialize_env is True else OS_REDIS_URL
+    caches = CACHES_SETTING.format(redis_url=redis_url)
+    return CACHE_SETTINGS.format(docs_version=docs_version, caches=caches)
+
+
+def configure_templates(settings: settings_engine.Settings):
+    """Turn ``APP_DIRS`` off and list the cached template loaders first in ``OPTIONS``, since Django allows only one."""
+    templates = settings.get_setting("TEMPLATES").value
+    if not isinstance(templates, ast.List) or not templates.elts:
+        raise settings_engine.SettingsTransformError("settings.py has no template engine in TEMPLATES.")
+    engine = templates.elts[0]
+    settings.replace(settings.get_dict_value(engine, "APP_DIRS"), "False")
+    options = settings.get_dict_value(engine, "OPTIONS")
+    if not isinstance(options, ast.Dict) or not options.keys:
+        raise settings_engine.SettingsTransformError("settings.py has no template OPTIONS to add the loaders to.")
+    settings.insert(settings.get_line_start(options.keys[0]), TEMPLATE_LOADERS)
+
+
+def configure_perf_preset(settings: settings_engine.Settings, docs_version: str, initialize_env: bool):
+    """
+    Configure a cache backend, cached sessions, cached template loaders and compressed manifest static files.
+
+    ``initialize_env`` reads ``REDIS_URL`` with environs instead of ``os.environ``.
+    """
+    if initialize_env is False:
+        settings.insert(settings.get_line_start(settings.get_import("pathlib")), "import os\n")
+    # WhiteNoise goes directly after SecurityMiddleware, so static files skip the rest of the middleware.
+    security_middleware = settings.get_list_item(settings.get_setting("MIDDLEWARE").value, SECURITY_MIDDLEWARE)
+    settings.insert(settings.get_line_end(security_middleware), f"    '{WHITENOISE_MIDDLEWARE}',\n")
+    configure_templates(settings)
+    settings.insert(settings.get_comment("# Password validation"), get_cache_settings(docs_version, initialize_env))
+    settings.insert(settings.get_line_end(settings.get_setting("STATIC_URL")), STATIC_FILES_SETTINGS)
+
+
+def apply_perf_preset(content: str, docs_version: str, initialize_env: bool) -> str:
+    return settings_engine.rewrite(
+        content, [lambda settings: configure_perf_preset(settings, docs_version, initialize_env)]
+    )
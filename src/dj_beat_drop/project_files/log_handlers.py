@@ -0,0 +1,54 @@
+"""
+Logging that keeps log I/O off the request thread.
+
+``LOGGING`` in settings.py sends records to ``QueueStreamHandler``, which only puts them on a queue. A
+``QueueListener`` thread takes them off the queue and writes them to stderr, so a slow or blocked stream never adds
+latency to a request.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+
+
+class QueueStreamHandler(logging.handlers.QueueHandler):
+    """
+    Queue records for a background thread that writes them to ``stream`` (stderr by default).
+
+    Configure it with ``'()'`` rather than ``'class'``, since Python 3.12+ builds its own listener for a ``'class'``
+    that is a ``QueueHandler``.
+    """
+
+    def __init__(self, stream=None):
+        """Start the listener thread that writes the queued records."""
+        super().__init__(queue.SimpleQueue())
+        self.listener = logging.handlers.QueueListener(self.queue, logging.StreamHandler(stream))
+        self.listener.start()
+        atexit.register(self.close)
+
+    def close(self):
+        """Write the records still on the queue and stop the listener thread."""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+        super().close()
+
+
+class JSONFormatter(logging.Formatter):
+    """Format each record as a single line of JSON."""
+
+    def format(self, record):
+        """Return the record's time, level, logger and message (and traceback, if any) as JSON."""
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
@@ -0,0 +1,62 @@
+import hashlib
+import json
+from pathlib import Path
+
+MANIFEST_FILE_NAME = ".beatdrop.json"
+MANIFEST_FORMAT_VERSION = 1
+
+
+class ProjectManifestError(Exception):
+    pass
+
+
+def get_content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def get_file_hash(path: Path) -> str | None:
+    try:
+        return get_content_hash(path.read_text())
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def get_manifest_context(template_context: dict[str, str], initialize_env: bool) -> dict[str, str]:
+    # With environs the secret key only lives in .env, so it's kept out of a file that gets committed.
+    if initialize_env is True:
+        return {key: value for key, value in template_context.items() if key != "secret_key"}
+    return dict(template_context)
+
+
+def write_project_manifest(
+    project_dir: Path, template_context: dict[str, str], options: dict, file_hashes: dict[str, str]
+) -> dict:
+    """
+    Record what the project was generated from, and the hash of every generated file, in ``.beatdrop.json``.
+
+    ``options`` are the choices that change the rendered output (such as ``initialize_env``) and ``file_hashes`` maps
+    each generated path to the hash of the content written, so ``beatdrop update`` can tell which files were edited.
+    """
+    manifest = {
+        "format": MANIFEST_FORMAT_VERSION,
+        "context": get_manifest_context(template_context, options.get("initialize_env", False)),
+        "options": options,
+        "files": dict(sorted(file_hashes.items())),
+    }
+    (project_dir / MANIFEST_FILE_NAME).write_text(json.dumps(manifest, indent=2) + "\n")
+    return manifest
+
+
+def read_project_manifest(project_dir: Path) -> dict:
+    manifest_path = project_dir / MANIFEST_FILE_NAME
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except FileNotFoundError as e:
+        raise ProjectManifestError(
+            f"No {MANIFEST_FILE_NAME} found in {project_dir}. Only projects created by beatdrop can be updated."
+        ) from e
+    except (OSError, ValueError) as e:
+        raise ProjectManifestError(f"Unable to read {manifest_path}: {e}") from e
+    if manifest.get("format") != MANIFEST_FORMAT_VERSION:
+        raise ProjectManifestError(f"Unsupported {MANIFEST_FILE_NAME} format in {project_dir}.")
+    return manifest
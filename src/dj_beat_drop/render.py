@@ -0,0 +1,143 @@
+import json
+import os
+import re
+import secrets
+import shutil
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+VARIABLE_PATTERN = re.compile(r"\{\{ (\w+) \}\}")
+TEMPLATE_SUFFIX = ".py-tpl"
+PROJECT_NAME_DIR = "project_name"
+CONFIG_DIR = "config"
+BUNDLE_SUFFIX = ".bundle.json"
+BUNDLE_FORMAT_VERSION = 1
+
+Transforms = dict[str, Callable[[str], str]]
+
+
+def render_string(content: str, context: dict[str, str]) -> str:
+    """Substitute every ``{{ variable }}`` placeholder in one pass, keeping placeholders missing from the context."""
+    return VARIABLE_PATTERN.sub(lambda match: context.get(match.group(1), match.group(0)), content)
+
+
+def get_target_path(relative_path: str) -> str:
+    """Map a template path (e.g. ``project_name/settings.py-tpl``) to its path in the new project."""
+    parts = relative_path.split("/")
+    if parts[0] == PROJECT_NAME_DIR:
+        parts[0] = CONFIG_DIR
+    if parts[-1].endswith(TEMPLATE_SUFFIX):
+        parts[-1] = parts[-1][:-4]
+    return "/".join(parts)
+
+
+@contextmanager
+def staging_directory(project_dir: Path) -> Iterator[Path]:
+    """
+    Yield a sibling directory to build the project in and rename it to ``project_dir`` once everything is written.
+
+    The rename is atomic, so ``project_dir`` either doesn't exist or is complete. If anything fails, the rename
+    included, the staging directory is removed.
+    """
+    staging_dir = project_dir.with_name(f".{project_dir.name}.{secrets.token_hex(4)}.tmp")
+    staging_dir.mkdir()
+    try:
+        yield staging_dir
+        os.rename(staging_dir, project_dir)
+    except BaseException:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+
+
+def compile_template(template_dir: Path) -> dict:
+    """
+    Compile a template tree into a bundle of target paths and pre-split segments.
+
+    Each file's segments alternate between static text (even indexes) and placeholder names (odd indexes), so
+    rendering is a single join.
+    """
+    if template_dir.is_dir() is False:
+        raise FileNotFoundError(f"No project template found at {template_dir}.")
+    files = []
+    for dirpath, _, filenames in os.walk(template_dir):
+        for filename in filenames:
+            source = Path(dirpath) / filename
+            relative_path = get_target_path(source.relative_to(template_dir).as_posix())
+            files.append([relative_path, VARIABLE_PATTERN.split(source.read_text())])
+    return {"format": BUNDLE_FORMAT_VERSION, "files": sorted(files)}
+
+
+def get_bundle_path(template_dir: Path) -> Path:
+    return template_dir.with_name(f"{template_dir.name}{BUNDLE_SUFFIX}")
+
+
+def write_bundle(template_dir: Path) -> Path:
+    bundle_path = get_bundle_path(template_dir)
+    bundle_path.write_text(json.dumps(compile_template(template_dir), indent=1) + "\n")
+    return bundle_path
+
+
+def load_template(template_dir: Path) -> dict:
+    """Return the compiled template, from its packaged bundle when there is one or from the loose files otherwise."""
+    try:
+        bundle = json.loads(get_bundle_path(template_dir).read_bytes())
+    except FileNotFoundError:
+        return compile_template(template_dir)
+    if bundle.get("format") != BUNDLE_FORMAT_VERSION:
+        return compile_template(template_dir)
+    return bundle
+
+
+def render_segments(segments: list[str], context: dict[str, str]) -> str:
+    return "".join(
+        segment if index % 2 == 0 else context.get(segment, f"{{{{ {segment} }}}}")
+        for index, segment in enumerate(segments)
+    )
+
+
+def render_files(
+    template_dir: Path,
+    context: dict[str, str],
+    transforms: Transforms | None = None,
+    extra_files: dict[str, str] | None = None,
+) -> dict[str, str]:
+    """
+    Render the template in ``template_dir`` in memory and return each target path with its content.
+
+    ``extra_files`` are generated files that aren't part of the template, added as they are.
+    """
+    transforms = transforms or {}
+    files = {}
+    for relative_path, segments in load_template(template_dir)["files"]:
+        content = render_segments(segments, context)
+        if relative_path in transforms:
+            content = transforms[relative_path](content)
+        files[relative_path] = content
+    files.update(extra_files or {})
+    return files
+
+
+def render_template(
+    template_dir: Path,
+    target_dir: Path,
+    context: dict[str, str],
+    transforms: Transforms | None = None,
+    extra_files: dict[str, str] | None = None,
+) -> list[str]:
+    """
+    Render the template in ``template_dir`` into ``target_dir`` and return the relative paths written.
+
+    The template is loaded from its precompiled bundle, each file is rendered in memory, passed through the transform
+    registered for its target path (if any), and written once under its final name.
+    """
+    created_dirs = {target_dir}
+    written = []
+    for relative_path, content in render_files(template_dir, context, transforms, extra_files).items():
+        target = target_dir / relative_path
+        if target.parent not in created_dirs:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(target.parent)
+        target.write_text(content)
+        written.append(relative_path)
+    return written
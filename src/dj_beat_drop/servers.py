@@ -0,0 +1,148 @@
+import re
+
+GUNICORN = "gunicorn"
+UVICORN = "uvicorn"
+GRANIAN = "granian"
+SERVERS = (GUNICORN, UVICORN, GRANIAN)
+ASGI_SERVERS = (UVICORN, GRANIAN)
+# Uvicorn runs as Gunicorn workers, which adds process management and max-requests recycling that Uvicorn lacks.
+SERVER_DEPENDENCIES = {
+    GUNICORN: ["gunicorn"],
+    UVICORN: ["gunicorn", "uvicorn-worker", "uvicorn[standard]"],
+    GRANIAN: ["granian"],
+}
+SERVER_CONFIG_FILES = {GUNICORN: "gunicorn.conf.py", UVICORN: "gunicorn.conf.py", GRANIAN: "serve.py"}
+SERVER_COMMANDS = {GUNICORN: "uv run gunicorn", UVICORN: "uv run gunicorn", GRANIAN: "uv run serve.py"}
+
+CPU_COUNT = (
+    "# The CPUs this process may run on, which can be fewer than the machine has (e.g. with taskset or cpusets).\n"
+    "try:\n"
+    "    cpu_count = len(os.sched_getaffinity(0))\n"
+    "except AttributeError:\n"
+    "    cpu_count = os.cpu_count() or 1\n"
+)
+GUNICORN_CONFIG = (
+    '"""\n'
+    "Gunicorn settings, sized from the CPU count of the machine the server starts on.\n"
+    "\n"
+    "Start the server with ``uv run gunicorn``, which loads this file from the working directory. ``WEB_CONCURRENCY``\n"
+    "and ``BIND`` override the number of workers and the address, and any setting can be overridden on the command\n"
+    "line.\n"
+    '"""\n'
+    "\n"
+    "import os\n"
+    "\n"
+    "{cpu_count}"
+    "\n"
+    "wsgi_app = '{app}'\n"
+    "bind = os.environ.get('BIND', '0.0.0.0:8000')\n"
+    "{workers}"
+    "# Keep-alive connections stay open between requests, so keep them short when there are few workers to hold them.\n"
+    "keepalive = 2 if workers * threads <= 4 else 5\n"
+    "\n"
+    "# Restart each worker after a number of requests to contain memory leaks. The jitter grows with the number of\n"
+    "# workers so they don't restart at the same time.\n"
+    "max_requests = 1000\n"
+    "max_requests_jitter = min(max_requests // 2, 50 * workers)\n"
+)
+GUNICORN_WORKERS = (
+    "# Sync code: two processes per CPU (plus one) to cover I/O waits, each with a few threads.\n"
+    "workers = int(os.environ.get('WEB_CONCURRENCY', cpu_count * 2 + 1))\n"
+    "threads = 2 if cpu_count > 1 else 4\n"
+)
+UVICORN_WORKERS = (
+    "# An event loop per CPU. Blocking work runs in each loop's thread pool, so Gunicorn threads aren't used.\n"
+    "worker_class = 'uvicorn_worker.UvicornWorker'\n"
+    "workers = int(os.environ.get('WEB_CONCURRENCY', cpu_count))\n"
+    "threads = 1\n"
+)
+GRANIAN_CONFIG = (
+    '"""\n'
+    "Start Granian with settings sized from the CPU count of the machine it starts on.\n"
+    "\n"
+    "Run it with ``uv run serve.py``. ``WEB_CONCURRENCY`` overrides the number of workers, and ``HOST`` and ``PORT``\n"
+    "the address.\n"
+    '"""\n'
+    "\n"
+    "import os\n"
+    "import random\n"
+    "\n"
+    "from granian import Granian\n"
+    "from granian.constants import Interfaces\n"
+    "from granian.http import HTTP1Settings\n"
+    "\n"
+    "{cpu_count}"
+    "\n"
+    "# An event loop per CPU, each with its own Rust runtime thread.\n"
+    "workers = int(os.environ.get('WEB_CONCURRENCY', cpu_count))\n"
+    "runtime_threads = 1 if cpu_count > 1 else 2\n"
+    "# Granian can't restart workers after a number of requests, so they're restarted after an hour instead, with a\n"
+    "# jitter that grows with the number of workers so they don't restart at the same time.\n"
+    "workers_lifetime = 3600 + random.randint(0, min(1800, 60 * workers))\n"
+    "\n"
+    "if __name__ == '__main__':\n"
+    "    Granian(\n"
+    "        '{app}',\n"
+    "        address=os.environ.get('HOST', '0.0.0.0'),\n"
+    "        port=int(os.environ.get('PORT', 8000)),\n"
+    "        interface=Interfaces.ASGI,\n"
+    "        workers=workers,\n"
+    "        runtime_threads=runtime_threads,\n"
+    "        http1_settings=HTTP1Settings(keep_alive=True),\n"
+    "        workers_lifetime=workers_lifetime,\n"
+    "        respawn_failed_workers=True,\n"
+    "    ).serve()\n"
+)
+ASGI_APPLICATION = (
+    "django_application = get_asgi_application()\n"
+    "\n"
+    "\n"
+    "async def application(scope, receive, send):\n"
+    '    """\n'
+    "    Serve Django, answering the server's lifespan events (which Django doesn't handle) itself.\n"
+    "\n"
+    "    Add startup and shutdown work (e.g. opening and closing clients) next to the messages it belongs to.\n"
+    '    """\n'
+    "    if scope['type'] != 'lifespan':\n"
+    "        await django_application(scope, receive, send)\n"
+    "        return\n"
+    "    while True:\n"
+    "        message = await receive()\n"
+    "        if message['type'] == 'lifespan.startup':\n"
+    "            await send({'type': 'lifespan.startup.complete'})\n"
+    "        elif message['type'] == 'lifespan.shutdown':\n"
+    "            await send({'type': 'lifespan.shutdown.complete'})\n"
+    "            return\n"
+)
+
+
+def check_server(server: str):
+    if server not in SERVERS:
+        raise ValueError(f"Unknown server {server!r}. Choose one of {', '.join(SERVERS)}.")
+
+
+def get_server_config(server: str, project_name: str) -> str:
+    """Return the server's config file for a project, which sizes the server from the CPU count when it starts."""
+    check_server(server)
+    if server == GRANIAN:
+        return GRANIAN_CONFIG.format(cpu_count=CPU_COUNT, app=f"{project_name}.asgi:application")
+    if server == UVICORN:
+        return GUNICORN_CONFIG.format(
+            cpu_count=CPU_COUNT, app=f"{project_name}.asgi:application", workers=UVICORN_WORKERS
+        )
+    return GUNICORN_CONFIG.format(cpu_count=CPU_COUNT, app=f"{project_name}.wsgi:application", workers=GUNICORN_WORKERS)
+
+
+def get_server_files(server: str, project_name: str) -> dict[str, str]:
+    config = get_server_config(server, project_name)
+    return {SERVER_CONFIG_FILES[server]: config}
+
+
+def replace_asgi_application(content: str) -> str:
+    """Wrap the ASGI application in ``asgi.py`` so it answers lifespan events, which ASGI servers send on start."""
+    new_content, count = re.subn(
+        r"^application = get_asgi_application\(\)\n", lambda match: ASGI_APPLICATION, content, flags=re.MULTILINE
+    )
+    if count != 1:
+        raise ValueError("Can't find the ASGI application in asgi.py.")
+    return new_content
@@ -0,0 +1,154 @@
+import ast
+from collections.abc import Callable, Iterable
+
+
+class SettingsTransformError(ValueError):
+    """Raised when ``settings.py`` doesn't have the shape a transform expects."""
+
+
+class Settings:
+    """
+    A ``settings.py`` parsed once, collecting the edits of any number of transforms and applying them in one pass.
+
+    Edits are made to spans of the original source, so everything no transform touches (comments, quoting, blank
+    lines) is kept byte for byte. Looking up a setting, import, list item, dictionary key or comment that isn't there
+    raises ``SettingsTransformError``, as does a transform editing text another transform already replaced.
+    """
+
+    def __init__(self, source: str):
+        """Parse ``source`` and index its top-level settings and imports."""
+        self.source = source
+        try:
+            module = ast.parse(source)
+        except SyntaxError as e:
+            raise SettingsTransformError(f"settings.py isn't valid Python: {e}") from e
+        self.lines = source.splitlines(keepends=True)
+        self.line_offsets = [0]
+        for line in self.lines:
+            self.line_offsets.append(self.line_offsets[-1] + len(line))
+        self.statements = module.body
+        self.assignments: dict[str, ast.Assign] = {}
+        self.imports: dict[str, ast.stmt] = {}
+        for node in module.body:
+            if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                self.assignments.setdefault(node.targets[0].id, node)
+            elif isinstance(node, ast.ImportFrom) and node.module is not None:
+                self.imports.setdefault(node.module, node)
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    self.imports.setdefault(alias.name, node)
+        self.comments: dict[str, int] | None = None
+        self.edits: list[tuple[int, int, int, str]] = []
+
+    def get_offset(self, lineno: int, col_offset: int) -> int:
+        # ast columns count UTF-8 bytes, not characters.
+        line = self.lines[lineno - 1]
+        return self.line_offsets[lineno - 1] + len(line.encode()[:col_offset].decode())
+
+    def get_start(self, node: ast.AST) -> int:
+        return self.get_offset(node.lineno, node.col_offset)
+
+    def get_end(self, node: ast.AST) -> int:
+        return self.get_offset(node.end_lineno, node.end_col_offset)
+
+    def get_line_start(self, node: ast.AST) -> int:
+        return self.line_offsets[node.lineno - 1]
+
+    def get_line_end(self, node: ast.AST) -> int:
+        """Return the offset just past the newline that ends ``node``'s last line."""
+        return self.line_offsets[node.end_lineno]
+
+    def get_setting(self, name: str) -> ast.Assign:
+        try:
+            return self.assignments[name]
+        except KeyError:
+            raise SettingsTransformError(f"settings.py has no {name} setting.") from None
+
+    def get_import(self, module: str) -> ast.stmt:
+        try:
+            return self.imports[module]
+        except KeyError:
+            raise SettingsTransformError(f"settings.py doesn't import {module}.") from None
+
+    def index_comments(self) -> dict[str, int]:
+        """
+        Index the whole-line comments between top-level statements, where settings files put their section headings.
+
+        Comments aren't in the syntax tree, but a line starting with ``#`` outside every statement can only be one,
+        so this doesn't need to tokenize the file again.
+        """
+        comments = {}
+        lineno = 1
+        for node in [*self.statements, None]:
+            gap_end = node.lineno if node is not None else len(self.lines) + 1
+            for comment_lineno in range(lineno, gap_end):
+                line = self.lines[comment_lineno - 1].rstrip("\r\n")
+                if line.startswith("#"):
+                    comments.setdefault(line, self.line_offsets[comment_lineno - 1])
+            if node is not None:
+                lineno = node.end_lineno + 1
+        return comments
+
+    def get_comment(self, comment: str) -> int:
+        """Return the offset of the line with the whole-line ``comment`` (e.g. ``# Password validation``)."""
+        if self.comments is None:
+            self.comments = self.index_comments()
+        try:
+            return self.comments[comment]
+        except KeyError:
+            raise SettingsTransformError(f"settings.py has no {comment!r} comment.") from None
+
+    def get_list_item(self, node: ast.AST, value: str) -> ast.expr:
+        if isinstance(node, ast.List):
+            for item in node.elts:
+                if isinstance(item, ast.Constant) and item.value == value:
+                    return item
+        raise SettingsTransformError(f"settings.py has no {value!r} list item on line {node.lineno}.")
+
+    def get_dict_value(self, node: ast.AST, key: str) -> ast.expr:
+        if isinstance(node, ast.Dict):
+            for dict_key, dict_value in zip(node.keys, node.values, strict=True):
+                if isinstance(dict_key, ast.Constant) and dict_key.value == key:
+                    return dict_value
+        raise SettingsTransformError(f"settings.py has no {key!r} key on line {node.lineno}.")
+
+    def replace_span(self, start: int, end: int, text: str):
+        self.edits.append((start, end, len(self.edits), text))
+
+    def insert(self, offset: int, text: str):
+        self.replace_span(offset, offset, text)
+
+    def replace(self, node: ast.AST, text: str):
+        self.replace_span(self.get_start(node), self.get_end(node), text)
+
+    def replace_setting(self, name: str, text: str):
+        self.replace(self.get_setting(name), text)
+
+    def append(self, text: str):
+        """Add ``text`` after the last line of the file, replacing its trailing newlines."""
+        content_end = len(self.source.rstrip("\n"))
+        self.replace_span(content_end, len(self.source), "\n" + text)
+
+    def render(self) -> str:
+        """Apply every edit in one pass over the source. Insertions at one offset keep the order they were made in."""
+        parts = []
+        position = 0
+        for start, end, _, text in sorted(self.edits):
+            if start < position:
+                raise SettingsTransformError(f"Two settings transforms edit the same text at offset {start}.")
+            parts.append(self.source[position:start])
+            parts.append(text)
+            position = end
+        parts.append(self.source[position:])
+        return "".join(parts)
+
+
+SettingsTransform = Callable[[Settings], None]
+
+
+def rewrite(source: str, transforms: Iterable[SettingsTransform]) -> str:
+    """Parse ``source`` once, let each transform record its edits and return the rewritten settings."""
+    settings = Settings(source)
+    for transform in transforms:
+        transform(settings)
+    return settings.render()
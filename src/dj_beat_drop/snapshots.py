@@ -0,0 +1,101 @@
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from dj_beat_drop import cache, utils
+
+DATABASE_FILE_NAME = "db.sqlite3"
+SNAPSHOT_FORMAT_VERSION = 2
+# The project options that change INSTALLED_APPS or the settings the migrations run with.
+MIGRATION_OPTIONS = ("apps", "perf_preset")
+
+
+def get_snapshot_dir() -> Path:
+    return cache.get_cache_dir() / "snapshots"
+
+
+def get_locked_packages(project_dir: Path) -> dict[str, str] | None:
+    """Return the version of every package pinned in the project's ``uv.lock``, except the project itself."""
+    try:
+        lock = utils.load_toml((project_dir / "uv.lock").read_text())
+    except (OSError, ValueError):
+        return None
+    return {
+        package["name"]: package.get("version")
+        for package in lock.get("package", [])
+        if "virtual" not in package.get("source", {}) and "editable" not in package.get("source", {})
+    }
+
+
+def get_snapshot_path(project_dir: Path, sqlite_params: dict[str, str] | None, options: dict) -> Path | None:
+    """
+    Return where the migrated database for this project is cached, or ``None`` if it can't be keyed.
+
+    Snapshots are keyed by every package version installed in the project (any of them can ship migrations), the
+    SQLite options and the project ``options`` in ``MIGRATION_OPTIONS``, so a new release, different PRAGMAs or other
+    installed apps never reuse a stale snapshot.
+    """
+    packages = get_locked_packages(project_dir)
+    if packages is None or packages.get("django") is None:
+        return None
+    migration_options = {name: options.get(name) for name in MIGRATION_OPTIONS}
+    params_key = json.dumps([SNAPSHOT_FORMAT_VERSION, sqlite_params, migration_options, packages], sort_keys=True)
+    params_hash = hashlib.sha256(params_key.encode()).hexdigest()[:12]
+    return get_snapshot_dir() / f"django-{packages['django']}-{params_hash}.sqlite3"
+
+
+def has_migrations(connection: sqlite3.Connection) -> bool:
+    try:
+        return connection.execute("SELECT COUNT(*) FROM django_migrations").fetchone()[0] > 0
+    except sqlite3.Error:
+        return False
+
+
+def is_migrated_snapshot(snapshot_path: Path) -> bool:
+    if snapshot_path.exists() is False:
+        return False
+    # Snapshots are never written in place, so open them as immutable to avoid creating -wal/-shm files in the cache.
+    with contextlib.closing(sqlite3.connect(f"file:{snapshot_path}?immutable=1", uri=True)) as connection:
+        return has_migrations(connection)
+
+
+def restore_snapshot(project_dir: Path, sqlite_params: dict[str, str] | None, options: dict) -> bool:
+    """Copy a cached migrated database into the project and return whether there was one to copy."""
+    snapshot_path = get_snapshot_path(project_dir, sqlite_params, options)
+    if snapshot_path is None or is_migrated_snapshot(snapshot_path) is False:
+        return False
+    shutil.copyfile(snapshot_path, project_dir / DATABASE_FILE_NAME)
+    return True
+
+
+def save_snapshot(project_dir: Path, sqlite_params: dict[str, str] | None, options: dict) -> Path | None:
+    """Cache the project's freshly migrated database so the next project with the same key can skip `migrate`."""
+    snapshot_path = get_snapshot_path(project_dir, sqlite_params, options)
+    database_path = project_dir / DATABASE_FILE_NAME
+    if snapshot_path is None or database_path.exists() is False:
+        return None
+
+    with contextlib.closing(sqlite3.connect(database_path)) as connection:
+        if has_migrations(connection) is False:
+            return None
+        # journal_mode is stored in the database file, so the snapshot is already in WAL mode when it is copied.
+        if sqlite_params is not None:
+            connection.executescript(sqlite_params["init_command"])
+        # Fold the WAL back into the main file so a plain file copy holds every migrated table.
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    try:
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=snapshot_path.parent, prefix=f".{snapshot_path.name}.", suffix=".tmp")
+        os.close(fd)
+        shutil.copyfile(database_path, tmp_path)
+        os.replace(tmp_path, snapshot_path)
+    except OSError:
+        # The snapshot cache is best effort, like the rest of the cache.
+        return None
+    return snapshot_path
@@ -0,0 +1,142 @@
+import contextlib
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from dj_beat_drop import sqlite_profiles
+from dj_beat_drop.utils import color
+
+CREATE_TABLE_SQL = "CREATE TABLE beatdrop_sqlite_bench (id INTEGER PRIMARY KEY, payload TEXT NOT NULL)"
+INSERT_SQL = "INSERT INTO beatdrop_sqlite_bench (payload) VALUES (?)"
+SELECT_SQL = "SELECT payload FROM beatdrop_sqlite_bench WHERE id = ?"
+SEED_ROWS = 10_000
+PAYLOAD = "x" * 200
+# Django's default SQLite timeout, in seconds.
+BUSY_TIMEOUT = 5
+
+
+def connect(database_path: Path, sqlite_params: dict[str, str]) -> sqlite3.Connection:
+    """Open a connection the way Django does with these ``OPTIONS``: autocommit, with the PRAGMAs run up front."""
+    connection = sqlite3.connect(database_path, timeout=BUSY_TIMEOUT, isolation_level=None, check_same_thread=False)
+    connection.executescript(sqlite_params["init_command"])
+    return connection
+
+
+def copy_database(database_path: Path, target_path: Path):
+    # The backup API includes anything still in the WAL, unlike a plain file copy. Opening the source read-only means
+    # a mistyped path fails instead of creating an empty database.
+    with (
+        contextlib.closing(sqlite3.connect(f"file:{database_path}?mode=ro", uri=True)) as source,
+        contextlib.closing(sqlite3.connect(target_path)) as target,
+    ):
+        source.backup(target)
+
+
+def seed(database_path: Path):
+    with contextlib.closing(sqlite3.connect(database_path)) as connection:
+        connection.execute(CREATE_TABLE_SQL)
+        connection.executemany(INSERT_SQL, [(PAYLOAD,)] * SEED_ROWS)
+        connection.commit()
+
+
+def run_workload(
+    database_path: Path, sqlite_params: dict[str, str], *, readers: int, writers: int, duration: float
+) -> dict[str, float]:
+    """
+    Run ``readers`` point-lookup threads and ``writers`` insert threads for ``duration`` seconds.
+
+    The first error in any thread (e.g. a writer that waited longer than ``BUSY_TIMEOUT``) stops the workload and is
+    raised once every thread has finished.
+    """
+    stop = threading.Event()
+    counts = {"reads": 0, "writes": 0}
+    counts_lock = threading.Lock()
+    errors: list[Exception] = []
+
+    def read(connection: sqlite3.Connection) -> int:
+        reads = 0
+        while not stop.is_set():
+            row_id = random.randint(1, SEED_ROWS)  # noqa: S311
+            connection.execute(SELECT_SQL, (row_id,)).fetchone()
+            reads += 1
+        return reads
+
+    def write(connection: sqlite3.Connection) -> int:
+        writes = 0
+        while not stop.is_set():
+            connection.execute(f"BEGIN {sqlite_params['transaction_mode']}")
+            connection.execute(INSERT_SQL, (PAYLOAD,))
+            connection.execute("COMMIT")
+            writes += 1
+        return writes
+
+    def run(work: Callable[[sqlite3.Connection], int], count_name: str):
+        try:
+            with contextlib.closing(connect(database_path, sqlite_params)) as connection:
+                count = work(connection)
+        except Exception as e:
+            with counts_lock:
+                errors.append(e)
+            stop.set()
+            return
+        with counts_lock:
+            counts[count_name] += count
+
+    threads = [threading.Thread(target=run, args=(read, "reads")) for _ in range(readers)]
+    threads += [threading.Thread(target=run, args=(write, "writes")) for _ in range(writers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    stop.wait(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    if errors:
+        raise errors[0]
+    return {"reads_per_second": counts["reads"] / elapsed, "writes_per_second": counts["writes"] / elapsed}
+
+
+def benchmark_profiles(
+    database_path: Path, profiles: list[str], *, readers: int = 4, writers: int = 1, duration: float = 3.0
+) -> dict[str, dict[str, float]]:
+    """
+    Run the workload against a copy of the database once per SQLite profile and return each profile's throughput.
+
+    The database itself is never written to.
+    """
+    results = {}
+    for profile in profiles:
+        sqlite_params = sqlite_profiles.get_profile_params(profile)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            bench_path = Path(tmp_dir) / database_path.name
+            copy_database(database_path, bench_path)
+            seed(bench_path)
+            results[profile] = run_workload(
+                bench_path, sqlite_params, readers=readers, writers=writers, duration=duration
+            )
+    return results
+
+
+def print_results(results: dict[str, dict[str, float]]):
+    name_width = max(len("Profile"), *(len(profile) for profile in results))
+    print(f"\n{'Profile':<{name_width}}  {'Reads/s':>10}  {'Writes/s':>10}")
+    for profile, result in results.items():
+        print(f"{profile:<{name_width}}  {result['reads_per_second']:>10,.0f}  {result['writes_per_second']:>10,.0f}")
+
+
+def handle_sqlite_bench(database_path: Path, profiles: list[str], readers: int, writers: int, duration: float) -> bool:
+    if database_path.is_file() is False:
+        color.red(f"No SQLite database found at {database_path}.")
+        return False
+    try:
+        results = benchmark_profiles(database_path, profiles, readers=readers, writers=writers, duration=duration)
+    except (ValueError, sqlite3.Error) as e:
+        color.red(str(e))
+        return False
+    print_results(results)
+    return True
@@ -0,0 +1,82 @@
+import os
+
+MIB = 1024 * 1024
+DEFAULT_PROFILE = "default"
+AUTO_PROFILE = "auto"
+TRANSACTION_MODE = "IMMEDIATE"
+# The first Django release with the SQLite transaction_mode and init_command OPTIONS the profiles are applied with.
+MIN_DJANGO_VERSION = "5.1"
+# The PRAGMAs each profile runs on every new connection, in order. A negative cache_size is in KiB, a positive one is
+# in pages.
+SQLITE_PROFILES: dict[str, dict[str, str | int]] = {
+    DEFAULT_PROFILE: {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 134217728,
+        "journal_size_limit": 27103364,
+        "cache_size": 2000,
+    },
+    # Serve most reads from memory mapped pages and a large page cache.
+    "read-heavy": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 1024 * MIB,
+        "journal_size_limit": 64 * MIB,
+        "cache_size": -64 * 1024,
+        "temp_store": "MEMORY",
+    },
+    # Let the WAL grow before checkpointing, so bursts of writes don't stall on checkpoints.
+    "write-heavy": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * MIB,
+        "journal_size_limit": 256 * MIB,
+        "cache_size": -32 * 1024,
+        "wal_autocheckpoint": 10000,
+    },
+    # No memory mapping and a small page cache and WAL, for small containers.
+    "low-memory": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 0,
+        "journal_size_limit": 8 * MIB,
+        "cache_size": -2 * 1024,
+    },
+}
+PROFILE_NAMES = (*SQLITE_PROFILES, AUTO_PROFILE)
+
+
+def get_total_memory() -> int | None:
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def get_auto_pragmas(total_memory: int | None) -> dict[str, str | int]:
+    """
+    Size ``mmap_size`` and ``cache_size`` from the machine's RAM, falling back to the default profile if it's unknown.
+
+    The memory map is shared by every connection, so it gets up to 1/8 of RAM (at most 1 GiB). The page cache is per
+    connection, so it gets 1/256 of RAM (2 MiB to 256 MiB).
+    """
+    pragmas = dict(SQLITE_PROFILES[DEFAULT_PROFILE])
+    if total_memory is None:
+        return pragmas
+    pragmas["mmap_size"] = min(total_memory // 8, 1024 * MIB) // MIB * MIB
+    pragmas["cache_size"] = -min(max(total_memory // 256, 2 * MIB), 256 * MIB) // 1024
+    return pragmas
+
+
+def get_profile_params(profile: str = DEFAULT_PROFILE) -> dict[str, str]:
+    """Return the Django SQLite ``OPTIONS`` (``transaction_mode`` and ``init_command``) for a profile."""
+    if profile == AUTO_PROFILE:
+        pragmas = get_auto_pragmas(get_total_memory())
+    elif profile in SQLITE_PROFILES:
+        pragmas = SQLITE_PROFILES[profile]
+    else:
+        raise ValueError(f"Unknown SQLite profile {profile!r}. Choose one of {', '.join(PROFILE_NAMES)}.")
+    return {
+        "transaction_mode": TRANSACTION_MODE,
+        "init_command": ";".join(f"PRAGMA {name} = {value}" for name, value in pragmas.items()),
+    }
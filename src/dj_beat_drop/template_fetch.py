@@ -0,0 +1,153 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import urllib.parse
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO
+
+from dj_beat_drop import cache, render, timings, utils
+
+PROJECT_TEMPLATE = "project"
+APP_TEMPLATE = "app"
+TEMPLATE_PREFIXES = {PROJECT_TEMPLATE: "django/conf/project_template/", APP_TEMPLATE: "django/conf/app_template/"}
+PROJECT_TEMPLATE_PREFIX = TEMPLATE_PREFIXES[PROJECT_TEMPLATE]
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_TIMEOUT = 30
+
+
+def get_template_cache_dir() -> Path:
+    return cache.get_cache_dir() / "templates"
+
+
+def get_template_cache_key(django_version: str) -> str:
+    return f"template-{django_version}"
+
+
+def get_digest_key(template: str) -> str:
+    # Entries written before app templates were cached only have the project template's "digest".
+    return "digest" if template == PROJECT_TEMPLATE else f"{template}_digest"
+
+
+def get_cached_template(django_version: str, template: str = PROJECT_TEMPLATE) -> Path | None:
+    entry = cache.read_entry(get_template_cache_key(django_version))
+    if entry is None or get_digest_key(template) not in entry["data"]:
+        return None
+    template_dir = get_template_cache_dir() / entry["data"][get_digest_key(template)]
+    return template_dir if template_dir.is_dir() else None
+
+
+def find_wheel(django_version: str) -> dict:
+    """Return the simple index entry of the Django wheel for ``django_version``, with an absolute ``url``."""
+    response = utils.get_session().get(
+        utils.DJANGO_SIMPLE_INDEX_URL, headers={"Accept": utils.SIMPLE_INDEX_ACCEPT}, timeout=10
+    )
+    if response.status_code != 200:
+        raise Exception("Failed to fetch Django releases")
+    for file in utils.get_simple_index_files(response):
+        if (
+            file["filename"].endswith(".whl")
+            and file["yanked"] is False
+            and utils.get_version_from_filename(file["filename"]) == django_version
+        ):
+            return {**file, "url": urllib.parse.urljoin(utils.DJANGO_SIMPLE_INDEX_URL, file["url"])}
+    raise utils.DjangoVersionError(f"No wheel found for Django {django_version}.")
+
+
+def download(url: str, target: BinaryIO, sha256: str | None = None) -> int:
+    """Stream ``url`` into ``target`` a chunk at a time, check its SHA-256 if one is given and return its size."""
+    digest = hashlib.sha256()
+    size = 0
+    with utils.get_session().get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+        if response.status_code != 200:
+            raise Exception(f"Failed to download {url}")
+        for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+            target.write(chunk)
+            size += len(chunk)
+    if sha256 is not None and digest.hexdigest() != sha256:
+        raise Exception(f"The SHA-256 of {url} doesn't match the package index.")
+    return size
+
+
+def extract_template(archive_path: Path, target_dir: Path, prefix: str = PROJECT_TEMPLATE_PREFIX) -> str:
+    """
+    Extract only the template under ``prefix`` from a Django archive and return the SHA-256 of its contents.
+
+    The digest covers each file's relative path and content, so identical templates from different Django releases
+    share one directory in the cache.
+    """
+    digest = hashlib.sha256()
+    with zipfile.ZipFile(archive_path) as archive:
+        members = sorted(
+            (info for info in archive.infolist() if info.filename.startswith(prefix)),
+            key=lambda info: info.filename,
+        )
+        for info in members:
+            relative_path = PurePosixPath(info.filename[len(prefix) :])
+            if info.is_dir() or ".." in relative_path.parts:
+                continue
+            content = archive.read(info)
+            digest.update(f"{relative_path}\0{len(content)}\0".encode())
+            digest.update(content)
+            target = target_dir.joinpath(*relative_path.parts)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(content)
+    if not members:
+        raise utils.DjangoVersionError(f"No {prefix.rstrip('/')} directory found in {archive_path.name}.")
+    return digest.hexdigest()
+
+
+def store_template(extract_dir: Path, template_dir: Path):
+    """Compile an extracted template and move it to its directory in the cache, unless it's already there."""
+    if template_dir.is_dir() is True:
+        return
+    bundle_path = render.write_bundle(extract_dir)
+    os.replace(bundle_path, render.get_bundle_path(template_dir))
+    try:
+        os.rename(extract_dir, template_dir)
+    except OSError:
+        # Another process cached the same template first.
+        shutil.rmtree(extract_dir, ignore_errors=True)
+
+
+def fetch_template(django_version: str, template: str = PROJECT_TEMPLATE) -> Path:
+    """
+    Return the directory of the project (or ``app``) template for ``django_version``, downloading it the first time.
+
+    The Django wheel is streamed to a temporary file, so the archive is never held in memory, and only the project and
+    app templates are extracted into the cache, so one download serves both.
+    """
+    cached_dir = get_cached_template(django_version, template)
+    if cached_dir is not None:
+        return cached_dir
+    if utils.is_offline() is True:
+        raise utils.DjangoVersionError(
+            f"The Django {django_version} {template} template isn't bundled or cached, so it can't be used offline."
+        )
+
+    template_cache_dir = get_template_cache_dir()
+    template_cache_dir.mkdir(parents=True, exist_ok=True)
+    with timings.phase("template fetch") as fetch_phase:
+        wheel = find_wheel(django_version)
+        with tempfile.TemporaryDirectory(dir=template_cache_dir, prefix=".fetch-") as tmp_dir:
+            archive_path = Path(tmp_dir) / wheel["filename"]
+            with archive_path.open("wb") as archive_file:
+                fetch_phase.bytes_transferred = download(wheel["url"], archive_file, wheel["sha256"])
+            digests = {}
+            for name, prefix in TEMPLATE_PREFIXES.items():
+                extract_dir = Path(tmp_dir) / name
+                digest = extract_template(archive_path, extract_dir, prefix)
+                store_template(extract_dir, template_cache_dir / digest)
+                digests[get_digest_key(name)] = digest
+    cache.write_entry(get_template_cache_key(django_version), digests)
+    return template_cache_dir / digests[get_digest_key(template)]
+
+
+def fetch_templates(django_versions: list[str]) -> dict[str, Path]:
+    """Fetch the templates for several Django versions in parallel."""
+    unique_versions = list(dict.fromkeys(django_versions))
+    with ThreadPoolExecutor(max_workers=len(unique_versions) or 1) as executor:
+        return dict(zip(unique_versions, executor.map(fetch_template, unique_versions), strict=True))
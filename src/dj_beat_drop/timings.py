@@ -0,0 +1,134 @@
+import contextvars
+import json
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class Timings:
+    """
+    Wall time (and bytes transferred, where known) of each phase of a command.
+
+    Phases are listed in the order they started. A phase that runs inside another (such as the template fetch inside
+    render) names it as its ``parent`` and is part of its time. Phases that ran at the same time as another with the
+    same parent (such as ``uv lock`` alongside render) are marked ``concurrent``. The phases without a parent only add
+    up to the total when none of them are.
+    """
+
+    def __init__(self):
+        """Start the clock for the whole command."""
+        self.started_at = time.perf_counter()
+        self.phases: list[dict] = []
+
+    def add(self, name: str, parent: dict | None = None) -> dict:
+        """Add a phase, inside the ``parent`` phase if given, as it starts and return it to fill in when it stops."""
+        phase = {
+            "name": name,
+            "parent": None if parent is None else parent["name"],
+            "depth": 0 if parent is None else parent["depth"] + 1,
+            "started": time.perf_counter() - self.started_at,
+            "seconds": None,
+            "bytes": None,
+            "concurrent": False,
+        }
+        self.phases.append(phase)
+        return phase
+
+    def get_phases(self) -> list[dict]:
+        """Return the phases that stopped, each marked ``concurrent`` if it overlapped a phase with the same parent."""
+        # A phase that never stopped (e.g. the command failed inside it) has no time to report.
+        phases = [phase for phase in self.phases if phase["seconds"] is not None]
+        for index, phase in enumerate(phases):
+            for other in phases[index + 1 :]:
+                if (phase["parent"], phase["depth"]) != (other["parent"], other["depth"]):
+                    continue
+                if other["started"] < phase["started"] + phase["seconds"]:
+                    phase["concurrent"] = other["concurrent"] = True
+        return phases
+
+    def to_dict(self) -> dict:
+        phases = [
+            {key: phase[key] for key in ("name", "parent", "seconds", "bytes", "concurrent")}
+            for phase in self.get_phases()
+        ]
+        return {"total_seconds": time.perf_counter() - self.started_at, "phases": phases}
+
+    def print_table(self):
+        total_seconds = time.perf_counter() - self.started_at
+        phases = self.get_phases()
+        # Nested phases are indented under the phase they're part of, and concurrent ones are starred.
+        names = ["  " * phase["depth"] + phase["name"] + (" *" if phase["concurrent"] else "") for phase in phases]
+        name_width = max([len("Phase"), len("Total"), *(len(name) for name in names)])
+        print(f"\n{'Phase':<{name_width}}  {'Time':>9}  {'Bytes':>10}")
+        for name, phase in zip(names, phases, strict=True):
+            transferred = "" if phase["bytes"] is None else f"{phase['bytes']:,}"
+            print(f"{name:<{name_width}}  {phase['seconds'] * 1000:>7.1f}ms  {transferred:>10}")
+        print(f"{'Total':<{name_width}}  {total_seconds * 1000:>7.1f}ms")
+        if any(phase["concurrent"] for phase in phases):
+            print("* Ran at the same time as another phase, so the phases add up to more than the total.")
+
+    def write_json(self, path: Path):
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n")
+
+
+# The recorder for the current command. Threads started with asyncio.to_thread and asyncio tasks inherit it.
+_current_timings: contextvars.ContextVar[Timings | None] = contextvars.ContextVar("timings", default=None)
+# The phase whose ``with`` block is running, which phases started inside it are nested under.
+_current_phase: contextvars.ContextVar["Phase | None"] = contextvars.ContextVar("phase", default=None)
+
+
+@contextmanager
+def record(timings: Timings) -> Iterator[Timings]:
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
+
+
+class Phase:
+    """
+    Time one phase. Use it as a context manager, or call ``start()`` and ``stop()`` when the phase spans others.
+
+    Phases started inside a ``with`` block are nested under it. One started with ``start()`` runs alongside the phases
+    that follow it rather than containing them, so nothing is nested under it.
+    """
+
+    def __init__(self, name: str):
+        """Create a phase that is added to the current recorder, if there is one, when it starts."""
+        self.name = name
+        self.bytes_transferred: int | None = None
+        self.started_at: float | None = None
+        self.timings = _current_timings.get()
+        self.entry: dict | None = None
+        self.outer_phase: Phase | None = None
+
+    def start(self) -> "Phase":
+        self.started_at = time.perf_counter()
+        if self.timings is not None:
+            parent = _current_phase.get()
+            self.entry = self.timings.add(self.name, parent.entry if parent is not None else None)
+        return self
+
+    def stop(self):
+        if self.entry is not None and self.started_at is not None:
+            self.entry["seconds"] = time.perf_counter() - self.started_at
+            self.entry["bytes"] = self.bytes_transferred
+
+    def __enter__(self) -> "Phase":
+        """Start timing the phase, nesting the phases started inside the block under it."""
+        self.start()
+        self.outer_phase = _current_phase.get()
+        _current_phase.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop timing the phase, including when it raised."""
+        self.stop()
+        # Not reset with a token: a generator can leave the block in another context than it entered it in.
+        _current_phase.set(self.outer_phase)
+
+
+def phase(name: str) -> Phase:
+    return Phase(name)
@@ -0,0 +1,136 @@
+import re
+from pathlib import Path
+
+from dj_beat_drop import databases, project_manifest, render, utils
+from dj_beat_drop.new import (
+    DOT_ENV_PATH,
+    get_dot_env,
+    get_project_extra_files,
+    get_project_transforms,
+    get_template_dir,
+)
+from dj_beat_drop.utils import color
+
+BASE_SUFFIX = ".base"
+NEW_SUFFIX = ".new"
+UPDATE_RESULTS = ("updated", "added", "removed", "conflicts", "unchanged")
+SECRET_KEY_PATTERN = re.compile(r'^SECRET_KEY="(.*)"$', re.MULTILINE)
+
+
+def render_project_files(template_context: dict[str, str], options: dict) -> dict[str, str]:
+    return render.render_files(
+        get_template_dir(template_context),
+        template_context,
+        get_project_transforms(template_context, options),
+        get_project_extra_files(template_context, options),
+    )
+
+
+def get_env_secret_key(project_dir: Path) -> str | None:
+    try:
+        match = SECRET_KEY_PATTERN.search((project_dir / DOT_ENV_PATH).read_text())
+    except (OSError, UnicodeDecodeError):
+        return None
+    return match[1] if match is not None else None
+
+
+def update_project(project_dir: Path, template_context: dict[str, str]) -> dict[str, list[str]]:
+    """
+    Move a generated project to the Django release in ``template_context`` and return what happened to each file.
+
+    The project is rendered in memory from both the template it was created with and the new one, and only files whose
+    rendered output differs are touched. A file whose hash still matches ``.beatdrop.json`` is replaced (or removed).
+    A file the user has edited is left alone, and the old and new renders are written next to it as ``<file>.base``
+    and ``<file>.new`` so it can be merged by hand or with ``git merge-file <file> <file>.base <file>.new``.
+
+    ``.env`` is rendered with the project's own secret key. It has no hash in ``.beatdrop.json``, which is committed,
+    so it counts as unedited while it matches the old render.
+    """
+    manifest = project_manifest.read_project_manifest(project_dir)
+    options = manifest["options"]
+    old_context = {**template_context, **manifest["context"]}
+    new_context = {
+        **old_context,
+        "django_version": template_context["django_version"],
+        "docs_version": template_context["docs_version"],
+    }
+    base_files = render_project_files(old_context, options)
+    new_files = render_project_files(new_context, options)
+
+    file_hashes = dict(manifest["files"])
+    expected_hashes = dict(file_hashes)
+    if options.get("initialize_env") is True:
+        project_dir = project_dir.resolve()
+        env_context = {"secret_key": get_env_secret_key(project_dir) or old_context["secret_key"]}
+        base_files[DOT_ENV_PATH] = get_dot_env(project_dir, {**old_context, **env_context}, options)
+        new_files[DOT_ENV_PATH] = get_dot_env(project_dir, {**new_context, **env_context}, options)
+        expected_hashes[DOT_ENV_PATH] = project_manifest.get_content_hash(base_files[DOT_ENV_PATH])
+    results: dict[str, list[str]] = {result: [] for result in UPDATE_RESULTS}
+    for path in sorted(base_files.keys() | new_files.keys()):
+        base_content = base_files.get(path)
+        new_content = new_files.get(path)
+        if base_content == new_content:
+            results["unchanged"].append(path)
+            continue
+
+        target = project_dir / path
+        # A missing file that was never generated matches too, so a file new to the template is simply added.
+        if project_manifest.get_file_hash(target) != expected_hashes.get(path):
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if base_content is not None:
+                target.with_name(target.name + BASE_SUFFIX).write_text(base_content)
+            if new_content is not None:
+                target.with_name(target.name + NEW_SUFFIX).write_text(new_content)
+            results["conflicts"].append(path)
+        elif new_content is None:
+            target.unlink(missing_ok=True)
+            file_hashes.pop(path, None)
+            results["removed"].append(path)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(new_content)
+            if path != DOT_ENV_PATH:
+                file_hashes[path] = project_manifest.get_content_hash(new_content)
+            results["updated" if base_content is not None else "added"].append(path)
+
+    project_manifest.write_project_manifest(project_dir, new_context, options, file_hashes)
+    return results
+
+
+def print_results(results: dict[str, list[str]]):
+    for path in results["updated"]:
+        color.green(f"Updated   {path}")
+    for path in results["added"]:
+        color.green(f"Added     {path}")
+    for path in results["removed"]:
+        color.green(f"Removed   {path}")
+    for path in results["conflicts"]:
+        color.orange(f"Conflict  {path} (merge {path}{BASE_SUFFIX} and {path}{NEW_SUFFIX} into it)")
+    print(f"{len(results['unchanged'])} file(s) unchanged.")
+
+
+def handle_update(project_dir: Path, use_lts: bool, refresh: bool = False, django_version: str | None = None) -> bool:
+    """Update the project in ``project_dir`` and return whether it was updated without conflicts."""
+    try:
+        manifest = project_manifest.read_project_manifest(project_dir)
+        old_version = manifest["context"]["django_version"]
+        template_context = utils.get_template_context(use_lts=use_lts, refresh=refresh, django_version=django_version)
+        results = update_project(project_dir, template_context)
+    except Exception as e:
+        # Besides a bad manifest or release, a template can fail to download (a plain Exception) or to transform
+        # (settings_engine.SettingsTransformError). Nothing is written until both renders have succeeded.
+        color.red(str(e) or type(e).__name__)
+        return False
+
+    print(f"Updated from Django {old_version} to {template_context['django_version']}.\n")
+    print_results(results)
+    minor_version_changed = utils.get_minor_version(old_version) != template_context["docs_version"]
+    if minor_version_changed is True and (project_dir / "pyproject.toml").exists():
+        color.green("\nTo upgrade the installed Django:\n")
+        print(f'uv add "django~={template_context["docs_version"]}"')
+        # Django's PostgreSQL connection pool (5.1+) needs psycopg's pool extra.
+        database = manifest["options"].get("database", databases.SQLITE_DATABASE)
+        driver_dependency = databases.get_driver_dependency(database, template_context["django_version"])
+        if driver_dependency != databases.get_driver_dependency(database, old_version):
+            print(f'uv add "{driver_dependency}"')
+    return not results["conflicts"]
@@ -1,7 +1,27 @@
+import bisect
+import json
+import os
+import re
 import secrets
+import sys
 from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-import requests
+from dj_beat_drop import cache, timings
+
+if TYPE_CHECKING:
+    import requests
+
+DJANGO_SIMPLE_INDEX_URL = "https://pypi.org/simple/django/"
+DJANGO_RELEASES_CACHE_KEY = "django-releases"
+SIMPLE_JSON_CONTENT_TYPE = "application/vnd.pypi.simple.v1+json"
+SIMPLE_INDEX_ACCEPT = f"{SIMPLE_JSON_CONTENT_TYPE}, text/html;q=0.1"
+SIMPLE_HTML_ANCHOR_PATTERN = re.compile(r"<a\s([^>]*)>([^<]+)</a>")
+SIMPLE_HTML_HREF_PATTERN = re.compile(r'href="([^"]*)"')
+OFFLINE_ENV_VAR = "DJ_BEAT_DROP_OFFLINE"
+# The Django releases of every bundled template series, written by scripts/update_templates.py.
+RELEASE_MANIFEST_PATH = Path(__file__).parent / "templates" / "releases.json"
 
 
 class Color:
@@ -24,42 +44,240 @@ color = Color()
 
 
 @lru_cache
-def get_django_releases():
-    response = requests.get("https://pypi.org/pypi/Django/json", timeout=10)
+def get_session() -> "requests.Session":
+    # One pooled session for every request to PyPI, so the TLS connection is reused between calls. Requests is
+    # imported here so commands that never touch the network don't pay for importing it.
+    import requests
+
+    return requests.Session()
+
+
+def get_version_from_filename(filename: str) -> str | None:
+    from packaging.utils import InvalidSdistFilename, InvalidWheelFilename, parse_sdist_filename, parse_wheel_filename
+
+    try:
+        if filename.endswith(".whl"):
+            return str(parse_wheel_filename(filename)[1])
+        return str(parse_sdist_filename(filename)[1])
+    except (InvalidSdistFilename, InvalidWheelFilename):
+        return None
+
+
+def get_simple_index_files(response: "requests.Response") -> list[dict]:
+    """
+    Return the files listed on a PEP 691 (JSON) or PEP 503 (HTML) simple index page.
+
+    Each file has its ``filename``, ``url`` (as given, so possibly relative to the page), ``sha256`` (if known) and
+    whether it's ``yanked``.
+    """
+    if response.headers.get("Content-Type", "").startswith(SIMPLE_JSON_CONTENT_TYPE):
+        return [
+            {
+                "filename": file["filename"],
+                "url": file.get("url", ""),
+                "sha256": file.get("hashes", {}).get("sha256"),
+                "yanked": bool(file.get("yanked")),
+            }
+            for file in response.json()["files"]
+        ]
+
+    # Some mirrors and proxies only serve the HTML flavor of the simple API.
+    files = []
+    for match in SIMPLE_HTML_ANCHOR_PATTERN.finditer(response.text):
+        href_match = SIMPLE_HTML_HREF_PATTERN.search(match.group(1))
+        url, _, fragment = (href_match.group(1) if href_match else "").partition("#")
+        files.append(
+            {
+                "filename": match.group(2).strip(),
+                "url": url,
+                "sha256": fragment.removeprefix("sha256=") if fragment.startswith("sha256=") else None,
+                "yanked": "data-yanked" in match.group(1),
+            }
+        )
+    return files
+
+
+def parse_simple_index(response: "requests.Response") -> dict:
+    """
+    Return the latest version and every release from a PEP 691 (JSON) or PEP 503 (HTML) simple index page.
+
+    Versions where every file has been yanked are skipped, and the releases are returned in version order.
+    """
+    from packaging.version import Version
+
+    yanked_by_version: dict[str, bool] = {}
+    for file in get_simple_index_files(response):
+        version = get_version_from_filename(file["filename"])
+        if version is None:
+            continue
+        yanked_by_version[version] = yanked_by_version.get(version, True) and file["yanked"]
+
+    releases = sorted((version for version, yanked in yanked_by_version.items() if not yanked), key=Version)
+    final_releases = [release for release in releases if not Version(release).is_prerelease]
+    if not final_releases:
+        raise Exception("Failed to find any Django releases")
+    return {"latest": final_releases[-1], "releases": releases}
+
+
+def is_offline() -> bool:
+    return os.environ.get(OFFLINE_ENV_VAR, "").lower() in {"1", "true", "yes", "on"}
+
+
+def enable_offline_mode():
+    # Set through the environment so worker processes and uv subprocesses started later are offline too.
+    os.environ[OFFLINE_ENV_VAR] = "1"
+
+
+def load_release_manifest() -> dict:
+    try:
+        return json.loads(RELEASE_MANIFEST_PATH.read_text())
+    except (OSError, ValueError) as e:
+        raise DjangoVersionError(f"Offline mode needs the release manifest at {RELEASE_MANIFEST_PATH}.") from e
+
+
+def get_release_manifest(index: "VersionIndex", minor_versions: set[str]) -> dict:
+    """Return the manifest of every release in the ``minor_versions`` series, in the same shape as the PyPI data."""
+    releases = [str(version) for version in index.versions if get_minor_version(str(version)) in minor_versions]
+    if not releases:
+        raise DjangoVersionError(f"No Django releases found for {', '.join(sorted(minor_versions))}.")
+    return {"latest": releases[-1], "releases": releases}
+
+
+@lru_cache
+def get_django_releases(*, refresh: bool = False):
+    if is_offline() is True:
+        # Only the releases with a bundled template are known offline, so nothing needs the network.
+        return load_release_manifest()
+
+    entry = cache.read_entry(DJANGO_RELEASES_CACHE_KEY)
+    if entry is not None and refresh is False and cache.is_fresh(entry):
+        cache.record_event("hit")
+        return entry["data"]
+
+    headers = {"Accept": SIMPLE_INDEX_ACCEPT, **cache.get_conditional_headers(entry)}
+    with timings.phase("pypi fetch") as fetch_phase:
+        response = get_session().get(DJANGO_SIMPLE_INDEX_URL, headers=headers, timeout=10)
+        fetch_phase.bytes_transferred = len(response.content)
+    if response.status_code == 304 and entry is not None:
+        cache.touch_entry(DJANGO_RELEASES_CACHE_KEY, entry)
+        cache.record_event("revalidated")
+        return entry["data"]
     if response.status_code == 200:
-        data = response.json()
-        return {"latest": data["info"]["version"], "releases": data["releases"]}
+        release_data = parse_simple_index(response)
+        cache.write_entry(
+            DJANGO_RELEASES_CACHE_KEY,
+            release_data,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        cache.record_event("miss")
+        return release_data
     else:
         raise Exception("Failed to fetch Django releases")
 
 
-def get_latest_django_version():
-    full_version = get_django_releases()["latest"]
-    minor_version = ".".join(full_version.split(".")[0:2])
-    return full_version, minor_version
+class DjangoVersionError(Exception):
+    pass
 
 
-def get_lts_django_version():
-    release_data = get_django_releases()
-    latest_version = release_data["latest"]
-    latest_minor_version = ".".join(latest_version.split(".")[0:2])
-    latest_split = latest_version.split(".")
-    if latest_split[1] == "2":
-        return latest_version, latest_minor_version
+class VersionIndex:
+    """
+    The final (not pre-release) Django releases in version order.
 
-    releases = get_django_releases()["releases"]
-    for release in reversed(releases):
-        if "b" in release or "rc" in release or "a" in release:
-            continue
-        version_parts = release.split(".")
-        if version_parts[1] == "2":
-            return release, ".".join(version_parts[0:2])
+    The releases are parsed once, and every lookup is a binary search over the sorted versions.
+    """
+
+    def __init__(self, releases: list[str]):
+        """Index ``releases``, skipping pre-releases. Yanked releases are already left out of the simple index data."""
+        from packaging.version import Version
+
+        self.versions: list[Version] = sorted(
+            version for version in map(Version, releases) if version.is_prerelease is False
+        )
+        if not self.versions:
+            raise DjangoVersionError("Failed to find any Django releases")
+
+    def latest(self) -> str:
+        return str(self.versions[-1])
+
+    def latest_patch(self, major: int, minor: int) -> str | None:
+        """Return the newest X.Y.Z release for ``major``.``minor``, or ``None`` if there is none."""
+        from packaging.version import Version
+
+        index = bisect.bisect_left(self.versions, Version(f"{major}.{minor + 1}"))
+        if index > 0 and self.versions[index - 1].release[:2] == (major, minor):
+            return str(self.versions[index - 1])
+        return None
+
+    def latest_lts(self) -> str:
+        # Every X.2 feature release is an LTS release.
+        for major in range(self.versions[-1].major, 0, -1):
+            release = self.latest_patch(major, 2)
+            if release is not None:
+                return release
+        raise DjangoVersionError("Failed to find a Django LTS release")
+
+    def resolve(self, version_spec: str) -> str:
+        """Return the release for ``version_spec``: the newest patch for ``X.Y``, or ``X.Y.Z`` itself if it exists."""
+        from packaging.version import InvalidVersion, Version
+
+        try:
+            version = Version(version_spec)
+        except InvalidVersion as e:
+            raise DjangoVersionError(f"Invalid Django version {version_spec!r}.") from e
+        if len(version.release) == 2 and version.is_prerelease is False:
+            release = self.latest_patch(*version.release)
+            if release is None:
+                raise DjangoVersionError(f"There is no Django {version_spec} release.")
+            return release
+        index = bisect.bisect_left(self.versions, version)
+        if index == len(self.versions) or self.versions[index] != version:
+            raise DjangoVersionError(f"Django {version_spec} isn't a released version.")
+        return str(self.versions[index])
+
+
+@lru_cache(maxsize=4)
+def build_version_index(releases: tuple[str, ...]) -> VersionIndex:
+    return VersionIndex(list(releases))
+
+
+def get_version_index(*, refresh: bool = False) -> VersionIndex:
+    # Keyed by the release list itself, so the index is rebuilt exactly when a fetch returns different releases.
+    return build_version_index(tuple(get_django_releases(refresh=refresh)["releases"]))
 
 
-def get_template_context(*, use_lts: bool):
-    django_version, minor_version = get_latest_django_version()
-    if use_lts is True:
-        django_version, minor_version = get_lts_django_version()
+def get_minor_version(version: str) -> str:
+    return ".".join(version.split(".")[0:2])
+
+
+def get_latest_django_version(*, refresh: bool = False):
+    full_version = get_version_index(refresh=refresh).latest()
+    return full_version, get_minor_version(full_version)
+
+
+def get_lts_django_version(*, refresh: bool = False):
+    full_version = get_version_index(refresh=refresh).latest_lts()
+    return full_version, get_minor_version(full_version)
+
+
+def get_pinned_django_version(version_spec: str, *, refresh: bool = False):
+    full_version = get_version_index(refresh=refresh).resolve(version_spec)
+    return full_version, get_minor_version(full_version)
+
+
+def get_template_context(*, use_lts: bool, refresh: bool = False, django_version: str | None = None):
+    """
+    Return the template context for the Django release the project is created with.
+
+    That's the latest release, the latest LTS release with ``use_lts``, or the release matching ``django_version``
+    (``X.Y`` for the newest patch release of a series, or an exact ``X.Y.Z``) when it's given.
+    """
+    if django_version is not None:
+        django_version, minor_version = get_pinned_django_version(django_version, refresh=refresh)
+    elif use_lts is True:
+        django_version, minor_version = get_lts_django_version(refresh=refresh)
+    else:
+        django_version, minor_version = get_latest_django_version(refresh=refresh)
     return {
         "project_name": "config",
         "django_version": django_version,
@@ -68,6 +286,16 @@ def get_template_context(*, use_lts: bool):
     }
 
 
+def load_toml(content: str) -> dict:
+    """Parse TOML with ``tomllib`` or its ``tomli`` backport on Python 3.10. Invalid TOML raises ``ValueError``."""
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib
+
+    return tomllib.loads(content)
+
+
 def get_secret_key():
     """Return a 50 character random string usable as a SECRET_KEY setting value."""
     chars = "abcdefghijklmnopqrstuvwxyz0123456789!@#$%^&*(-_=+)"
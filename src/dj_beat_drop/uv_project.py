@@ -0,0 +1,164 @@
+import asyncio
+import os
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+from dj_beat_drop import databases, perf_preset, servers, utils
+
+LOCK_COMMAND = ["uv", "lock"]
+SYNC_COMMAND = ["uv", "sync", "--locked"]
+MIGRATE_COMMAND = ["uv", "run", "--no-sync", "manage.py", "migrate"]
+FIND_PYTHON_COMMAND = ["uv", "python", "find", "--show-version"]
+GIT_INIT_COMMAND = ["git", "init"]
+GITIGNORE = """# Python-generated files
+__pycache__/
+*.py[oc]
+build/
+dist/
+wheels/
+*.egg-info
+
+# Virtual environments
+.venv
+"""
+
+
+class CommandError(Exception):
+    def __init__(self, command: list[str], returncode: int, output: str):
+        """Record the failed command along with its exit code and combined stdout/stderr."""
+        self.command = command
+        self.returncode = returncode
+        self.output = output
+        super().__init__(f"`{' '.join(command)}` failed with exit code {returncode}.\n{output.strip()}")
+
+
+def get_dependencies(
+    template_context: dict[str, str],
+    initialize_env: bool,
+    django_version: str | None = None,
+    database: str = databases.SQLITE_DATABASE,
+    use_perf_preset: bool = False,
+    server: str | None = None,
+) -> list[str]:
+    """
+    Return the project's dependencies. A pinned ``django_version`` keeps the project on that release or series.
+
+    A PostgreSQL ``database`` adds psycopg, along with psycopg_pool for Django's connection pool (5.1+).
+    ``use_perf_preset`` adds what the performance preset's settings need, and ``server`` the server's packages.
+    """
+    if django_version is None:
+        dependencies = [f"django~={template_context['docs_version']}"]
+    elif len(django_version.split(".")) > 2:
+        dependencies = [f"django=={template_context['django_version']}"]
+    else:
+        dependencies = [f"django~={template_context['django_version']}"]
+    if initialize_env is True:
+        dependencies.append("environs[django]")
+    driver_dependency = databases.get_driver_dependency(database, template_context["django_version"])
+    if driver_dependency is not None:
+        dependencies.append(driver_dependency)
+    if use_perf_preset is True:
+        dependencies.extend(perf_preset.DEPENDENCIES)
+    if server is not None:
+        dependencies.extend(servers.SERVER_DEPENDENCIES[server])
+    return dependencies
+
+
+def find_python_version(python: str | None, cwd: Path) -> str:
+    """
+    Return the ``X.Y`` version of the Python that ``uv init`` would pin for a project created in ``cwd``.
+
+    That's the ``python`` request (e.g. ``3.12``) when it's given, and otherwise uv's own choice: a ``.python-version``
+    file in ``cwd`` or its parents, ``UV_PYTHON``, or the first Python found.
+    """
+    command = FIND_PYTHON_COMMAND if python is None else [*FIND_PYTHON_COMMAND, python]
+    # uv's warnings come first in the output, which is shared with stderr.
+    version = run_command(command, cwd).strip().rsplit("\n", 1)[-1]
+    match = re.match(r"(\d+)\.(\d+)", version)
+    if match is None:
+        raise CommandError(command, 0, f"Unexpected Python version {version!r}.")
+    return f"{match[1]}.{match[2]}"
+
+
+def needs_git_repository(project_dir: Path) -> bool:
+    """Return whether ``uv init`` would create a git repository: git is installed and ``project_dir`` isn't in one."""
+    if shutil.which("git") is None:
+        return False
+    return not any((parent / ".git").exists() for parent in project_dir.parents)
+
+
+def get_pyproject(name: str, dependencies: list[str], python_version: str) -> str:
+    dependency_lines = "".join(f'    "{dependency}",\n' for dependency in dependencies)
+    return (
+        "[project]\n"
+        f'name = "{name.replace("_", "-")}"\n'
+        'version = "0.1.0"\n'
+        'description = "Add your description here"\n'
+        'readme = "README.md"\n'
+        f'requires-python = ">={python_version}"\n'
+        f"dependencies = [\n{dependency_lines}]\n"
+    )
+
+
+def write_project_files(target_dir: Path, name: str, dependencies: list[str], python_version: str):
+    """Write the files `uv init` would create for ``python_version``, with every dependency declared up front."""
+    (target_dir / "pyproject.toml").write_text(get_pyproject(name, dependencies, python_version))
+    (target_dir / ".python-version").write_text(f"{python_version}\n")
+    (target_dir / "README.md").write_text("")
+    (target_dir / ".gitignore").write_text(GITIGNORE)
+
+
+def get_command_env() -> dict[str, str] | None:
+    """Return the environment for uv commands. In offline mode uv only uses packages it already has in its cache."""
+    if utils.is_offline() is True:
+        return {**os.environ, "UV_OFFLINE": "1"}
+    return None
+
+
+def start_command(command: list[str], cwd: Path) -> subprocess.Popen:
+    return subprocess.Popen(  # noqa: S603
+        command, cwd=cwd, env=get_command_env(), stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+
+
+def wait_command(process: subprocess.Popen) -> str:
+    output, _ = process.communicate()
+    if process.returncode != 0:
+        raise CommandError(process.args, process.returncode, output)
+    return output
+
+
+def stop_command(process: subprocess.Popen):
+    """Kill the command, if it's still running, and wait for it to exit."""
+    process.kill()
+    process.communicate()
+
+
+def run_command(command: list[str], cwd: Path) -> str:
+    return wait_command(start_command(command, cwd))
+
+
+async def start_command_async(command: list[str], cwd: Path) -> asyncio.subprocess.Process:
+    return await asyncio.create_subprocess_exec(
+        *command, cwd=cwd, env=get_command_env(), stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT
+    )
+
+
+async def wait_command_async(command: list[str], process: asyncio.subprocess.Process) -> str:
+    try:
+        output, _ = await process.communicate()
+    except asyncio.CancelledError:
+        # Don't leave the command running in a directory the caller is about to remove.
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        raise
+    if process.returncode != 0:
+        raise CommandError(command, process.returncode, output.decode())
+    return output.decode()
+
+
+async def run_command_async(command: list[str], cwd: Path) -> str:
+    return await wait_command_async(command, await start_command_async(command, cwd))
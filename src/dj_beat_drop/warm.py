@@ -0,0 +1,82 @@
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from dj_beat_drop import databases, lock_cache, utils, uv_project
+from dj_beat_drop.new import get_template_dir
+from dj_beat_drop.utils import color
+
+
+def get_dependency_sets(
+    template_context: dict[str, str],
+    django_version: str | None = None,
+    database: str = databases.SQLITE_DATABASE,
+    use_perf_preset: bool = False,
+    server: str | None = None,
+) -> list[list[str]]:
+    """Return the dependencies of a project created with these options, with and without environs."""
+    return [
+        uv_project.get_dependencies(template_context, initialize_env, django_version, database, use_perf_preset, server)
+        for initialize_env in (True, False)
+    ]
+
+
+def warm_dependencies(template_context: dict[str, str], dependencies: list[str], python_version: str) -> Path:
+    """
+    Lock and install ``dependencies`` in a throwaway project and return where its lockfile is cached.
+
+    The project is pinned to ``python_version``. The lock is always resolved from scratch, so warming again refreshes
+    it. Syncing puts every package in uv's cache, from which uv hardlinks (or clones) them into the virtualenv of each
+    new project.
+    """
+    with tempfile.TemporaryDirectory(prefix="dj-beat-drop-warm-") as tmp_dir:
+        project_dir = Path(tmp_dir)
+        uv_project.write_project_files(project_dir, lock_cache.PLACEHOLDER_NAME, dependencies, python_version)
+        uv_project.run_command(uv_project.LOCK_COMMAND, cwd=project_dir)
+        uv_project.run_command(uv_project.SYNC_COMMAND, cwd=project_dir)
+        lock_path = lock_cache.save_lock(project_dir, lock_cache.PLACEHOLDER_NAME, template_context, dependencies)
+    if lock_path is None:
+        raise OSError(f"Unable to cache the lockfile in {lock_cache.get_lock_dir()}.")
+    return lock_path
+
+
+def handle_warm(
+    use_lts: bool,
+    refresh: bool = False,
+    django_version: str | None = None,
+    database: str = databases.SQLITE_DATABASE,
+    use_perf_preset: bool = False,
+    server: str | None = None,
+    python: str | None = None,
+) -> bool:
+    """
+    Cache what ``beatdrop new`` with the same options needs and return whether everything was cached.
+
+    That's the project template when it isn't bundled, and the lockfile and packages of the project's dependencies,
+    which are locked and installed in parallel. The lockfiles are for the Python ``beatdrop new`` would pin in the
+    current directory, or for ``python`` when it's given.
+    """
+    try:
+        template_context = utils.get_template_context(use_lts=use_lts, refresh=refresh, django_version=django_version)
+        get_template_dir(template_context)
+        python_version = uv_project.find_python_version(python, Path.cwd())
+    except (utils.DjangoVersionError, uv_project.CommandError) as e:
+        color.red(str(e))
+        return False
+
+    dependency_sets = get_dependency_sets(template_context, django_version, database, use_perf_preset, server)
+    all_warmed = True
+    with ThreadPoolExecutor(max_workers=len(dependency_sets)) as executor:
+        futures = [
+            executor.submit(warm_dependencies, template_context, dependencies, python_version)
+            for dependencies in dependency_sets
+        ]
+        for dependencies, future in zip(dependency_sets, futures, strict=True):
+            try:
+                future.result()
+            except (uv_project.CommandError, OSError) as e:
+                color.red(f"Failed to warm {', '.join(dependencies)}: {e}")
+                all_warmed = False
+                continue
+            color.green(f"Warmed {', '.join(dependencies)} for Django {template_context['django_version']}.")
+    return all_warmed
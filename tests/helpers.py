@@ -0,0 +1,37 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from dj_beat_drop.new import create_new_project
+
+CONTEXT_4_2 = {"project_name": "config", "django_version": "4.2.16", "docs_version": "4.2", "secret_key": "secret"}
+CONTEXT_5_1 = {"project_name": "config", "django_version": "5.1.3", "docs_version": "5.1", "secret_key": "secret"}
+
+
+class ProjectTestCase(TestCase):
+    """Create projects without uv in a temporary directory, with the Django release resolved to a fixed context."""
+
+    project_name = "example"
+    # Passed to every create_new_project call of the test case.
+    project_options: dict = {}
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.root = Path(tmp_dir.name)
+        self.project_dir = self.root / self.project_name
+
+    def create_project(
+        self, template_context: dict[str, str] = CONTEXT_5_1, *, initialize_env: bool = True, **options
+    ) -> str:
+        """Create the project in ``project_dir`` and return its ``settings.py``."""
+        create_new_project(
+            name=self.project_name,
+            use_lts=False,
+            project_dir=self.project_dir,
+            initialize_uv=False,
+            initialize_env=initialize_env,
+            resolver=lambda **kwargs: template_context,
+            **{**self.project_options, **options},
+        )
+        return (self.project_dir / "config" / "settings.py").read_text()
@@ -0,0 +1,131 @@
+import os
+import tempfile
+from pathlib import Path
+from textwrap import dedent
+from unittest import TestCase, mock
+
+from typer.testing import CliRunner
+
+from dj_beat_drop import batch, main_cli
+from tests.helpers import CONTEXT_4_2, CONTEXT_5_1
+
+TEMPLATE_CONTEXTS = {True: CONTEXT_4_2, False: CONTEXT_5_1}
+
+
+class TestBatch(TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.root = Path(tmp_dir.name)
+        self.manifest_path = self.root / "services.toml"
+        cwd = Path.cwd()
+        os.chdir(self.root)
+        self.addCleanup(os.chdir, cwd)
+
+    def write_manifest(self, content):
+        self.manifest_path.write_text(dedent(content))
+
+    def test_load_manifest_applies_defaults(self):
+        self.write_manifest("""
+            [defaults]
+            lts = true
+            uv = false
+
+            [[projects]]
+            name = "billing"
+
+            [[projects]]
+            name = "search"
+            lts = false
+        """)
+        assert batch.load_manifest(self.manifest_path) == [
+            {**batch.MANIFEST_DEFAULTS, "name": "billing", "lts": True, "uv": False, "env": True},
+            {**batch.MANIFEST_DEFAULTS, "name": "search", "lts": False, "uv": False, "env": True},
+        ]
+
+    def test_load_manifest_rejects_invalid_entries(self):
+        for content in (
+            '[[projects]]\nname = "Billing"',
+            '[[projects]]\nname = "billing"\n[[projects]]\nname = "billing"',
+            '[[projects]]\nname = "billing"\ndatabase = "postgres"',
+            "[defaults]\nlts = true",
+            '[[projects]]\nname = "billing"\ndb = "mysql"',
+            '[[projects]]\nname = "billing"\nserver = "waitress"',
+            '[[projects]]\nname = "billing"\ndb = "postgres"\nsqlite_profile = "read-heavy"',
+            '[[projects]]\nname = "billing"\napps = "blog"',
+            '[[projects]]\nname = "billing"\napps = ["blog", "blog"]',
+        ):
+            self.write_manifest(content)
+            with self.assertRaises(batch.ManifestError):
+                batch.load_manifest(self.manifest_path)
+
+    @mock.patch(
+        "dj_beat_drop.utils.get_template_context", side_effect=lambda **kwargs: TEMPLATE_CONTEXTS[kwargs["use_lts"]]
+    )
+    def test_failures_are_isolated_per_project(self, mock_get_template_context):
+        (self.root / "search").mkdir()
+        self.write_manifest("""
+            [defaults]
+            uv = false
+
+            [[projects]]
+            name = "billing"
+
+            [[projects]]
+            name = "search"
+
+            [[projects]]
+            name = "ledger"
+            lts = true
+            env = false
+        """)
+        assert batch.handle_manifest(self.manifest_path, overwrite=False, jobs=2) is False
+
+        assert mock_get_template_context.call_count == 2
+        assert (self.root / "billing" / "config" / "settings.py").exists()
+        assert (self.root / "billing" / ".env").exists()
+        assert "Django 4.2.16" in (self.root / "ledger" / "config" / "settings.py").read_text()
+        assert list((self.root / "search").iterdir()) == []
+
+    @mock.patch("dj_beat_drop.utils.get_template_context", side_effect=Exception("Failed to fetch Django releases"))
+    def test_unresolved_release_fails_the_batch(self, mock_get_template_context):
+        self.write_manifest("""
+            [[projects]]
+            name = "billing"
+        """)
+        with mock.patch("dj_beat_drop.batch.color.red") as mock_red:
+            assert batch.handle_manifest(self.manifest_path, overwrite=False, jobs=1) is False
+
+        mock_red.assert_called_once_with("Failed to resolve the Django release: Failed to fetch Django releases")
+        assert (self.root / "billing").exists() is False
+
+    @mock.patch("dj_beat_drop.utils.get_template_context", side_effect=lambda **kwargs: TEMPLATE_CONTEXTS[False])
+    def test_project_options_are_applied(self, mock_get_template_context):
+        self.write_manifest("""
+            [defaults]
+            uv = false
+            env = false
+            log_format = "json"
+
+            [[projects]]
+            name = "billing"
+            db = "postgres"
+            perf_preset = true
+            server = "gunicorn"
+            apps = ["invoices"]
+        """)
+        assert batch.handle_manifest(self.manifest_path, overwrite=False, jobs=1) is True
+
+        settings = (self.root / "billing" / "config" / "settings.py").read_text()
+        assert "'ENGINE': 'django.db.backends.postgresql'," in settings
+        assert "whitenoise.middleware.WhiteNoiseMiddleware" in settings
+        assert "    'invoices',\n]\n" in settings
+        assert "'formatter': 'json'," in settings
+        assert (self.root / "billing" / "gunicorn.conf.py").exists()
+        assert (self.root / "billing" / "invoices" / "apps.py").exists()
+
+    def test_single_project_options_are_rejected_with_a_manifest(self):
+        for option in (["--db", "postgres"], ["--server", "gunicorn"], ["--apps", "blog"], ["--perf-preset"]):
+            result = CliRunner().invoke(main_cli.main_command, ["new", "--from-manifest", "services.toml", *option])
+            assert result.exit_code == 2, option
+            assert option[0] in result.output
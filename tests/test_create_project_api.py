@@ -0,0 +1,264 @@
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import TestCase, mock
+
+from dj_beat_drop import uv_project
+from dj_beat_drop.new import create_new_project, create_new_project_async, render_project
+from dj_beat_drop.uv_project import find_python_version
+from tests.helpers import CONTEXT_5_1
+
+
+def resolve_django_5_1(*, use_lts: bool, refresh: bool) -> dict[str, str]:
+    return CONTEXT_5_1
+
+
+class TestCreateProjectApi(TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.root = Path(tmp_dir.name)
+        env_patcher = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(self.root / "cache")})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        # Which Python uv picks depends on the machine; see test_python_version_is_pinned_as_uv_picks_it.
+        python_patcher = mock.patch("dj_beat_drop.uv_project.find_python_version", return_value="3.12")
+        self.find_python_version = python_patcher.start()
+        self.addCleanup(python_patcher.stop)
+
+    @mock.patch("dj_beat_drop.uv_project.shutil.which", return_value="/usr/bin/git")
+    @mock.patch("dj_beat_drop.uv_project.subprocess.Popen")
+    def test_uv_commands_run_with_explicit_cwd(self, mock_popen, mock_which):
+        mock_popen.return_value.communicate.return_value = ("", None)
+        mock_popen.return_value.returncode = 0
+        cwd = os.getcwd()
+        project_dir = self.root / "example_project"
+        create_new_project(
+            name="example_project",
+            use_lts=False,
+            project_dir=project_dir,
+            initialize_uv=True,
+            initialize_env=True,
+            resolver=resolve_django_5_1,
+        )
+
+        assert os.getcwd() == cwd
+        commands = [(call.args[0], call.kwargs["cwd"]) for call in mock_popen.call_args_list]
+        assert commands[0][0] == ["uv", "lock"]
+        assert commands[0][1].parent == self.root and commands[0][1] != project_dir
+        assert commands[1:] == [
+            (["git", "init"], project_dir),
+            (["uv", "sync", "--locked"], project_dir),
+            (["uv", "run", "--no-sync", "manage.py", "migrate"], project_dir),
+        ]
+        pyproject = (project_dir / "pyproject.toml").read_text()
+        assert 'name = "example-project"' in pyproject
+        assert '"django~=5.1",\n    "environs[django]",' in pyproject
+        assert 'requires-python = ">=3.12"' in pyproject
+        assert (project_dir / ".python-version").read_text() == "3.12\n"
+
+    @mock.patch("dj_beat_drop.uv_project.subprocess.Popen")
+    def test_python_version_is_pinned_as_uv_picks_it(self, mock_popen):
+        mock_popen.return_value.communicate.return_value = ("3.11.9\n", None)
+        mock_popen.return_value.returncode = 0
+        assert find_python_version(None, self.root) == "3.11"
+        assert find_python_version("3.11", self.root) == "3.11"
+        commands = [(call.args[0], call.kwargs["cwd"]) for call in mock_popen.call_args_list]
+        assert commands == [
+            (["uv", "python", "find", "--show-version"], self.root),
+            (["uv", "python", "find", "--show-version", "3.11"], self.root),
+        ]
+
+        mock_popen.return_value.communicate.return_value = ("No interpreter found\n", None)
+        with self.assertRaisesRegex(uv_project.CommandError, "No interpreter found"):
+            find_python_version(None, self.root)
+
+    @mock.patch("dj_beat_drop.uv_project.subprocess.Popen")
+    def test_python_request_is_passed_to_uv(self, mock_popen):
+        mock_popen.return_value.communicate.return_value = ("", None)
+        mock_popen.return_value.returncode = 0
+        create_new_project(
+            name="example",
+            use_lts=False,
+            project_dir=self.root / "example",
+            initialize_uv=True,
+            initialize_env=False,
+            python="3.11",
+            resolver=resolve_django_5_1,
+        )
+        self.find_python_version.assert_called_once_with("3.11", self.root)
+
+    def test_git_repository_is_created_outside_of_one(self):
+        with mock.patch("dj_beat_drop.uv_project.shutil.which", return_value="/usr/bin/git"):
+            assert uv_project.needs_git_repository(self.root / "example") is True
+            (self.root / ".git").mkdir()
+            assert uv_project.needs_git_repository(self.root / "example") is False
+        with mock.patch("dj_beat_drop.uv_project.shutil.which", return_value=None):
+            assert uv_project.needs_git_repository(self.root / "other" / "example") is False
+
+    @mock.patch("dj_beat_drop.uv_project.subprocess.Popen")
+    def test_existing_project_dir_fails_before_any_work(self, mock_popen):
+        project_dir = self.root / "example"
+        project_dir.mkdir()
+        (project_dir / "manage.py").write_text("")
+        with self.assertRaises(FileExistsError):
+            create_new_project(
+                name="example",
+                use_lts=False,
+                project_dir=project_dir,
+                initialize_uv=True,
+                initialize_env=True,
+                resolver=resolve_django_5_1,
+            )
+        with self.assertRaises(FileExistsError):
+            asyncio.run(
+                create_new_project_async(
+                    name="example",
+                    use_lts=False,
+                    project_dir=project_dir,
+                    initialize_uv=True,
+                    initialize_env=True,
+                    resolver=resolve_django_5_1,
+                )
+            )
+
+        mock_popen.assert_not_called()
+        assert [path.name for path in self.root.iterdir()] == ["example"]
+
+    def test_env_file_is_written_before_the_rename(self):
+        project_dir = self.root / "example"
+        renamed = []
+        os_rename = os.rename
+
+        def rename(source, target):
+            renamed.append(sorted(path.name for path in Path(source).iterdir()))
+            os_rename(source, target)
+
+        with mock.patch("dj_beat_drop.render.os.rename", side_effect=rename):
+            create_new_project(
+                name="example",
+                use_lts=False,
+                project_dir=project_dir,
+                initialize_uv=False,
+                initialize_env=True,
+                resolver=resolve_django_5_1,
+            )
+
+        assert ".env" in renamed[0]
+        assert f"DATABASE_URL=sqlite:///{project_dir / 'db.sqlite3'}?" in (project_dir / ".env").read_text()
+
+    @mock.patch("dj_beat_drop.uv_project.subprocess.Popen")
+    def test_failed_uv_command_raises(self, mock_popen):
+        mock_popen.return_value.communicate.return_value = ("No solution found", None)
+        mock_popen.return_value.returncode = 1
+        mock_popen.return_value.args = ["uv", "lock"]
+        with self.assertRaisesRegex(uv_project.CommandError, "No solution found"):
+            create_new_project(
+                name="example",
+                use_lts=False,
+                project_dir=self.root / "example",
+                initialize_uv=True,
+                initialize_env=False,
+                resolver=resolve_django_5_1,
+            )
+        assert list(self.root.iterdir()) == []
+
+    def create_projects(self, lock_command: list[str], render_files):
+        """Create a project with both APIs, with ``lock_command`` as `uv lock` and ``render_files`` rendering it."""
+        kwargs = {"use_lts": False, "initialize_uv": True, "initialize_env": True, "resolver": resolve_django_5_1}
+        for create in ("sync", "async"):
+            with (
+                self.subTest(create=create),
+                mock.patch("dj_beat_drop.uv_project.LOCK_COMMAND", lock_command),
+                mock.patch("dj_beat_drop.new.render_project", side_effect=render_files),
+            ):
+                started_at = time.perf_counter()
+                if create == "sync":
+                    yield lambda: create_new_project(name="example", project_dir=self.root / "example", **kwargs)
+                else:
+                    yield lambda: asyncio.run(
+                        create_new_project_async(name="example", project_dir=self.root / "example", **kwargs)
+                    )
+                assert time.perf_counter() - started_at < 10
+                assert list(self.root.iterdir()) == []
+
+    def test_failed_render_stops_uv_lock(self):
+        def render_files(staging_dir, template_context, options):
+            raise ValueError("Bad template")
+
+        for create in self.create_projects([sys.executable, "-c", "import time; time.sleep(30)"], render_files):
+            with self.assertRaisesRegex(ValueError, "Bad template"):
+                create()
+
+    def test_render_is_waited_for_when_uv_lock_fails(self):
+        def render_files(staging_dir, template_context, options):
+            time.sleep(0.2)
+            return render_project(staging_dir, template_context, options)
+
+        for create in self.create_projects([sys.executable, "-c", "raise SystemExit(1)"], render_files):
+            with self.assertRaises(uv_project.CommandError):
+                create()
+
+    def test_render_error_is_raised_over_a_uv_lock_error(self):
+        def render_files(staging_dir, template_context, options):
+            time.sleep(0.2)
+            raise ValueError("Bad template")
+
+        for create in self.create_projects([sys.executable, "-c", "raise SystemExit(1)"], render_files):
+            with self.assertRaisesRegex(ValueError, "Bad template"):
+                create()
+
+    def test_sync_and_async_projects_are_created_alike(self):
+        commands = []
+
+        def start_command(command, cwd):
+            commands.append((command, cwd.name))
+            return mock.Mock()
+
+        async def run_command_async(command, cwd):
+            commands.append((command, cwd.name))
+            return ""
+
+        with (
+            mock.patch("dj_beat_drop.uv_project.start_command", side_effect=start_command),
+            mock.patch("dj_beat_drop.uv_project.wait_command", return_value=""),
+            mock.patch("dj_beat_drop.uv_project.run_command_async", side_effect=run_command_async),
+        ):
+            kwargs = {"use_lts": False, "initialize_uv": True, "initialize_env": True, "resolver": resolve_django_5_1}
+            create_new_project(name="threaded", project_dir=self.root / "threaded", **kwargs)
+            sync_commands = commands.copy()
+            commands.clear()
+            asyncio.run(create_new_project_async(name="awaited", project_dir=self.root / "awaited", **kwargs))
+
+        assert [command for command, _ in commands] == [command for command, _ in sync_commands]
+        assert {cwd for _, cwd in commands[1:]} == {"awaited"}
+        for path in ("pyproject.toml", ".env", "config/settings.py"):
+            sync_content = (self.root / "threaded" / path).read_text().replace("threaded", "{name}")
+            assert (self.root / "awaited" / path).read_text().replace("awaited", "{name}") == sync_content
+
+    def test_async_projects_are_created_concurrently(self):
+        async def create_projects():
+            return await asyncio.gather(
+                *[
+                    create_new_project_async(
+                        name=name,
+                        use_lts=False,
+                        project_dir=self.root / name,
+                        initialize_uv=False,
+                        initialize_env=False,
+                        resolver=resolve_django_5_1,
+                    )
+                    for name in ("billing", "search", "ledger")
+                ]
+            )
+
+        contexts = asyncio.run(create_projects())
+
+        assert [context["django_version"] for context in contexts] == ["5.1.3"] * 3
+        for name in ("billing", "search", "ledger"):
+            settings = (self.root / name / "config" / "settings.py").read_text()
+            assert "Django settings for config project." in settings
+            assert "PRAGMA journal_mode = WAL;" in settings
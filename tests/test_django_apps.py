@@ -0,0 +1,75 @@
+import ast
+import itertools
+from unittest import mock
+
+from typer.testing import CliRunner
+
+from dj_beat_drop import databases, django_apps, main_cli, servers, settings_engine, uv_project
+from dj_beat_drop.update import update_project
+from tests.helpers import CONTEXT_4_2, CONTEXT_5_1, ProjectTestCase
+
+
+class TestDjangoApps(ProjectTestCase):
+    project_options = {"use_perf_preset": True}
+
+    def test_apps_are_rendered_in_process_and_installed(self):
+        with mock.patch("subprocess.Popen") as popen:
+            self.create_project(app_names=["blog", "user_profiles"])
+        popen.assert_not_called()
+
+        app_dir = self.project_dir / "user_profiles"
+        files = sorted(path.relative_to(app_dir).as_posix() for path in app_dir.rglob("*.py"))
+        assert files == [
+            "__init__.py",
+            "admin.py",
+            "apps.py",
+            "migrations/__init__.py",
+            "models.py",
+            "tests.py",
+            "views.py",
+        ]
+        assert "class UserProfilesConfig(AppConfig):\n" in (app_dir / "apps.py").read_text()
+        assert "    name = 'user_profiles'\n" in (app_dir / "apps.py").read_text()
+        settings = (self.project_dir / "config" / "settings.py").read_text()
+        assert "    'django.contrib.staticfiles',\n    'blog',\n    'user_profiles',\n]\n" in settings
+        ast.parse(settings)
+
+    def test_apps_are_kept_on_update(self):
+        self.create_project(CONTEXT_4_2, app_names=["blog"])
+        (self.project_dir / "blog" / "models.py").write_text("from django.db import models\n\n\nclass Post: ...\n")
+
+        results = update_project(self.project_dir, CONTEXT_5_1)
+
+        assert "blog/models.py" in results["unchanged"] and "blog/apps.py" in results["unchanged"]
+        assert (self.project_dir / "blog" / "models.py").read_text().endswith("class Post: ...\n")
+        assert "    'blog',\n]\n" in (self.project_dir / "config" / "settings.py").read_text()
+
+    def test_parse_app_names(self):
+        assert django_apps.parse_app_names("blog, shop,,") == ["blog", "shop"]
+        assert django_apps.parse_app_names(None) == []
+
+    def test_invalid_app_names(self):
+        for app_names in (["Blog"], ["2fa"], ["class"], ["config"], ["json"], ["whitenoise"], ["blog", "blog"]):
+            with self.subTest(app_names=app_names), self.assertRaises(ValueError):
+                django_apps.check_app_names(app_names)
+
+        result = CliRunner().invoke(main_cli.main_command, ["new", "example", "--apps", "blog,json"])
+        assert result.exit_code == 2
+        assert "--apps" in result.output
+
+    def test_app_names_are_checked_against_the_project_dependencies(self):
+        from packaging.requirements import Requirement
+
+        for database, use_perf_preset, server in itertools.product(
+            databases.DATABASE_CHOICES, (False, True), (None, *servers.SERVERS)
+        ):
+            dependencies = uv_project.get_dependencies(CONTEXT_5_1, True, None, database, use_perf_preset, server)
+            modules = {Requirement(dependency).name.replace("-", "_") for dependency in dependencies}
+            assert modules <= django_apps.DEPENDENCY_MODULES
+        # An app can be named after a package installed alongside beatdrop but not in the project.
+        django_apps.check_app_names(["typer", "requests"])
+
+    def test_installed_apps_on_one_line(self):
+        settings = settings_engine.Settings("INSTALLED_APPS = ['django.contrib.admin']\n")
+        with self.assertRaises(settings_engine.SettingsTransformError):
+            django_apps.configure_installed_apps(settings, ["blog"])
@@ -0,0 +1,154 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import TestCase, mock
+
+from dj_beat_drop import lock_cache, uv_project, warm
+from dj_beat_drop.new import create_new_project
+from tests.helpers import CONTEXT_5_1
+
+DEPENDENCIES = ["django~=5.1", "environs[django]"]
+UV_LOCK = """version = 1
+requires-python = ">=3.13"
+
+[[package]]
+name = "django"
+version = "5.1.3"
+source = {{ registry = "https://pypi.org/simple" }}
+
+[[package]]
+name = "{name}"
+version = "0.1.0"
+source = {{ virtual = "." }}
+dependencies = [
+    {{ name = "django" }},
+]
+
+[package.metadata]
+requires-dist = [
+    {{ name = "django", specifier = "{specifier}" }},
+]
+"""
+
+
+class TestLockCache(TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.root = Path(tmp_dir.name)
+        env_patcher = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(self.root / "cache")})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+
+    def create_project_dir(self, name: str, python_version: str = "3.13") -> Path:
+        project_dir = self.root / name
+        project_dir.mkdir()
+        (project_dir / ".python-version").write_text(f"{python_version}\n")
+        return project_dir
+
+    def create_locked_project(self, name: str, specifier: str = "~=5.1") -> Path:
+        project_dir = self.create_project_dir(name)
+        (project_dir / "uv.lock").write_text(
+            UV_LOCK.format(name=lock_cache.get_package_name(name), specifier=specifier)
+        )
+        return project_dir
+
+    def test_lock_is_restored_under_the_project_name(self):
+        source_dir = self.create_locked_project("billing_api")
+        target_dir = self.create_project_dir("search")
+        assert lock_cache.restore_lock(target_dir, "search", CONTEXT_5_1, DEPENDENCIES) is False
+
+        lock_path = lock_cache.save_lock(source_dir, "billing_api", CONTEXT_5_1, DEPENDENCIES)
+        assert 'name = "dj-beat-drop-project"' in lock_path.read_text()
+        assert lock_cache.restore_lock(target_dir, "search", CONTEXT_5_1, list(reversed(DEPENDENCIES))) is True
+        assert (target_dir / "uv.lock").read_text() == UV_LOCK.format(name="search", specifier="~=5.1")
+
+    def test_lock_is_keyed_by_django_release_python_and_dependencies(self):
+        lock_cache.save_lock(self.create_locked_project("source"), "source", CONTEXT_5_1, DEPENDENCIES)
+        target_dir = self.create_project_dir("target")
+        other_python_dir = self.create_project_dir("other_python", python_version="3.12")
+
+        assert (
+            lock_cache.restore_lock(target_dir, "target", {**CONTEXT_5_1, "django_version": "5.1.4"}, DEPENDENCIES)
+            is False
+        )
+        assert lock_cache.restore_lock(target_dir, "target", CONTEXT_5_1, ["django~=5.1"]) is False
+        assert lock_cache.restore_lock(other_python_dir, "other_python", CONTEXT_5_1, DEPENDENCIES) is False
+
+    def test_lock_is_shared_by_requirements_for_the_same_release(self):
+        # `beatdrop warm --django 5.1` pins the patch release, `beatdrop new` doesn't.
+        source_dir = self.create_locked_project("source", specifier="~=5.1.3")
+        lock_cache.save_lock(source_dir, "source", CONTEXT_5_1, ["django~=5.1.3", "environs[django]"])
+        target_dir = self.create_project_dir("target")
+
+        assert lock_cache.restore_lock(target_dir, "target", CONTEXT_5_1, DEPENDENCIES) is True
+        assert (target_dir / "uv.lock").read_text() == UV_LOCK.format(name="target", specifier="~=5.1")
+
+    def test_lock_is_saved_from_many_threads(self):
+        project_dirs = [self.create_locked_project(f"project_{index}") for index in range(8)]
+        with ThreadPoolExecutor(max_workers=len(project_dirs)) as executor:
+            lock_paths = list(
+                executor.map(
+                    lambda project_dir: lock_cache.save_lock(project_dir, project_dir.name, CONTEXT_5_1, DEPENDENCIES),
+                    project_dirs,
+                )
+            )
+
+        assert lock_paths == [lock_cache.get_lock_path(CONTEXT_5_1, DEPENDENCIES, "3.13")] * len(project_dirs)
+        assert [path.name for path in lock_cache.get_lock_dir().iterdir()] == [lock_paths[0].name]
+
+    def test_unexpected_lock_is_not_cached(self):
+        project_dir = self.create_locked_project("source")
+        assert lock_cache.save_lock(project_dir, "other", CONTEXT_5_1, DEPENDENCIES) is None
+        assert lock_cache.save_lock(self.root, "source", CONTEXT_5_1, DEPENDENCIES) is None
+
+    @mock.patch("dj_beat_drop.uv_project.find_python_version", return_value="3.13")
+    @mock.patch("dj_beat_drop.uv_project.subprocess.Popen")
+    def test_new_project_locks_from_the_cache(self, mock_popen, mock_find_python_version):
+        lock_cache.save_lock(self.create_locked_project("source"), "source", CONTEXT_5_1, DEPENDENCIES)
+        locks = []
+
+        def popen(command, cwd, **kwargs):
+            if command == uv_project.LOCK_COMMAND:
+                locks.append((cwd / "uv.lock").read_text())
+            return mock.Mock(returncode=0, communicate=mock.Mock(return_value=("", None)))
+
+        mock_popen.side_effect = popen
+        create_new_project(
+            name="example",
+            use_lts=False,
+            project_dir=self.root / "example",
+            initialize_uv=True,
+            initialize_env=True,
+            resolver=lambda **kwargs: CONTEXT_5_1,
+        )
+
+        assert locks == [UV_LOCK.format(name="example", specifier="~=5.1")]
+
+    def test_warm_caches_a_lock_with_and_without_environs(self):
+        def run_command(command, cwd):
+            if command == uv_project.FIND_PYTHON_COMMAND:
+                return "3.13.0\n"
+            if command == uv_project.LOCK_COMMAND:
+                (cwd / "uv.lock").write_text(UV_LOCK.format(name=lock_cache.PLACEHOLDER_NAME, specifier="~=5.1"))
+            return ""
+
+        with (
+            mock.patch("dj_beat_drop.utils.get_template_context", return_value=CONTEXT_5_1),
+            mock.patch("dj_beat_drop.uv_project.run_command", side_effect=run_command) as mock_run_command,
+        ):
+            assert warm.handle_warm(use_lts=False) is True
+
+        assert [call.args[0] for call in mock_run_command.call_args_list].count(uv_project.SYNC_COMMAND) == 2
+        for dependencies in (DEPENDENCIES, ["django~=5.1"]):
+            assert lock_cache.get_lock_path(CONTEXT_5_1, dependencies, "3.13").exists()
+
+    def test_failed_warm(self):
+        error = uv_project.CommandError(uv_project.LOCK_COMMAND, 1, "No solution found")
+        with (
+            mock.patch("dj_beat_drop.utils.get_template_context", return_value=CONTEXT_5_1),
+            mock.patch("dj_beat_drop.uv_project.run_command", side_effect=error),
+        ):
+            assert warm.handle_warm(use_lts=False) is False
+        assert lock_cache.get_lock_dir().exists() is False
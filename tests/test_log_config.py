@@ -0,0 +1,84 @@
+import contextlib
+import io
+import json
+import logging
+import logging.config
+import runpy
+import sys
+
+from dj_beat_drop import log_config
+from tests.helpers import CONTEXT_5_1, ProjectTestCase
+
+
+class TestLogConfig(ProjectTestCase):
+    def configure_logging(self, logging_settings: dict) -> io.StringIO:
+        """Apply the generated ``LOGGING`` with stderr captured, restoring the loggers it changes afterwards."""
+        loggers = [logging.getLogger(), logging.getLogger("django")]
+        saved = [(logger, logger.handlers[:], logger.level, logger.propagate) for logger in loggers]
+
+        def restore():
+            for logger, handlers, level, propagate in saved:
+                for handler in logger.handlers:
+                    handler.close()
+                logger.handlers[:] = handlers
+                logger.setLevel(level)
+                logger.propagate = propagate
+
+        self.addCleanup(restore)
+        sys.path.insert(0, str(self.project_dir))
+        self.addCleanup(sys.path.remove, str(self.project_dir))
+        self.addCleanup(sys.modules.pop, "config.log_handlers", None)
+        self.addCleanup(sys.modules.pop, "config", None)
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            logging.config.dictConfig(logging_settings)
+        return stderr
+
+    def test_records_are_written_by_the_listener_thread(self):
+        self.create_project(initialize_env=False, log_format=log_config.JSON_FORMAT)
+        settings = runpy.run_path(str(self.project_dir / "config" / "settings.py"))
+        # Django isn't installed here, so configure the queue without Django's mail_admins handler.
+        logging_settings = settings["LOGGING"]
+        del logging_settings["filters"], logging_settings["handlers"]["mail_admins"]
+        logging_settings["loggers"]["django"]["handlers"].remove("mail_admins")
+        stderr = self.configure_logging(logging_settings)
+
+        handler = logging.getLogger().handlers[0]
+        assert type(handler).__name__ == "QueueStreamHandler"
+        logging.getLogger("django.request").warning("Slow %s", "request")
+        handler.close()
+
+        entry = json.loads(stderr.getvalue())
+        assert entry["level"] == "WARNING"
+        assert entry["logger"] == "django.request"
+        assert entry["message"] == "Slow request"
+
+    def test_errors_are_still_emailed_to_admins(self):
+        self.create_project(initialize_env=False)
+        logging_settings = runpy.run_path(str(self.project_dir / "config" / "settings.py"))["LOGGING"]
+
+        # As in django.utils.log.DEFAULT_LOGGING.
+        assert logging_settings["loggers"]["django"]["handlers"] == ["queue", "mail_admins"]
+        assert logging_settings["handlers"]["mail_admins"] == {
+            "level": "ERROR",
+            "filters": ["require_debug_false"],
+            "class": "django.utils.log.AdminEmailHandler",
+        }
+        assert logging_settings["filters"] == {"require_debug_false": {"()": "django.utils.log.RequireDebugFalse"}}
+
+    def test_plain_settings(self):
+        settings = self.create_project(initialize_env=False)
+
+        assert "\nDEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'\n\n\n# Logging\n" in settings
+        assert "'()': 'config.log_handlers.QueueStreamHandler',\n            'formatter': 'plain'," in settings
+        assert (self.project_dir / "config" / "log_handlers.py").read_text() == log_config.get_log_handlers_module()
+
+    def test_environs_settings(self):
+        settings = self.create_project(initialize_env=True, log_format=log_config.JSON_FORMAT)
+
+        assert "'formatter': env.str(\"LOG_FORMAT\", 'json')," in settings
+        assert "LOG_FORMAT=json\n" in (self.project_dir / ".env").read_text()
+
+    def test_unknown_log_format(self):
+        with self.assertRaises(ValueError):
+            log_config.add_logging("", CONTEXT_5_1, initialize_env=False, log_format="xml")
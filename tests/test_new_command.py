@@ -1,10 +1,12 @@
+import os
 import random
 import re
 import shutil
 import string
+import tempfile
 from pathlib import Path
 from textwrap import dedent
-from unittest import TestCase
+from unittest import TestCase, mock
 
 from packaging.version import Version
 
@@ -97,6 +99,19 @@ class TestNewCommand(TestCase):
         characters = string.ascii_lowercase + string.digits
         return "".join(random.choice(characters) for _ in range(length))  # noqa: S311
 
+    @classmethod
+    def setUpClass(cls):
+        # One cache for the whole class keeps the user's cache out of the tests without every test starting cold.
+        tmp_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp_dir.cleanup)
+        # uv also honors XDG_CACHE_HOME, so keep it on its own cache rather than downloading Django again.
+        uv_cache_dir = os.environ.get("UV_CACHE_DIR") or str(
+            Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "uv"
+        )
+        env_patcher = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": tmp_dir.name, "UV_CACHE_DIR": uv_cache_dir})
+        env_patcher.start()
+        cls.addClassCleanup(env_patcher.stop)
+
     def setUp(self):
         random_hash = self._generate_random_hash()
         self.project_name = f"test_project_{random_hash}"
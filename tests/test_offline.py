@@ -0,0 +1,68 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
+
+from typer.testing import CliRunner
+
+from dj_beat_drop import main_cli, utils, uv_project
+from dj_beat_drop.new import create_new_project
+
+
+class TestOfflineMode(TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.root = Path(tmp_dir.name)
+        env_patcher = mock.patch.dict(
+            os.environ, {"XDG_CACHE_HOME": str(self.root / "cache"), utils.OFFLINE_ENV_VAR: "1"}
+        )
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        utils.get_django_releases.cache_clear()
+        self.addCleanup(utils.get_django_releases.cache_clear)
+
+        session_patcher = mock.patch("dj_beat_drop.utils.get_session", side_effect=OSError("Network is unreachable"))
+        self.mock_get_session = session_patcher.start()
+        self.addCleanup(session_patcher.stop)
+
+    def test_releases_are_resolved_from_the_bundled_manifest(self):
+        manifest = utils.load_release_manifest()
+        bundled = {path.name for path in utils.RELEASE_MANIFEST_PATH.parent.iterdir() if path.is_dir()}
+
+        assert {utils.get_minor_version(release) for release in manifest["releases"]} == bundled
+        assert utils.get_template_context(use_lts=False)["django_version"] == manifest["latest"]
+        assert utils.get_template_context(use_lts=True)["docs_version"] == "4.2"
+        self.mock_get_session.assert_not_called()
+
+    def test_project_is_created_without_the_network(self):
+        project_dir = self.root / "example"
+        context = create_new_project(
+            name="example", use_lts=False, project_dir=project_dir, initialize_uv=False, initialize_env=True
+        )
+
+        assert (project_dir / "config" / "settings.py").exists()
+        assert context["django_version"] == utils.load_release_manifest()["latest"]
+        self.mock_get_session.assert_not_called()
+
+    def test_uv_runs_offline(self):
+        assert uv_project.get_command_env()["UV_OFFLINE"] == "1"
+
+    def test_version_check_is_skipped(self):
+        version_check = mock.Mock(spec=main_cli.VersionCheck)
+        result = CliRunner().invoke(main_cli.main_command, ["cache", "stats"], obj=version_check)
+
+        assert result.exit_code == 0
+        version_check.start.assert_not_called()
+
+    def test_offline_flag(self):
+        os.environ.pop(utils.OFFLINE_ENV_VAR)
+        version_check = mock.Mock(spec=main_cli.VersionCheck)
+        CliRunner().invoke(main_cli.main_command, ["cache", "stats"], obj=version_check)
+        version_check.start.assert_called_once()
+        assert utils.is_offline() is False
+
+        version_check = mock.Mock(spec=main_cli.VersionCheck)
+        CliRunner().invoke(main_cli.main_command, ["--offline", "cache", "stats"], obj=version_check)
+        version_check.start.assert_not_called()
+        assert utils.is_offline() is True
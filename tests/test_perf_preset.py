@@ -0,0 +1,63 @@
+import ast
+
+from dj_beat_drop import perf_preset, uv_project
+from dj_beat_drop.update import update_project
+from tests.helpers import CONTEXT_4_2, CONTEXT_5_1, ProjectTestCase
+
+
+def get_setting(settings: str, name: str):
+    for node in ast.parse(settings).body:
+        if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) == name:
+            return ast.literal_eval(node.value)
+    raise AssertionError(f"No {name} setting.")
+
+
+class TestPerfPreset(ProjectTestCase):
+    project_options = {"use_perf_preset": True}
+
+    def test_settings(self):
+        settings = self.create_project(CONTEXT_5_1, initialize_env=False)
+
+        assert settings.startswith('"""') and "\nimport os\nfrom pathlib import Path\n" in settings
+        assert get_setting(settings, "MIDDLEWARE")[:2] == [
+            "django.middleware.security.SecurityMiddleware",
+            "whitenoise.middleware.WhiteNoiseMiddleware",
+        ]
+        templates = get_setting(settings, "TEMPLATES")[0]
+        assert templates["APP_DIRS"] is False
+        assert templates["OPTIONS"]["loaders"][0][0] == "django.template.loaders.cached.Loader"
+        assert "context_processors" in templates["OPTIONS"]
+        assert get_setting(settings, "CACHES")["default"]["BACKEND"] == "django.core.cache.backends.locmem.LocMemCache"
+        assert "if os.environ.get('REDIS_URL'):" in settings
+        assert get_setting(settings, "SESSION_ENGINE") == "django.contrib.sessions.backends.cached_db"
+        storages = get_setting(settings.replace("BASE_DIR / ", ""), "STORAGES")
+        assert storages["staticfiles"]["BACKEND"] == "whitenoise.storage.CompressedManifestStaticFilesStorage"
+        assert "STATIC_URL = 'static/'\nSTATIC_ROOT = BASE_DIR / 'staticfiles'\n" in settings
+        assert "'transaction_mode': 'IMMEDIATE'" in settings
+        assert "/en/5.1/topics/cache/" in settings
+
+    def test_settings_with_environs(self):
+        settings = self.create_project(CONTEXT_4_2, initialize_env=True)
+
+        assert "import os" not in settings
+        assert 'if env.str("REDIS_URL", ""):' in settings
+        assert "\n\n\n# Cache\n" in settings and 'env.dj_db_url("DATABASE_URL")}\n\n\n# Cache' in settings
+
+    def test_preset_is_kept_on_update(self):
+        self.create_project(CONTEXT_4_2, initialize_env=False)
+
+        assert "config/settings.py" in update_project(self.project_dir, CONTEXT_5_1)["updated"]
+        settings = (self.project_dir / "config" / "settings.py").read_text()
+        assert settings.count("whitenoise.middleware.WhiteNoiseMiddleware") == 1
+        assert "/en/5.1/topics/cache/" in settings
+
+    def test_missing_anchor_fails_loudly(self):
+        with self.assertRaises(ValueError):
+            perf_preset.apply_perf_preset("DEBUG = True\n", "5.1", initialize_env=True)
+
+    def test_dependencies(self):
+        assert uv_project.get_dependencies(CONTEXT_5_1, False, use_perf_preset=True) == [
+            "django~=5.1",
+            "whitenoise",
+            "redis",
+        ]
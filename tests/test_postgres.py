@@ -0,0 +1,71 @@
+import ast
+
+from dj_beat_drop import databases, project_manifest, uv_project
+from dj_beat_drop.update import update_project
+from tests.helpers import CONTEXT_4_2, CONTEXT_5_1, ProjectTestCase
+
+
+def get_databases_setting(settings: str) -> dict:
+    for node in ast.parse(settings).body:
+        if isinstance(node, ast.Assign) and node.targets[0].id == "DATABASES":
+            return ast.literal_eval(node.value)
+    raise AssertionError("No DATABASES setting.")
+
+
+class TestPostgres(ProjectTestCase):
+    project_name = "example-site"
+    project_options = {"database": databases.POSTGRES_DATABASE}
+
+    def test_pool_on_django_5_1(self):
+        settings = self.create_project(CONTEXT_5_1, initialize_env=False)
+
+        assert get_databases_setting(settings.replace("BASE_DIR / ", "")) == {
+            "default": {
+                "ENGINE": "django.db.backends.postgresql",
+                "NAME": "example_site",
+                "USER": "postgres",
+                "PASSWORD": "",
+                "HOST": "localhost",
+                "PORT": "5432",
+                "OPTIONS": {"pool": {"min_size": 2, "max_size": 4, "timeout": 10}},
+            }
+        }
+        assert not (self.project_dir / "db.sqlite3").exists()
+
+    def test_persistent_connections_on_django_4_2(self):
+        settings = self.create_project(CONTEXT_4_2, initialize_env=False)
+        default = get_databases_setting(settings.replace("BASE_DIR / ", ""))["default"]
+
+        assert default["CONN_MAX_AGE"] == 600
+        assert default["CONN_HEALTH_CHECKS"] is True
+        assert "OPTIONS" not in default
+
+    def test_environs(self):
+        settings = self.create_project(CONTEXT_5_1, initialize_env=True)
+
+        assert 'DATABASES = {"default": env.dj_db_url("DATABASE_URL")}\n' in settings
+        assert 'DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {"min_size": 2,' in settings
+        ast.parse(settings)
+        env = (self.project_dir / ".env").read_text()
+        assert "DATABASE_URL=postgres://postgres@localhost:5432/example_site\n" in env
+
+    def test_pool_is_added_on_update(self):
+        self.create_project(CONTEXT_4_2, initialize_env=True)
+        settings_path = self.project_dir / "config" / "settings.py"
+        assert "conn_max_age=600, conn_health_checks=True" in settings_path.read_text()
+
+        assert "config/settings.py" in update_project(self.project_dir, CONTEXT_5_1)["updated"]
+        assert '["pool"]' in settings_path.read_text()
+        assert project_manifest.read_project_manifest(self.project_dir)["options"]["database"] == "postgres"
+
+    def test_dependencies(self):
+        assert uv_project.get_dependencies(CONTEXT_5_1, True, database="postgres") == [
+            "django~=5.1",
+            "environs[django]",
+            "psycopg[binary,pool]",
+        ]
+        assert uv_project.get_dependencies(CONTEXT_4_2, False, database="postgres") == [
+            "django~=4.2",
+            "psycopg[binary]",
+        ]
+        assert uv_project.get_dependencies(CONTEXT_4_2, False) == ["django~=4.2"]
@@ -0,0 +1,123 @@
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from unittest import TestCase, mock
+
+from dj_beat_drop import cache, utils
+
+RELEASES = ["4.2", "4.2.16", "5.1", "5.1.1", "5.1.2"]
+SIMPLE_INDEX_RESPONSE = {
+    "meta": {"api-version": "1.1"},
+    "files": [
+        *[{"filename": f"django-{release}-py3-none-any.whl", "yanked": False} for release in RELEASES],
+        {"filename": "Django-5.1.3.tar.gz", "yanked": "Broken release"},
+        {"filename": "django-5.2a1.tar.gz", "yanked": False},
+    ],
+    "versions": [*RELEASES, "5.1.3", "5.2a1"],
+}
+SIMPLE_INDEX_HTML = """
+<a href="../../packages/Django-5.1.3.tar.gz" data-yanked="Broken release">Django-5.1.3.tar.gz</a>
+<a href="../../packages/django-5.1.1.tar.gz">django-5.1.1.tar.gz</a>
+<a href="../../packages/django-5.1.2-py3-none-any.whl">django-5.1.2-py3-none-any.whl</a>
+<a href="../../packages/django-4.2.16.tar.gz" >django-4.2.16.tar.gz</a>
+<a href="../../packages/django-5.2a1.tar.gz">django-5.2a1.tar.gz</a>
+"""
+
+
+def make_response(status_code, data=None, headers=None, text=""):
+    response = mock.Mock(status_code=status_code, headers=headers or {}, text=text, content=text.encode())
+    response.json.return_value = data
+    return response
+
+
+def make_json_response(headers=None):
+    return make_response(
+        200, SIMPLE_INDEX_RESPONSE, {"Content-Type": utils.SIMPLE_JSON_CONTENT_TYPE, **(headers or {})}
+    )
+
+
+def record_hits(count: int):
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: cache.record_event("hit"), range(count)))
+
+
+class TestReleaseCache(TestCase):
+    def setUp(self):
+        self.cache_home = tempfile.TemporaryDirectory()
+        env_patcher = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": self.cache_home.name})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        self.addCleanup(self.cache_home.cleanup)
+        utils.get_django_releases.cache_clear()
+        self.addCleanup(utils.get_django_releases.cache_clear)
+
+        session_patcher = mock.patch("dj_beat_drop.utils.get_session")
+        self.mock_get = session_patcher.start().return_value.get
+        self.addCleanup(session_patcher.stop)
+
+    def test_simple_index_skips_yanked_releases(self):
+        assert utils.parse_simple_index(make_json_response()) == {"latest": "5.1.2", "releases": [*RELEASES, "5.2a1"]}
+
+    def test_simple_index_html_fallback(self):
+        response = make_response(200, headers={"Content-Type": "text/html"}, text=SIMPLE_INDEX_HTML)
+        assert utils.parse_simple_index(response) == {
+            "latest": "5.1.2",
+            "releases": ["4.2.16", "5.1.1", "5.1.2", "5.2a1"],
+        }
+
+    def test_fresh_entry_is_served_without_a_request(self):
+        self.mock_get.return_value = make_json_response({"ETag": '"abc"'})
+        first = utils.get_django_releases()
+        utils.get_django_releases.cache_clear()
+        second = utils.get_django_releases()
+
+        assert first == second == {"latest": "5.1.2", "releases": [*RELEASES, "5.2a1"]}
+        assert self.mock_get.call_count == 1
+        assert cache.get_stats() == {"hit": 1, "revalidated": 0, "miss": 1}
+
+    def test_refresh_revalidates_with_etag(self):
+        self.mock_get.return_value = make_json_response({"ETag": '"abc"', "Last-Modified": "yesterday"})
+        utils.get_django_releases()
+        self.mock_get.return_value = make_response(304)
+        releases = utils.get_django_releases(refresh=True)
+
+        assert releases["latest"] == "5.1.2"
+        headers = self.mock_get.call_args.kwargs["headers"]
+        assert headers == {
+            "Accept": utils.SIMPLE_INDEX_ACCEPT,
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "yesterday",
+        }
+        assert cache.get_stats()["revalidated"] == 1
+        assert cache.get_hit_rate(cache.get_stats()) == 0.5
+
+    def test_stale_entry_is_refetched(self):
+        self.mock_get.return_value = make_json_response()
+        utils.get_django_releases()
+        utils.get_django_releases.cache_clear()
+        with mock.patch("dj_beat_drop.cache.RELEASES_CACHE_TTL", 0):
+            utils.get_django_releases()
+
+        assert self.mock_get.call_count == 2
+        assert cache.get_stats()["miss"] == 2
+
+    def test_events_are_counted_across_processes(self):
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            list(executor.map(record_hits, [50] * 4))
+        record_hits(50)
+
+        assert cache.get_stats() == {"hit": 250, "revalidated": 0, "miss": 0}
+
+    def test_clear_removes_everything(self):
+        cache.write_entry("django-releases", {"latest": "5.1.2"})
+        cache.record_event("miss")
+        for subdir in ("templates", "locks", "snapshots"):
+            (cache.get_cache_dir() / subdir).mkdir(parents=True)
+            (cache.get_cache_dir() / subdir / "entry").write_text("")
+
+        cache.clear()
+
+        assert cache.get_cache_dir().exists() is False
+        assert list(Path(self.cache_home.name).iterdir()) == []
+        assert cache.get_stats() == {"hit": 0, "revalidated": 0, "miss": 0}
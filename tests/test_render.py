@@ -0,0 +1,67 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from dj_beat_drop import render
+
+
+class TestRender(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.root = Path(self.tmp_dir.name)
+
+    def test_render_string_substitutes_all_placeholders(self):
+        content = "{{ project_name }}.settings {{ docs_version }} {{ unknown }} {{project_name}}"
+        rendered = render.render_string(content, {"project_name": "config", "docs_version": "5.1"})
+        assert rendered == "config.settings 5.1 {{ unknown }} {{project_name}}"
+
+    def test_get_target_path(self):
+        assert render.get_target_path("manage.py-tpl") == "manage.py"
+        assert render.get_target_path("project_name/settings.py-tpl") == "config/settings.py"
+        assert render.get_target_path("project_name/static/project_name.css") == "config/static/project_name.css"
+
+    def test_render_template_applies_transforms(self):
+        template_dir = self.root / "template"
+        (template_dir / "project_name").mkdir(parents=True)
+        (template_dir / "manage.py-tpl").write_text("'{{ project_name }}.settings'")
+        (template_dir / "project_name" / "settings.py-tpl").write_text("DEBUG = True")
+        project_dir = self.root / "project"
+
+        with render.staging_directory(project_dir) as staging_dir:
+            written = render.render_template(
+                template_dir, staging_dir, {"project_name": "config"}, {"config/settings.py": str.lower}
+            )
+
+        assert sorted(written) == ["config/settings.py", "manage.py"]
+        assert (project_dir / "manage.py").read_text() == "'config.settings'"
+        assert (project_dir / "config" / "settings.py").read_text() == "debug = true"
+        assert [path.name for path in self.root.iterdir() if path.name.endswith(".tmp")] == []
+
+    def test_staging_directory_is_removed_on_failure(self):
+        project_dir = self.root / "project"
+        with self.assertRaises(RuntimeError), render.staging_directory(project_dir) as staging_dir:
+            (staging_dir / "manage.py").write_text("")
+            raise RuntimeError("Render failed")
+
+        assert list(self.root.iterdir()) == []
+
+    def test_staging_directory_is_removed_when_the_rename_fails(self):
+        project_dir = self.root / "project"
+        project_dir.mkdir()
+        (project_dir / "existing.py").write_text("")
+        with self.assertRaises(OSError), render.staging_directory(project_dir) as staging_dir:
+            (staging_dir / "manage.py").write_text("")
+
+        assert [path.name for path in self.root.iterdir()] == ["project"]
+
+    def test_packaged_bundles_match_templates(self):
+        templates_dir = Path(render.__file__).parent / "templates"
+        for template_dir in templates_dir.iterdir():
+            if template_dir.is_dir() is False:
+                continue
+            bundle = render.load_template(template_dir)
+            assert render.get_bundle_path(template_dir).exists(), f"Missing bundle for {template_dir.name}"
+            assert bundle == render.compile_template(template_dir), (
+                f"The {template_dir.name} bundle is stale, run `just build_template_bundles`."
+            )
@@ -0,0 +1,84 @@
+import ast
+import asyncio
+import runpy
+from unittest import mock
+
+from dj_beat_drop import servers, uv_project
+from tests.helpers import CONTEXT_5_1, ProjectTestCase
+
+
+class TestServers(ProjectTestCase):
+    def load_config(self, cpu_count: int, environ: dict[str, str] | None = None) -> dict:
+        with (
+            mock.patch("os.sched_getaffinity", return_value=set(range(cpu_count)), create=True),
+            mock.patch.dict("os.environ", environ or {}),
+        ):
+            return runpy.run_path(str(self.project_dir / "gunicorn.conf.py"))
+
+    def test_gunicorn_is_sized_from_the_cpu_count(self):
+        self.create_project(initialize_env=False, server=servers.GUNICORN)
+
+        config = self.load_config(4)
+        assert config["wsgi_app"] == "config.wsgi:application"
+        assert (config["workers"], config["threads"], config["keepalive"]) == (9, 2, 5)
+        assert (config["max_requests"], config["max_requests_jitter"]) == (1000, 450)
+        config = self.load_config(1)
+        assert (config["workers"], config["threads"], config["keepalive"], config["max_requests_jitter"]) == (
+            3,
+            4,
+            5,
+            150,
+        )
+        assert self.load_config(4, {"WEB_CONCURRENCY": "2"})["workers"] == 2
+        assert "async def application" not in (self.project_dir / "config" / "asgi.py").read_text()
+
+    def test_uvicorn_runs_as_gunicorn_workers(self):
+        self.create_project(initialize_env=False, server=servers.UVICORN)
+
+        config = self.load_config(2)
+        assert config["wsgi_app"] == "config.asgi:application"
+        assert config["worker_class"] == "uvicorn_worker.UvicornWorker"
+        assert (config["workers"], config["threads"], config["keepalive"]) == (2, 1, 2)
+        assert "async def application(scope, receive, send):" in (self.project_dir / "config" / "asgi.py").read_text()
+
+    def test_granian(self):
+        self.create_project(initialize_env=False, server=servers.GRANIAN)
+
+        serve = (self.project_dir / "serve.py").read_text()
+        ast.parse(serve)
+        assert "'config.asgi:application'," in serve and "interface=Interfaces.ASGI," in serve
+        assert not (self.project_dir / "gunicorn.conf.py").exists()
+
+    def test_asgi_application_answers_lifespan_events(self):
+        requests = []
+
+        async def django_application(scope, receive, send):
+            requests.append(scope["type"])
+
+        namespace = {"get_asgi_application": lambda: django_application}
+        exec(servers.ASGI_APPLICATION, namespace)  # noqa: S102
+        messages = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+        sent = []
+
+        async def receive():
+            return next(messages)
+
+        async def send(message):
+            sent.append(message["type"])
+
+        asyncio.run(namespace["application"]({"type": "lifespan"}, receive, send))
+        asyncio.run(namespace["application"]({"type": "http"}, receive, send))
+        assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+        assert requests == ["http"]
+
+    def test_dependencies(self):
+        assert uv_project.get_dependencies(CONTEXT_5_1, False, server=servers.UVICORN) == [
+            "django~=5.1",
+            "gunicorn",
+            "uvicorn-worker",
+            "uvicorn[standard]",
+        ]
+
+    def test_unknown_server(self):
+        with self.assertRaises(ValueError):
+            servers.get_server_config("waitress", "config")
@@ -0,0 +1,105 @@
+import ast
+from unittest import TestCase, mock
+
+from dj_beat_drop import settings_engine
+from dj_beat_drop.new import get_project_options, get_project_transforms
+from dj_beat_drop.settings_engine import Settings, SettingsTransformError
+from tests.helpers import CONTEXT_5_1
+
+SETTINGS = (
+    "from pathlib import Path\n"
+    "\n"
+    "# Keep this comment\n"
+    "BASE_DIR = Path(__file__).resolve().parent.parent  # and this one\n"
+    "\n"
+    "INSTALLED_APPS = [\n"
+    "    'django.contrib.admin',  # The admin\n"
+    "    'django.contrib.auth',\n"
+    "]\n"
+    "\n"
+    "# Database\n"
+    "TITLE = 'Café ☕'; DEBUG = True\n"
+    "\n"
+    "DATABASES = {\n"
+    "    'default': {\n"
+    "        'ENGINE': 'django.db.backends.sqlite3',\n"
+    "        'NAME': BASE_DIR / 'db.sqlite3',\n"
+    "    }\n"
+    "}\n"
+)
+
+
+class TestSettingsEngine(TestCase):
+    def test_untouched_text_is_kept(self):
+        def add_app(settings: Settings):
+            item = settings.get_list_item(settings.get_setting("INSTALLED_APPS").value, "django.contrib.auth")
+            settings.insert(settings.get_line_end(item), "    'blog',\n")
+
+        new_settings = settings_engine.rewrite(SETTINGS, [add_app])
+        assert new_settings == SETTINGS.replace(
+            "    'django.contrib.auth',\n", "    'django.contrib.auth',\n    'blog',\n"
+        )
+
+    def test_transforms_share_one_parse(self):
+        def replace_debug(settings: Settings):
+            settings.replace_setting("DEBUG", "DEBUG = False")
+
+        def append_logging(settings: Settings):
+            settings.append("LOGGING = {}\n")
+
+        with mock.patch("ast.parse", wraps=ast.parse) as parse:
+            new_settings = settings_engine.rewrite(SETTINGS, [replace_debug, append_logging])
+        assert parse.call_count == 1
+        assert "TITLE = 'Café ☕'; DEBUG = False\n" in new_settings
+        assert new_settings.endswith("    }\n}\nLOGGING = {}\n")
+
+    def test_columns_after_non_ascii_text(self):
+        settings = Settings(SETTINGS)
+        debug = settings.get_setting("DEBUG")
+        assert SETTINGS[settings.get_start(debug) : settings.get_end(debug)] == "DEBUG = True"
+
+    def test_comments(self):
+        settings = Settings(SETTINGS)
+        assert SETTINGS[settings.get_comment("# Database") :].startswith("# Database\nTITLE")
+        assert settings.get_comment("# Keep this comment") == SETTINGS.index("# Keep")
+        # Comments inside or after a statement aren't section headings.
+        for comment in ("# The admin", "# and this one"):
+            with self.assertRaises(SettingsTransformError):
+                settings.get_comment(comment)
+
+    def test_insertions_at_one_offset_keep_their_order(self):
+        settings = Settings(SETTINGS)
+        offset = settings.get_comment("# Database")
+        settings.insert(offset, "A = 1\n")
+        settings.insert(offset, "B = 2\n")
+        assert "A = 1\nB = 2\n# Database\n" in settings.render()
+
+    def test_overlapping_edits(self):
+        settings = Settings(SETTINGS)
+        settings.replace_setting("DATABASES", "DATABASES = {}")
+        settings.replace(settings.get_dict_value(settings.get_setting("DATABASES").value, "default"), "{}")
+        with self.assertRaises(SettingsTransformError):
+            settings.render()
+
+    def test_missing_parts(self):
+        settings = Settings(SETTINGS)
+        databases = settings.get_setting("DATABASES").value
+        for lookup in (
+            lambda: settings.get_setting("MIDDLEWARE"),
+            lambda: settings.get_import("environs"),
+            lambda: settings.get_list_item(settings.get_setting("INSTALLED_APPS").value, "blog"),
+            lambda: settings.get_dict_value(databases, "replica"),
+            lambda: settings.get_dict_value(settings.get_setting("TITLE").value, "default"),
+        ):
+            with self.subTest(), self.assertRaises(SettingsTransformError):
+                lookup()
+
+    def test_invalid_settings(self):
+        with self.assertRaises(SettingsTransformError):
+            Settings("DEBUG = (\n")
+
+    def test_project_transform_fails_loudly(self):
+        options = get_project_options(initialize_env=True, use_perf_preset=True, log_format="json")
+        transform = get_project_transforms(CONTEXT_5_1, options)["config/settings.py"]
+        with self.assertRaises(SettingsTransformError):
+            transform("SECRET_KEY = 'secret'\nDEBUG = True\n")
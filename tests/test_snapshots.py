@@ -0,0 +1,84 @@
+import contextlib
+import os
+import sqlite3
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
+
+from dj_beat_drop import snapshots
+from dj_beat_drop.new import EXTRA_SQLITE_PARAMS
+
+UV_LOCK = """
+version = 1
+requires-python = ">=3.12"
+
+[[package]]
+name = "django"
+version = "{django_version}"
+source = {{ registry = "https://pypi.org/simple" }}
+
+[[package]]
+name = "{name}"
+version = "0.1.0"
+source = {{ virtual = "." }}
+{extra_packages}"""
+WHITENOISE_PACKAGE = """
+[[package]]
+name = "whitenoise"
+version = "6.8.2"
+source = { registry = "https://pypi.org/simple" }
+"""
+OPTIONS = {"apps": [], "perf_preset": False}
+
+
+class TestSnapshots(TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.root = Path(tmp_dir.name)
+        env_patcher = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(self.root / "cache")})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+
+    def create_project(self, name, django_version="5.1.3", migrated=False, extra_packages=""):
+        project_dir = self.root / name
+        project_dir.mkdir()
+        (project_dir / "uv.lock").write_text(
+            UV_LOCK.format(name=name, django_version=django_version, extra_packages=extra_packages)
+        )
+        if migrated is True:
+            with contextlib.closing(sqlite3.connect(project_dir / "db.sqlite3")) as connection:
+                connection.execute("CREATE TABLE django_migrations (app TEXT, name TEXT)")
+                connection.execute("INSERT INTO django_migrations VALUES ('auth', '0001_initial')")
+                connection.commit()
+        return project_dir
+
+    def test_snapshot_is_restored_with_pragmas_applied(self):
+        source_dir = self.create_project("source", migrated=True)
+        assert snapshots.restore_snapshot(source_dir, EXTRA_SQLITE_PARAMS, OPTIONS) is False
+        snapshot_path = snapshots.save_snapshot(source_dir, EXTRA_SQLITE_PARAMS, OPTIONS)
+        assert snapshot_path.name.startswith("django-5.1.3-")
+        assert [path.name for path in snapshot_path.parent.iterdir()] == [snapshot_path.name]
+
+        target_dir = self.create_project("target")
+        assert snapshots.restore_snapshot(target_dir, EXTRA_SQLITE_PARAMS, OPTIONS) is True
+        with contextlib.closing(sqlite3.connect(target_dir / "db.sqlite3")) as connection:
+            assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+            assert connection.execute("SELECT name FROM django_migrations").fetchall() == [("0001_initial",)]
+
+    def test_snapshot_is_keyed_by_packages_params_and_options(self):
+        snapshots.save_snapshot(self.create_project("source", migrated=True), EXTRA_SQLITE_PARAMS, OPTIONS)
+
+        assert snapshots.restore_snapshot(self.create_project("other_params"), None, OPTIONS) is False
+        other_django_dir = self.create_project("other_django", django_version="5.1.4")
+        assert snapshots.restore_snapshot(other_django_dir, EXTRA_SQLITE_PARAMS, OPTIONS) is False
+        other_packages_dir = self.create_project("other_packages", extra_packages=WHITENOISE_PACKAGE)
+        assert snapshots.restore_snapshot(other_packages_dir, EXTRA_SQLITE_PARAMS, OPTIONS) is False
+        for name, options in (("with_apps", {"apps": ["blog"]}), ("with_preset", {"perf_preset": True})):
+            project_dir = self.create_project(name)
+            assert snapshots.restore_snapshot(project_dir, EXTRA_SQLITE_PARAMS, {**OPTIONS, **options}) is False
+
+    def test_unmigrated_database_is_not_saved(self):
+        project_dir = self.create_project("source")
+        sqlite3.connect(project_dir / "db.sqlite3").close()
+        assert snapshots.save_snapshot(project_dir, None, OPTIONS) is None
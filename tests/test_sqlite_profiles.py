@@ -0,0 +1,94 @@
+import contextlib
+import sqlite3
+from unittest import mock
+
+from typer.testing import CliRunner
+
+from dj_beat_drop import main_cli, project_manifest, sqlite_bench, sqlite_profiles, utils
+from dj_beat_drop.new import EXTRA_SQLITE_PARAMS, replace_sqlite_config
+from dj_beat_drop.update import update_project
+from tests.helpers import CONTEXT_4_2, CONTEXT_5_1, ProjectTestCase
+
+GIB = 1024 * sqlite_profiles.MIB
+SETTINGS = "DATABASES = {\n    'default': {\n        'NAME': BASE_DIR / 'db.sqlite3',\n    }\n}\n"
+
+
+class TestSQLiteProfiles(ProjectTestCase):
+    def test_default_profile_is_unchanged(self):
+        assert EXTRA_SQLITE_PARAMS == {
+            "transaction_mode": "IMMEDIATE",
+            "init_command": (
+                "PRAGMA journal_mode = WAL;"
+                "PRAGMA synchronous = NORMAL;"
+                "PRAGMA mmap_size = 134217728;"
+                "PRAGMA journal_size_limit = 27103364;"
+                "PRAGMA cache_size = 2000"
+            ),
+        }
+
+    def test_auto_profile_is_sized_from_ram(self):
+        assert sqlite_profiles.get_auto_pragmas(16 * GIB) == {
+            **sqlite_profiles.SQLITE_PROFILES["default"],
+            "mmap_size": 1024 * sqlite_profiles.MIB,
+            "cache_size": -64 * 1024,
+        }
+        small = sqlite_profiles.get_auto_pragmas(GIB // 4)
+        assert (small["mmap_size"], small["cache_size"]) == (32 * sqlite_profiles.MIB, -2 * 1024)
+        assert sqlite_profiles.get_auto_pragmas(None) == sqlite_profiles.SQLITE_PROFILES["default"]
+
+    def test_unknown_profile(self):
+        with self.assertRaises(ValueError):
+            sqlite_profiles.get_profile_params("fast")
+
+    def test_settings_use_the_profile(self):
+        settings = replace_sqlite_config(SETTINGS, "5.1.3", sqlite_profiles.get_profile_params("low-memory"))
+        assert '"PRAGMA mmap_size = 0;"' in settings
+        assert replace_sqlite_config(SETTINGS, "4.2.16", sqlite_profiles.get_profile_params("low-memory")) == SETTINGS
+
+    def test_profile_is_kept_on_update(self):
+        self.create_project(sqlite_profile="write-heavy")
+
+        assert "PRAGMA+wal_autocheckpoint+%3D+10000" in (self.project_dir / ".env").read_text()
+        manifest = project_manifest.read_project_manifest(self.project_dir)
+        assert manifest["options"]["sqlite_params"] == sqlite_profiles.get_profile_params("write-heavy")
+        assert update_project(self.project_dir, CONTEXT_5_1)["conflicts"] == []
+
+    def test_profile_needs_django_5_1(self):
+        with self.assertRaisesRegex(utils.DjangoVersionError, "'read-heavy' SQLite profile needs Django 5.1"):
+            self.create_project(CONTEXT_4_2, sqlite_profile="read-heavy")
+        assert list(self.root.iterdir()) == []
+
+        with mock.patch("dj_beat_drop.main_cli.handle_new_command") as mock_handle_new_command:
+            result = CliRunner().invoke(
+                main_cli.main_command, ["new", "example", "--django", "4.2", "--sqlite-profile", "read-heavy"]
+            )
+        assert result.exit_code == 2
+        assert "--sqlite-profile" in result.output
+        mock_handle_new_command.assert_not_called()
+
+    def test_bench_runs_against_a_copy(self):
+        database_path = self.root / "db.sqlite3"
+        with contextlib.closing(sqlite3.connect(database_path)) as connection:
+            connection.execute("CREATE TABLE django_migrations (app TEXT, name TEXT)")
+            connection.commit()
+
+        results = sqlite_bench.benchmark_profiles(database_path, ["default", "low-memory"], duration=0.1)
+
+        assert list(results) == ["default", "low-memory"]
+        assert all(result["reads_per_second"] > 0 and result["writes_per_second"] > 0 for result in results.values())
+        with contextlib.closing(sqlite3.connect(database_path)) as connection:
+            tables = connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+        assert tables == [("django_migrations",)]
+
+    def test_bench_raises_errors_from_the_workload(self):
+        database_path = self.root / "db.sqlite3"
+        sqlite_bench.seed(database_path)
+        sqlite_params = {**sqlite_profiles.get_profile_params("default"), "transaction_mode": "SOMETIMES"}
+
+        with self.assertRaisesRegex(sqlite3.OperationalError, "SOMETIMES"):
+            sqlite_bench.run_workload(database_path, sqlite_params, readers=2, writers=1, duration=10)
+
+    def test_bench_never_creates_the_database(self):
+        with self.assertRaises(sqlite3.OperationalError):
+            sqlite_bench.copy_database(self.root / "missing.sqlite3", self.root / "copy.sqlite3")
+        assert (self.root / "missing.sqlite3").exists() is False
@@ -0,0 +1,18 @@
+import subprocess
+import sys
+from pathlib import Path
+from unittest import TestCase
+
+BENCHMARK_SCRIPT = Path(__file__).parent.parent / "scripts" / "benchmark_startup.py"
+# Generous enough for slow CI runners while still catching an eager import of requests or InquirerPy.
+IMPORT_TIME_BUDGET_MS = 150
+
+
+class TestStartup(TestCase):
+    def test_entry_point_import_time(self):
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, str(BENCHMARK_SCRIPT), "--repeat", "3", "--budget-ms", str(IMPORT_TIME_BUDGET_MS)],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stdout + result.stderr
@@ -0,0 +1,111 @@
+import io
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from unittest import TestCase, mock
+
+from benchmarks.pypi_stub import PyPIStub
+from dj_beat_drop import template_fetch, utils
+from dj_beat_drop.new import create_new_project
+
+WHEEL_FILES = {
+    "django/__init__.py": "VERSION = (9, 0, 1)\n",
+    "django/conf/app_template/models.py-tpl": "from django.db import models\n",
+    "django/conf/project_template/manage.py-tpl": "# {{ project_name }} for Django {{ django_version }}\n",
+    "django/conf/project_template/project_name/settings.py-tpl": (
+        "SECRET_KEY = '{{ secret_key }}'\n\nDATABASES = {\n    'default': {}\n}\n"
+    ),
+}
+
+
+def build_wheel(files: dict[str, str]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+class TestTemplateFetch(TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.root = Path(tmp_dir.name)
+        env_patcher = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(self.root / "cache")})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+
+    def serve(self, wheels: dict[str, bytes], hashes: dict[str, str] | None = None) -> PyPIStub:
+        package_index = PyPIStub([], wheels, hashes).__enter__()
+        self.addCleanup(package_index.__exit__)
+        url_patcher = mock.patch("dj_beat_drop.utils.DJANGO_SIMPLE_INDEX_URL", package_index.simple_index_url)
+        url_patcher.start()
+        self.addCleanup(url_patcher.stop)
+        return package_index
+
+    def test_only_the_project_template_is_extracted_and_cached(self):
+        package_index = self.serve({"django-9.0.1-py3-none-any.whl": build_wheel(WHEEL_FILES)})
+        template_dir = template_fetch.fetch_template("9.0.1")
+
+        files = sorted(path.relative_to(template_dir).as_posix() for path in template_dir.rglob("*.*"))
+        assert files == ["manage.py-tpl", "project_name/settings.py-tpl"]
+        assert template_dir.parent == template_fetch.get_template_cache_dir()
+        assert template_fetch.fetch_template("9.0.1") == template_dir
+        assert package_index.requests == ["/simple/django/", "/packages/django-9.0.1-py3-none-any.whl"]
+
+    def test_the_app_template_is_cached_from_the_same_download(self):
+        package_index = self.serve({"django-9.0.1-py3-none-any.whl": build_wheel(WHEEL_FILES)})
+        template_dir = template_fetch.fetch_template("9.0.1")
+        app_template_dir = template_fetch.fetch_template("9.0.1", template_fetch.APP_TEMPLATE)
+
+        assert sorted(path.name for path in app_template_dir.iterdir()) == ["models.py-tpl"]
+        assert app_template_dir != template_dir
+        assert package_index.requests == ["/simple/django/", "/packages/django-9.0.1-py3-none-any.whl"]
+
+    def test_identical_templates_share_a_cache_directory(self):
+        self.serve(
+            {
+                "django-9.0.1-py3-none-any.whl": build_wheel(WHEEL_FILES),
+                "django-9.0.2-py3-none-any.whl": build_wheel({**WHEEL_FILES, "django/__init__.py": ""}),
+            }
+        )
+        template_dirs = template_fetch.fetch_templates(["9.0.1", "9.0.2", "9.0.1"])
+
+        assert list(template_dirs) == ["9.0.1", "9.0.2"]
+        assert template_dirs["9.0.1"] == template_dirs["9.0.2"]
+
+    def test_checksum_mismatch_is_not_cached(self):
+        self.serve({"django-9.0.1-py3-none-any.whl": build_wheel(WHEEL_FILES)}, {"django-9.0.1-py3-none-any.whl": "0"})
+        with self.assertRaisesRegex(Exception, "SHA-256"):
+            template_fetch.fetch_template("9.0.1")
+
+        assert template_fetch.get_cached_template("9.0.1") is None
+        assert list(template_fetch.get_template_cache_dir().iterdir()) == []
+
+    @mock.patch.dict(os.environ, {utils.OFFLINE_ENV_VAR: "1"})
+    def test_offline_without_a_cached_template(self):
+        with self.assertRaises(utils.DjangoVersionError):
+            template_fetch.fetch_template("9.0.1")
+
+    def test_project_is_rendered_from_a_fetched_template(self):
+        self.serve({"django-9.0.1-py3-none-any.whl": build_wheel(WHEEL_FILES)})
+        project_dir = self.root / "example"
+        create_new_project(
+            name="example",
+            use_lts=False,
+            project_dir=project_dir,
+            initialize_uv=False,
+            initialize_env=False,
+            resolver=lambda **kwargs: {
+                "project_name": "config",
+                "django_version": "9.0.1",
+                "docs_version": "9.0",
+                "secret_key": "secret",
+            },
+        )
+
+        assert (project_dir / "manage.py").read_text() == "# config for Django 9.0.1\n"
+        settings = (project_dir / "config" / "settings.py").read_text()
+        assert settings.startswith("SECRET_KEY = 'secret'\n\nDATABASES = {\n    'default': {\n")
+        assert "'transaction_mode': 'IMMEDIATE'" in settings
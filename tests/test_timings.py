@@ -0,0 +1,89 @@
+import asyncio
+import contextlib
+import io
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from dj_beat_drop import timings
+from dj_beat_drop.new import create_new_project
+from tests.helpers import CONTEXT_4_2
+
+
+def resolve_django_4_2(*, use_lts: bool, refresh: bool) -> dict[str, str]:
+    return CONTEXT_4_2
+
+
+class TestTimings(TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.root = Path(tmp_dir.name)
+
+    def test_phases_are_recorded(self):
+        command_timings = timings.Timings()
+        with timings.record(command_timings):
+            create_new_project(
+                name="example",
+                use_lts=True,
+                project_dir=self.root / "example",
+                initialize_uv=False,
+                initialize_env=True,
+                resolver=resolve_django_4_2,
+            )
+            with timings.phase("download") as download_phase:
+                download_phase.bytes_transferred = 1024
+
+        json_path = self.root / "timings.json"
+        command_timings.write_json(json_path)
+        data = json.loads(json_path.read_text())
+        assert [phase["name"] for phase in data["phases"]] == ["resolve release", "render", "download"]
+        assert data["phases"][-1]["bytes"] == 1024
+        assert data["total_seconds"] >= sum(phase["seconds"] for phase in data["phases"])
+
+    def test_nested_phases_are_marked(self):
+        command_timings = timings.Timings()
+
+        async def render():
+            with timings.phase("render"):
+                await asyncio.to_thread(fetch_template)
+
+        def fetch_template():
+            with timings.phase("template fetch"):
+                pass
+
+        with timings.record(command_timings):
+            lock_phase = timings.phase("uv lock").start()
+            asyncio.run(render())
+            lock_phase.stop()
+            with timings.phase("migrate"):
+                pass
+
+        phases = [
+            (phase["name"], phase["parent"], phase["concurrent"]) for phase in command_timings.to_dict()["phases"]
+        ]
+        assert phases == [
+            ("uv lock", None, True),
+            ("render", None, True),
+            ("template fetch", "render", False),
+            ("migrate", None, False),
+        ]
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            command_timings.print_table()
+        assert "\nuv lock *  " in output.getvalue()
+        assert "\n  template fetch  " in output.getvalue()
+        assert output.getvalue().endswith("so the phases add up to more than the total.\n")
+
+    def test_phases_of_a_failed_step_are_left_out(self):
+        command_timings = timings.Timings()
+        with timings.record(command_timings), self.assertRaises(OSError), timings.phase("uv sync"):
+            timings.phase("migrate").start()
+            raise OSError
+        assert [phase["name"] for phase in command_timings.to_dict()["phases"]] == ["uv sync"]
+
+    def test_phases_are_ignored_without_a_recorder(self):
+        with timings.phase("render") as render_phase:
+            pass
+        assert render_phase.timings is None
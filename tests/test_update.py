@@ -0,0 +1,91 @@
+import json
+from unittest import mock
+
+from dj_beat_drop import project_manifest
+from dj_beat_drop.update import handle_update, update_project
+from tests.helpers import CONTEXT_4_2, CONTEXT_5_1, ProjectTestCase
+
+
+class TestUpdate(ProjectTestCase):
+    def test_only_changed_files_are_touched(self):
+        self.create_project(CONTEXT_4_2, initialize_env=False)
+        urls_path = self.project_dir / "config" / "urls.py"
+        urls_path.write_text(urls_path.read_text() + "\n# Added by hand\n")
+        manage_mtime = (self.project_dir / "manage.py").stat().st_mtime_ns
+
+        results = update_project(self.project_dir, CONTEXT_5_1)
+
+        assert results == {
+            "updated": ["config/asgi.py", "config/settings.py", "config/wsgi.py"],
+            "added": [],
+            "removed": [],
+            "conflicts": ["config/urls.py"],
+            "unchanged": ["config/__init__.py", "config/log_handlers.py", "manage.py"],
+        }
+        assert (self.project_dir / "manage.py").stat().st_mtime_ns == manage_mtime
+        settings = (self.project_dir / "config" / "settings.py").read_text()
+        assert "SECRET_KEY = 'secret'" in settings
+        assert "/en/5.1/" in settings and "'transaction_mode': 'IMMEDIATE'" in settings
+        assert urls_path.read_text().endswith("# Added by hand\n")
+        assert "/en/4.2/" in urls_path.with_name("urls.py.base").read_text()
+        assert "/en/5.1/" in urls_path.with_name("urls.py.new").read_text()
+
+        manifest = project_manifest.read_project_manifest(self.project_dir)
+        assert manifest["context"]["django_version"] == "5.1.3"
+        assert update_project(self.project_dir, CONTEXT_5_1)["unchanged"] == [
+            "config/__init__.py",
+            "config/asgi.py",
+            "config/log_handlers.py",
+            "config/settings.py",
+            "config/urls.py",
+            "config/wsgi.py",
+            "manage.py",
+        ]
+
+    def test_manifest_keeps_the_secret_key_out_with_environs(self):
+        self.create_project(CONTEXT_4_2, initialize_env=True)
+        manifest = json.loads((self.project_dir / project_manifest.MANIFEST_FILE_NAME).read_text())
+
+        assert manifest["options"]["initialize_env"] is True
+        assert "secret_key" not in manifest["context"]
+        assert update_project(self.project_dir, CONTEXT_5_1)["updated"] == [
+            ".env",
+            "config/asgi.py",
+            "config/settings.py",
+            "config/urls.py",
+            "config/wsgi.py",
+        ]
+        assert 'SECRET_KEY = env.str("SECRET_KEY")' in (self.project_dir / "config" / "settings.py").read_text()
+        assert "?transaction_mode=IMMEDIATE" in (self.project_dir / ".env").read_text()
+
+    def test_env_file_is_updated_unless_edited(self):
+        self.create_project(CONTEXT_4_2, initialize_env=True)
+        env_path = self.project_dir / ".env"
+        assert "transaction_mode" not in env_path.read_text()
+        env_path.write_text(env_path.read_text() + "EMAIL_URL=smtp://localhost\n")
+
+        assert update_project(self.project_dir, CONTEXT_5_1)["conflicts"] == [".env"]
+        assert env_path.read_text().endswith("EMAIL_URL=smtp://localhost\n")
+        new_env = env_path.with_name(".env.new").read_text()
+        assert "?transaction_mode=IMMEDIATE" in new_env
+        assert 'SECRET_KEY="secret"' in new_env
+        assert ".env" not in project_manifest.read_project_manifest(self.project_dir)["files"]
+
+    def test_failed_template_fetch_is_reported(self):
+        self.create_project(CONTEXT_4_2, initialize_env=False)
+        settings_path = self.project_dir / "config" / "settings.py"
+        settings = settings_path.read_text()
+        with (
+            mock.patch("dj_beat_drop.utils.get_template_context", return_value={**CONTEXT_5_1, "docs_version": "9.9"}),
+            mock.patch("dj_beat_drop.template_fetch.fetch_template", side_effect=Exception("Failed to download")),
+            mock.patch("dj_beat_drop.update.color.red") as mock_red,
+        ):
+            assert handle_update(self.project_dir, use_lts=False) is False
+
+        mock_red.assert_called_once_with("Failed to download")
+        assert settings_path.read_text() == settings
+
+    def test_project_without_a_manifest(self):
+        self.project_dir.mkdir()
+        with self.assertRaises(project_manifest.ProjectManifestError):
+            update_project(self.project_dir, CONTEXT_5_1)
@@ -0,0 +1,58 @@
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from dj_beat_drop import cache, main_cli
+
+
+class TestVersionCheck(TestCase):
+    def setUp(self):
+        self.cache_home = tempfile.TemporaryDirectory()
+        env_patcher = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": self.cache_home.name})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        self.addCleanup(self.cache_home.cleanup)
+
+        session_patcher = mock.patch("dj_beat_drop.utils.get_session")
+        self.mock_get = session_patcher.start().return_value.get
+        self.addCleanup(session_patcher.stop)
+
+    def test_check_runs_at_most_once_a_day(self):
+        self.mock_get.return_value.json.return_value = {"info": {"version": "99.0.0"}}
+        assert main_cli.check_version() == "99.0.0"
+        assert main_cli.check_version() == "99.0.0"
+        assert self.mock_get.call_count == 1
+
+    def test_failed_check_runs_at_most_once_a_day(self):
+        self.mock_get.side_effect = OSError("Network is unreachable")
+        with self.assertRaises(OSError):
+            main_cli.check_version()
+        assert main_cli.check_version() is None
+        assert self.mock_get.call_count == 1
+
+    def test_failed_check_keeps_the_last_known_version(self):
+        cache.write_entry(main_cli.VERSION_CHECK_CACHE_KEY, {"latest_version": "98.0.0"})
+        entry = cache.read_entry(main_cli.VERSION_CHECK_CACHE_KEY)
+        with mock.patch("dj_beat_drop.cache.read_entry", return_value={**entry, "fetched_at": 0}):
+            self.mock_get.side_effect = OSError("Network is unreachable")
+            with self.assertRaises(OSError):
+                main_cli.check_version()
+        assert main_cli.check_version() == "98.0.0"
+        assert self.mock_get.call_count == 1
+
+    @mock.patch("dj_beat_drop.main_cli.print_update_notice")
+    def test_unreachable_pypi_is_ignored(self, mock_notice):
+        self.mock_get.side_effect = OSError("Network is unreachable")
+        version_check = main_cli.VersionCheck(daemon=True)
+        version_check.start()
+        version_check.report(timeout=5)
+        mock_notice.assert_not_called()
+        assert cache.read_entry(main_cli.VERSION_CHECK_CACHE_KEY)["data"] == {"latest_version": None}
+
+    @mock.patch("dj_beat_drop.main_cli.print_update_notice")
+    def test_notice_is_printed_when_check_finishes_in_time(self, mock_notice):
+        self.mock_get.return_value.json.return_value = {"info": {"version": "99.0.0"}}
+        version_check = main_cli.VersionCheck(daemon=True)
+        version_check.start()
+        version_check.report(timeout=5)
+        mock_notice.assert_called_once_with("99.0.0")
@@ -0,0 +1,45 @@
+from unittest import TestCase, mock
+
+from dj_beat_drop import utils, uv_project
+
+# Deliberately out of version order, the way versions come back from an unsorted cache or mirror.
+RELEASES = ["5.1.3", "4.2.16", "4.2", "6.0", "5.2.1", "4.2.9", "5.1.10", "5.1.9", "5.2", "6.1a1", "6.0.2", "5.1"]
+
+
+class TestVersionIndex(TestCase):
+    def setUp(self):
+        self.index = utils.VersionIndex(RELEASES)
+
+    def test_latest_skips_pre_releases(self):
+        assert self.index.latest() == "6.0.2"
+
+    def test_latest_lts_is_the_newest_x_2_release(self):
+        assert self.index.latest_lts() == "5.2.1"
+        assert utils.VersionIndex(["4.2.16", "5.0.9", "5.1.3"]).latest_lts() == "4.2.16"
+        assert utils.VersionIndex(["5.1.3", "5.2", "5.2.2"]).latest_lts() == "5.2.2"
+
+    def test_latest_patch_compares_versions_numerically(self):
+        assert self.index.latest_patch(5, 1) == "5.1.10"
+        assert self.index.latest_patch(4, 2) == "4.2.16"
+        assert self.index.latest_patch(5, 0) is None
+
+    def test_resolve(self):
+        assert self.index.resolve("4.2") == "4.2.16"
+        assert self.index.resolve("5.1.9") == "5.1.9"
+        assert self.index.resolve("6.0.0") == "6.0"
+        for version_spec in ["5.0", "5.1.4", "6.1a1", "latest"]:
+            with self.subTest(version_spec=version_spec), self.assertRaises(utils.DjangoVersionError):
+                self.index.resolve(version_spec)
+
+    @mock.patch("dj_beat_drop.utils.get_django_releases", return_value={"latest": "6.0.2", "releases": RELEASES})
+    def test_template_context(self, mock_get_django_releases):
+        assert utils.get_template_context(use_lts=False)["django_version"] == "6.0.2"
+        assert utils.get_template_context(use_lts=True)["django_version"] == "5.2.1"
+        context = utils.get_template_context(use_lts=False, django_version="5.1")
+        assert (context["django_version"], context["docs_version"]) == ("5.1.10", "5.1")
+
+    def test_pinned_dependencies(self):
+        context = {"django_version": "5.1.3", "docs_version": "5.1"}
+        assert uv_project.get_dependencies(context, False) == ["django~=5.1"]
+        assert uv_project.get_dependencies(context, False, "5.1") == ["django~=5.1.3"]
+        assert uv_project.get_dependencies(context, False, "5.1.3") == ["django==5.1.3"]